@@ -1,17 +1,34 @@
 import gradio as gr
+import hashlib
 import numpy as np
-import plotly.graph_objects as go
-import asyncio
+import os
+import time
+from fastapi import FastAPI
+from fastapi.staticfiles import StaticFiles
+from batch import run_scenarios
+from cache import ResultCache, restore_order, scenario_key, snap_to_step
+from cohort import INTERVIEW_RATIO, MAX_CANDIDATES, MAX_INTERVIEW_SEATS, simulate_cohort
+from metrics import Metrics
+from scheduler import LatestWinsScheduler
+from simulation import EXAM_CONFIG, SIMULATION_MODE, SimulationCancelled, build_opponents, check_scenario, estimate
+from workers import PoolSaturated, SimulationPool
 
-# Base64字符串占位符
-base64_background_url = 'data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDAAMCAgMCAgMDAwMEAwMEBQgFBQQEBQoHBwYIDAoMDAsKCwsNDhIQDQ4RDgsLEBYQERMUFRUVDA8XGBYUGBIUFRT/2wBDAQMEBAUEBQkFBQkUDQsNFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBT/wAARCALQAtADASIAAhEBAxEB/8QAHQAAAQUBAQEBAAAAAAAAAAAAAAIDBAUGBwEICf/EAFgQAAIBAwEEBQYICAoHCAIDAQACAwQFEgYBEyIyBzFBQlIUIzM0YnIRFSQ1U3GCkiE3Q3aisrPCFiVEY3N1tNLi8BcmJ0VUdJMIUVVhZIOEozZGZqTyw//EABoBAAMBAQEBAAAAAAAAAAAAAAACAwQBBQb/xAAgEQEBAQEBAAMBAQEBAQAAAAAAAhIBAxMiMhEEQiMz/9oADAMBAAIRAxEAPwD7Q6FPxP6F/N+3/sVNqYzoTT/Y/oX837f+xU2ZfKfayWAAN+Uv0QAAM6BodEj5R6AADjoA829QkAAAAAAAAGZBIqQSTowOe6h+cpToXdY57qH5ylKzIRabmJCcpHpuYkl0ukgAAQyAABwAAAJAAAEFfd/VXLAr7v6q4EVdl5Jiv2/O5YWTllIOxM7ttAL6T1SQydH86qa6RPk8hkaJf42FDZUwpuvaFInmQ2oC808A9xPAPRAAAOgAIN2qlpbbV1G3h3cbNkJ08zpD05P8V6JvOoGXynfVUjR8WOUcfCv6rDOjqKGn07SyLHjVVGU1R7TBfKBaDovsdto1ZaqsVWkX+k4m/SLikiWCFY0XFVXEh5tl1/55K29QkVt6hJdhvuQACdo5ZKAAGklATIuYoAqnFHffNWuaReZVyX7LG401K09jpZu7IuRmamBZ4WjdclYkdG1fJPY5oXbihqGjx8J5/v8Aanr/AOavq14kAMT0QIAWAIAAOd+ztFgAC/lx6vaPL1bRle0eXq2nKoFnPNVW2s0rqKjvlmXz1wkWjmpPybLxcXvcx0JeMpdZJuqW31Hdp6yORif6Iej6SbLF8Mdxae0VS80dwh3a/Zk5WUmJr3T3cu1M3/uG0u0UM9tl3sMc/wDSLkcpr75pnTVU/lFPTSzd2mgjVpG91RpkLZeka11WPkcdTXf8tDkN1Wtblw+RWWfd+Kr82pDpr5q7VEO1bFZU0vQt/vCfikx9lf8AER6bocp55vKL9dq6+Tc3nJMY/ulgz9V0j37d7utvNjoZvo4m3zfuiaCsk1AqrW6kv0sfht9DIsf+JTplDpew2mGOOlttNR7vlaKPiLKilp2k3KQricny0Sqy57pDSWjL3dJ6GnttynkjXKSprsv3ih6Qv+xnZ7pTtNo1ls9ZxZU0/FTN/N+y33juUzQ25csVViQryMuUg3f82hP+z43wzZqPV3/Z8v063u1y/FtQuM2K8LM3eVjvlivMN9oUrKWo38Mi906dqa20d7tslDW06TwycyyrkfPuotJXToeqvjbTqyNpuT1y3rxbv2lPPr/LXm3eP+75PrTpCAV9ku9LfrfHWUcyyxyfolgJnLd2iwA9VDhdBe0F7R5EBObac0U0V14s0N7tdbQ1C+bqI2jLrH6hO1Dp2R0BVSUtK9pqvTUfm1lbmaPumz7pC20UflSybI1y8RKXtBzQ2ngsAGmu6FE/2P6F/N+3/wBnU15kOhT8Tuhfzft/9njNefTfl8TRYAAOEAADEAheraLEL1bQcokAAHAAAAAAAAA3aAN2gEdu0AbtAUxO0wOoPnKQ6A3ac/1D85SjzIQ6bmHyNB2j2ZfKRZ5t6j0AIZAAA4AAAEgAAHi9W0rbv6q5ZL1bStvXqTgRU2PlnIrfOu0mWLlnIbfOu0UL6X1dvdMnR/OhrJvVZPdMnQfObh0NpD6MSvaKh9GJXtBeTjdoyvVtHnbrGV6toKEgAAAUOtODTtTGvpJmWNfeZi+Ku7U/lt2stK3L5RHM3uqS60Qtr1UUsVZQ0crecjh3a/ZUZVCj1k3+t9r/APe/Zl0ji+ZregAFGTtEAADugAAZP8gAAXrpt3IukJYbdqa6UKtj5Uq1Ua+13v3SVInCULP5HrS01X0nmTD6vQ8KdKAAMr15/IFiBYjgAAEIAABzvV7R5eraR8sASqU7kyUvaVOsk3unaj+b8590sIqgLlT/ABja6iFWxaRcSYQYLzqjW9GtHQq1gtLQrjP+UbhxZoy2010cWPS6yTQU8lZcJMd5W10m8kYb0FqOOv0fQ8XnIcoWXwso9cLy27ZUXEHMrCrnWCPIpZrvI3slfJWSSrizEX4PaHHZTJa2SXmNtYLN5BStNJ6Qy+lrQ1xuEbOvmY2yY2lwRqxvJYuFTRDD73mcodNTtcquWol4o14VUsJFwhZvCSKenWCFY17pDu07QU5umXlSz9ZK0rMxg+lTWraE0rUV0EKVNwmbyWlppVyWSRu6bbe5HG7rLJq/pHeoVm8hseMdOq96Zst43+H2iXv9Zbv8U69HP+iy+XrTV2WG40dXTUNY2TK0PCsjcXCv2jum3m4StvVjjvdpqaWVeJlyVvCxU6I1hHcd7aa9ZKa8UvDJBPw5e0p88+n/AC1C9o8qcQ0PE6cKAAOgALACf02qDiL1ikQeWI7Mum8QxJCoJZCskaLoS/E7oX837f8A2eM2Jj+hT8Tuhfzft/8AZ4zYHvU+PLAAFyCAAChAAAAJADzMYpIBmAA6AAdmXe0aBu0WIbtOOG9o2G2oVOYb2VsPeYUxW0wN/wDnBzcPW0+PpDB3yoWesbEAi0w8NwpwjholIsAAYhkAADgAAX8pdJAAGNIKq+equWpVXr1RwOr9PL5mUrf97FlYeScrf97ARoKj1SX3TJ235yc1lR6pL7pk7V85bfeANonKeD6cojuiqzRgAbtAFgAAABF0p8vrJrxzQrI0NO3ix5m/VIuoq9aWjjhyZZqqRYVVeZhWpr42iNP2uw0sKz3aoVY4/OY8TflPs8Rlum3/ADTqmP1NfpNQa8pY6CHGOhqmhbi5slN0i9Zg+jC2/gnk4npaVVhhkbmkb8ox0EPOh/q+v1JAANTzQAAMAAAAAEuqoGpY422srbxcuEi4gYnby7TP6gp23dLMvDJHUKyt4TRbU4dpT6gp2az1aovFzGb1nTT403UD72GNvEuQordIVDV+mbfI3Nu8WbxFskR53Xr+d6kYhiKx+oMfqM3TvAACsmkHjcu09Gqn0W06dFqp8CH5fgN1ErcRBZmcFplbQXlVbjXH2i2pKqNl28XCZVEyL62xYRkaoVKj0xWLbtRXu2tUZLJjVQrjivFll+6W09RvWMzrRGsN4tuoolyp4fk9VEv0bd4vF5toomSllE1Uu6haTwikRhmmolv2qrfa958nh+VVn9GpTz+xfWsy6Rpig+LrPHiuLVC777TcxfQRLEvtd4ZbmXFcVXhVR5eraer4+b5719dVospNRTqkax94uzLak9a4TUhpl9UXSGzafrayVsd2uSmJ0JRbqwxzOuM1QzTSe8xM6XrluNNrS45eWSLCzZcuROslO1La6eF+ZVMP+i9Tl6v+Hz+2kpUwUy+qtFU+oJIaqKSS2XKnbzdXScMnumuGcDwKe92mDg1RqLSqrDfqOO522PmuFMuMi+8prrTfKG90++oKqKpj72LcS+8Smp8lxYxOpujRbpcGu1mqpLLeu7PByt7ynHW8XtPTGUGtai03qGy6lpVt9RIuMdyy+TVDd33cjaL2gCkXrFIgqNOscResEhH2ji9o2vAPRN1lgkeT+ZyGW4SZQcbPG3eGaiBopmUbKVUtuhb8T+g/zft/9njNice6HNTbroj0Ku8y/wBX7f8A2dTXNqj2j3nyjbAYFtTVGXC3CMzamquHiAOgbaqNeZhmS5U6flDnrXyqb8oR3uVZLyyAR0j42p/pCO9+pU7xzvZPcpeUS0VwbmYA3zagpfER21NT+IxqUdU3w5LkK+K6jwgGsbVFP+HiIrarVPhxkxM+tmqPwjyWOo8IBcbdW9fnhmTVbfSEFbDN+HhJC2Gb8PCVkn5Jk1NUNysNvqOqJS6emHI9PSfhyUculS18qm7zDcl0rG5TQLYWT8mo4trZV5VEDIvVVkq4uMpzbci+uMG6bLEqWTiA3aJXtHBSpgG3qK5Lp6AABDIAApwAACRIAAxtAqL96qW5UX71UD9QbFyykD/eZPsno3IP8vAi6qPV390ytq+cnNVUerv7pl7V85P7wHbJe0kL2kde0kL2inNso38HtCrhWQ0FHJUTyKsca5cRk4df1FfMq22w1ldG35deFSVemWufOq/LVYhiU941NNYY0krrXVLDIuTSKuWIWfVFrva/I66KVu9Fl5xfskvmUnwpIs1O176QMlj3sNrj3ir/ADnd/VOc68vLXm9XG7UuUuM3kNDFl3pOZl+6dWoKL4p6P5q6VcpK7eVjN3se6px/SlFI2orXTy8K0u8rJvZky4f3iFVpu8PPP2dK0pYV0/pu329WV9zHizL3m736WRZMuIpHFbeI1eUvN/01r0MAe7RBpZgAADmQebGbunoAMvNsrPzMKXtPTxUB14MVKZwye6SRJC/yt5fVJ6MJc9KpC/pKeRo2+8xqNiYGV6OPm+6x48tY36uRrl5Np5j0/P8AJAHjde08Fyrp5gGA5l9QZfULk2jeBHnTex4k4Tj9QZG1DNQSEX4rkyNNJF7I3uPZOrz6qWC0Tfh4S2pqVqeHFiQqYD21MyeR30U92tsd0t81LKuUci4sZXRFVM9vmt9bk12tsm5qG8Uf5Nvum82oYvU1F8TagpdQRL5tvk9cq96PxC5NN6Xi9pM6KolrblqG5MuTbxaVW9lVXEi11RDQUtRUSSebVco/aUtugtM9A0tQ3HJUSSSfZyNPjKH+rufN0BU4T0APW83gAyV3bKsc1UjYKY2t46yQo5lyHp1r4bdJZaedvNyVSye9iaymqo56WGaLijkXIxPTpRQ1+rNG0s65RzTSKy/ZKmxXSbo/vnxDXyM1nkk+S1bcsfhjZu6fP/6r+2X0v+Kcy6gziRYGDtN73Ff+8MT0A0FdfLHR36jalro97C36Jk7Bfq7Sd2hsN7qlno5mxt9dJzf0cjeLlN6UWqNL0+qrPPb6pfNycrd5W8SnDNIvaPRdpgejbUdRUR1tjuLZXK04xyNy7yPHLefpG8ilUcp082noGiQftkuVYqllcIss5PCZG/V8lmhhrEbFY5OJjZJ52NW5slyBltjehfT2XRHoVt3zaft/7FTZ/wAHPZIHQlFl0O6F/N+3/sVNpge2+V7WWa/g57Ifwc9k0eP1Bj9QFUseno0X8OIpLDHlt5S6wDAf+pVSvSzR4ivieMtFThDacCvitap8PCOeRRovKPb72QaXr4QBnyeLwgkSryqLAcEihIoASKEgOCiNJ2jhHcDTLP3nl2+8U7KWl47feK9e0C9eAADEAAAAgG7QBu0Dm9p4e7TwBkAACpAqL/6ptLcqL/6ptAK+zejlK1PnL7RZWb0cpWp85faGDRVHqr+6Ze1fOLmoqPVX90zFq+cn94FZa2LtJEXLtGY36xxCXWhmdeRb34n3rfxf5YvlS+Je6v3sTbJLmxldcWGbUVhkpYGVJFZZFy8SirZq2ngtOya7Tbiuj83JF7S8xh9ae1/m+vm0lyr6egts01VjuVXiVu8ZO29H8fSB8urLalqoZOKGRfN1Le0F01Db9aadmobZVRyV1R6OmbzbN97E6xp75pp4/CQmj9ZefozjtOnbjS0dwqq6SoVV+Vtly5cv+fCcz0Ei1lZdq5laKRpljkglXFo2VeU+hmQwPSVpSSKom1JaafKoVfl1MvDvo/EvtL+8VkuvqqWbwikbrIdsuNPcaVZoGXd/qhdLzQ2Sn31fULAvd/nPdNM086vPSYJx+oy9Lqu7XuoVbNp2WeOT0ctybcxsXGzQup7iqyV14itkjc0dJDlj9pg+Qs+Swx+oMfqIsXRTN+He6irp/sqpM/0dx08eT3Sskx9oPmV+Ag9VMydQaKpWjWSKqnlX2mN1YNBx1VPskZVxD5kq8sufwU+Qp4vZOsQaAo8eJTN6qsdDYcVTfzzSZYxRR5DfKTLC7YiPLKsEeTyKq+0PSy11bJuaW0ywSeKpZV/eLS0aNaqrFqrzupceWBeUXt6VmUPoyi3sN9/5r901mxMCr0FTrFcNUxxLwrWMXzxNltMfWyfqg4CsB5lE4/UA7RvAMBzH6gx+oMmN4BgOY/UGP1DgnETuVJGAYCDRnEMR7AMBcjSOyEOroo6yllp5VyjkXFiyZRlkDsqzTnOpYqrT+na+01C5Qwws1DK3NJH4TrXRhSw0fR/YY4lx+SqZ+9WuG80fk865L3W8JqNFReQWWlt68S064q/slYT9/wD0nK/AwmqOmfTtkmko6Bqm+XSPhakpI/Rt4WblM22sukW9rj8U27TkLfSN5RJ9peE0/Llgnydcl5dpiamX5ZL7xi6qx6/ukckc+t3gjb8lTUqxr90i02h9ZwR4prmdvep1F+VWfJnem7zWqNF1X0dY0eP/ALeX7pYX2w0OrbTPQ18OStxRyrzQt4lIutND67u1PGrTUN8WlbyqHex7udmX73iI9FryO2zLS3y011jqMscpVWaHL+kXhPI9/tT3P805lV2DVFw0Rel0xqXLyVmxt93l9HJ/NyN3WOjRVGZX3qw23V9jmo52grKeZeFomyx8LGDs15quje4LZ9QSTy2+RsaO4bvhXwrJxcK+0ZG11ROU8EIOnKSI29Qlu0Vt6hI0hjdcWuqimp9SW2NmuVvbiVeHeRtzK3iU2ViuUd5t8VZAytHIqsuLCcfqMzoR105qa7WF+GGok8spftcy/eGDeL2htHsAwKy52mX6RkZ9D3fHmWHI3WnKj4xsNtqGXFpKWOTHw5KZnVFL5Vpu5x82VOxYdFVV5Z0f2WZ/TLDu2bxYjoVOlt0Jfif0L/UNCv8A9KmydDG9Cn4ndCfm/b/2Km0c9t8d1HAG7QELoAAFJAzDMAOggAA7oAAAYEgADgAAACCO5II7gpLO3Tm+0VxY3TmcrgSs0DdoperaejFkAAACAbtAG7QOb2nh7tPAAAAFSBUX/wBU2luVF/8AVNoBCsnopSsj+cmLOyeilKyP5yYAvqj1d/dMvavnJ/eNRUerv7plbV85OMrNNgjdY53hsdIdXmlNq64tRWd44Fyrqhlhp/ebvG26MtFUOnLO7badZ5pm3jST8TMxznXybrZZ6xvQ0tdHJJ95TrGmKhVklVvyhjt6/hX/AJoevuj226xp1kenjo7lC28p7hTLjNHJ3WyMf0eawrLDcK/TupW/jajVZIZe7VQ+JW7zHXnThOd9K2gpNQWuG5W6TcXi1yb6lk9rwkhVuhJLmOGD6NNa0+rbTHIjfKoVVaiD6NjfYDyRxvXWl5NEXBb5QQs9jkb+MKaPmj/nFHtGaAsNYq3qvrP4R3Cbi8plb0bd1VXu/wCE61PSR1ULQyqssbLiyt3jjNfRTdD2omaVpJ9H3BuHH+Ryf3eIfR/03i8DYjkfaNp3R5eraJ02cvTzamYlwQQKvo00zVWm8V9pxVrbvPKIW8OXEy/eO6UtKsEKqnKZnR1twh3zrzGokl3ULyeEdClbqCv+LqFsfSNwqYWqlknbJ2yYmXS5SV9VKztw91Srd8h05kyzN3gE5fUJ2visjNyqoLyj9GFPlDf5m5pq5jSVNKVvRlF/qrDM3NUTSTfZZmNNPFnHtXEQ39Zlk4mE4k6an4m8RFw4gcM4BuiQsQrEd3SLgGA9ug3QGNAe4hiIHgCj2KJm5QIQLjpWn5SVTWuaf4fCZnpK17N0fU8drsO7uGrKzhp4F/I5csjCOyrekjX9n6NY1hr5vKbtJHvKe203FNIv7pi6HQ+pOkCOObV9dPbLey7yO20zbvib8nI3eXhLbo66J/iGsqb7qKZr1qSqZZJKmp4tz7K/57p0RkF0qg2LTNp0/CsNBQx0yr4VLhkyI6D2WYVRK+pvASg6eYk9FmwvaM1lmo7tC0dVTxyq3iUkLwCo+0TsaafO6lzm8dCq21vLtHVU9ouTNlJEsmUMn/tlT8aUdxmm03rKj+L6huHz/DSTeGRW/dO0U8TS/DjwidQaDh1Ra5KGvhWWGTxLyk++X9ap/wBMvnGdL50PXCNZVqr1pGRvS+kko18XtKdKoK+lulLHVUdQtVTyLksqkGC11mi6x7De5pbha5OGGWr84uPhYzdw0RdtFzNcNINJLb/5RYsclaTvbvwkKnK01puQKDRmtbfrSlmalbdVlO27qqGXhkhb2lL5XOLPTJaybyDVWl7gvDlUeSyfa5f1TWmS6UKWSXTtPVJ6ShrKeq+6w8ldFARC29hVvZFjE6YrYt7Q1Me38ouJlegm9qmnaOzsuLeUVGMuX843CayqTOFlOU6Glag03PcFbHyO5TN9neMGh+nauhT8TuhPzft/7FTbbeoxPQp+J3Qn5v2/9ipttvUe8+MMAB6vaIk8AWkXDtFbpTv5BoB3dBtiF0EcAANAgAAvNAkAAqAAAAAxOnCPjU/KCrK3TmYrixunMxXAz9ACBS9W0YPQAABAAAHIAAAnaAAApQVF+9XLbIp783ycaZCFZPRSlZH85MWdk9FKVkfzkwKyvqz1RvdMtZ/nKT3jU1nqje6ZW0PhcJRe0aWsVxxG9kq9LWPU2uVa4UtdFaLLM3yeXcrIzY8Lc3tKKuiXzSEmV7p/LLf/AOIUnF95e6Za9GrCPri2yXbS9bDB6RcZPexK+g1/WWtrTdpcpbHWRrTyYrw08y95m9r3TVQyx1UKyRMssMi8LL3lOO6wTKhm0a3FH8YLUbv/ANOZuvX8J+r6qtFx8vpVbLLwsTsO63KcT6C9dNFVVGlrs38YUceUM+XpoV4fvLwr907UkuYiVxlyHX2nqjo/vEOrbMvyOTzN0po14mX6ZfaXi4TpGktRw6js8NVBIsqsvMpaVVLHWU8kM0ayxsuLKxxG2NUdDOrJbbPvG0rcpmaGf/h5m7rey37o80l2ndyNeLbDebXUUNRGstPMuMit4RVJULPGrKTFThUb9Dn1cJ2S1XQ9VR0txmkn0vI2MMrL5yj972faOiUk8dVCs0EiywyLkrL3i61Ja47tStTzqrQsuLKy5HIcK7oeuG7feVOj5G+1Q+17ovV9Oki4ImlkWNeZiPRVlPcaeOalkWeFlyVlLaxQb25Q+8pIvW+sVK1Lb41fmM/0kajk0/bVmWOSWH8s0XdU2C8K7fZMHqaqjr5pqd497Cy7tlGIz9LcYayljmgkWWOTiVvEorZLmYHTyf6Pr02n6yT+KaqRpLfUtyxt3oW/d903iOO7MlN2kWqfKlljXmmXdqStvIXVktEMtHsZ+YFPysLFQR0dpo6dFVVhjWPEsmp+sKZFiXFR7ZxDTKdUpbjSqi7WxKdlNNcIsodvfM/JE0TcR1LRkAABsYCcFFACxvEMT0AORtiJ1ot7TybWG6Wlaqk2qheTSw6as9TXVTebp48mVeZvdAtUz/SBqObRen2rKanasqmZYYaZfykjcpidDaNawyVN6u7eXagrOKaduLdt3ljYvPKpNQXLbdq/JlVmWng5d2vu+IlCFmgzZAAEuqVRYAAhe/Z6vaPjC9o+dlwDsVLJL3RyiiVpOI1VqtuC7ZHUaTo9ote6VZHUvIu0TFFxD2P1FcodrKh1Zpel1Va2papcm/Jt3lY5LQJUUCy0dav8ZUbbmZvEq8rfdO8Y/Ucr6YLG1LJb9TUcfyihk+UKvehZspDDctnj6Ob6w6O6O/VkN0tczWO/Q8S3CD8o384Vdu1ncLRWbLfrGl8hrG4Vro1+TTfaN1Cyti2xs1biUnbbXb79Sy0Nyp456eThZZVyUg9Cb0pchuqTfruxz+CjWH5PTtL5DH6ONmy3K+FQSLAaZPpOo5cIVUlkCkbD4SYsoEN1j408jeyc96NqWOq0rWRuuUc1ZUZf9Q3lwl+Sye6xj+i6LdaRhy700zf/AGMSVl0zoU/E7oT837f+xU223qMT0Kfid0J+b9v/AGKm229R9G+KMHqdZ4BH8pH05T0ZPMg/oOANAAB5t6j0829QA3tPAPcfqLzIeAAFwSAAABArqrCMkVDlHcqpeUDdpU1ku9kGD1uNgxBJ4AgUvVtGD0AAAQAAOcgAAQhIAApSMynvz/Jy4Ke/erjGmUayeilKyP5yYs7J6KUrI/nJgOvqz1RvdMjRtuqiobwqxqrhKtPRszeEydqljqqidVb2SF0v4zqnWOiiVarQ9tZG5Y8f0v8AEaqqp4Z6d4Z41ljkXFlY47oa/SaGuE9nrF/i+uk/i9mbmkbi3bfeOvRzrLGsi8rGTr0Pjcrv2hblpK4VNysTS11rk85UW1m9G3eaPwmX0ZQU+r73etQcPktQy08MfM3Dlk36R385xqTQVVaa6a/ackjgrv5VSStjHUR+yvdZRGnzrLj/AEjNVaVuFruFu81eI6hVpW+kjbmVvs4n0B0daypdX2GlrKZvSR5MvhY5jZqKj1z0hWu5RQywNaadt5TTx8szd1vdx/SFWKVujLpOq6V/N2O9NvofDDUcuP2sf0SX9Xr7O/I2alPqLT1Lqiz1NtrI1aGZfDykylqo6qNZEbJWJURWWGvq5/oa4zaJvDaXvsmUOX8X3JuWoX6P2WVTpiFLqCzUt+t7UtVHllysvMvuhpzyyK1pHXNlMveHGtLioTMra6ijqo2WWNZV8LFgvaJZBBLiNdbazotvEc1HvJ9N1UyrJB/w+XeX2TsHR5UUuoFhuFBMtTRyYsspk+k6zTXTSdTHEzbyPGRcfErZFf0Taop9NQRVm1f4luTb6bdtl5LJw5N/lRF3eLtO0VDOyc2JzmoZnkbI1GpryqQxxpJk0i7z7Jk9r5houVbftPUupbTU0NUq+c4o5fo5O6xmdHXys3lfZ7pxXS3yYt4WjyxVlNskpR6m0t8bbuso5PJrpT8Uc6/qt7I5vytsvqNRYm+RqYewXJq9XhqF3FVHwsrd43VoTCjUC1S0ifHYPkRBze4lUSpkKu4U/m8idVSqsbM3CYPUmt6W1s0Lzb+o7sEXMwlVl2ZW4GA2WPVWr93JUVnxLS/QUnpPtSEpehJXVcr9dX/+QxLR/jbJyOs+ZkW6FWiXzWoLrF/8hjUeStAuxW5lDSn5Sl7RyOLLlI8faX1ioGlymZeEsXqwtFAtFDk2OTGR1VW/Hd08nZm8hpW4Y1/KSeL7PEbC9VC09vkXlyMW6r4QIbQAATtAsAAkYAB6vaICkQlQRb0ZXq2l5ZIFaReEqnSys1oWnXZI6/ZLhBtIsByJALpKiTrFYiUQViOUYlbdqCO40dRTyrnHNG0bfaLMYbiIVKk3lwG1xSU611HOvyqjqGh95e6TknwJmvqL4p17CyLjDXRtj7Ui8v6LMVOzvmbv1en4/ZprVXxzrtjl4vCxi9dUV001eNl2p42udlZcZoI2yaNvFH9J+iWlPUbqTI1lNLT3u27aeRVbhxZWBRg7dWw19LHVU8iywycrE7MzN4tbdHWqKengbGw3JsVX6Oq/xfumiil9kRWa0TcvVZvFixW6UtDWnT9NSvxSc33iddKyGgoZKyobdU8fpG8KlToCsqL3T1F4qYXWjqmbyNW4co/F7372JJob7oU/E7oP837f+xU2Ehj+hT8Tug/zft/7FTXbT6H/AJfCdeAAEygAAAD1e0cgTLFSwWiXHaOdBwGXQkSpg2JE7w7nS8RvMcz4Rs7NFIAAKSAADFVLiuQBX3Os8nVvEZuSXetxEi4VTTzP4SEOTrzaegJGAAAAAAAAZFiBY2snIAAFBIAAAFNffQbS5Ka++g2gEWxckhWxfOTFlYuSQr4vnJhekPayrPILHJUY7zdrljkV9u6PbpPTx1VxvVTR3CaNZGipI1jjj+yTNTRSSw0eC/yqM2SoYfWnsf5PKc6Yu5Wiu8hko7xD8YUv5OpgXzi+0X2gNayfGFXp65yZXCl5ZMvSR91i2lQ5zcp5tVNNWWzzGrLLlJ5JvOFv7yspm+R6FTp3pBWBjejLWUOtNNw1yNjMuUc0H0bL3TaKg0/Zmz9mL1V0bSXSq+OrFUeQ6kj5Z+7Mv0bHPdcV9Pq+x11jvCrp7UlL56nWr82ski8sit72R3yJusg6k0ta9WUPkt2o46yNeXeryjdk0+mWL6KtWtqqw0tdLwzMu7mi+jkXmOjRJ1nN9FaFXRt2uq02MVLWTLNHTRcsPNwqdGjbBQLda+yvu1+htNZR08q4+VNu45W5cvaLCJOviKHUEUOo6Gutv5bd8Le13Rvo6vLXTTsMc7ZVVKzQze8o6DVL2np4vaegaVddKVp6GRV5v8JzXo23MVPe9Oy8UdDVcUf822WP6rHVqn0LHJdqfEnSbTzJ5qO7U+7kX6Ro+X9Yj1q8xpq+V1r1VNpesmepp2hasoXlb0a5MrL+qbpG6zldNdI7p04yU8SyfJbey5N7Tf4TqC9pOTdk4jdZIiYir2illLpWTccafz27Xh5m9kurFd43jVWbhblYp5/Pwyx91lxKHS138oStp+ZqWbcsBHTGuUaEOpvKqvh9oyNyu0dBHGryZVEjYxwK3EzGgoLH8Y0KrX5qzd1WDtBlbpqa4ajqpKGzw5VELNG1bl5mFv3i20d0e0dh2PVVE0ldcpOKaplbLJjUQUFLboVhpY1ihXukesrFp1aNW4mA8pUlRTwcpFe7/RFXK+ZHiVsuEk4spbjI3CzEF5d6GylqKj4cYx6CzVTfkyrtUTTRNPIsa8zG6t1KtLTqpS2KzNTybZpfsl5NULBGzMOh2mb1VVK7blTO7eonV0u/qGZiHtE6obAAEd7JYAep1k6dJ29QIg4ycKiokG/Kej1LFvZMTZWqljih2YrxGbslO0tZ7psIEx+HEYtHB6JOsSvaOAX+nMQyDIMRx/CcBt0HRqbqEEub9MlPurXb7o3CtDVLIzeyxjU5Tr2srTHe9L3SlePeq0LNicVsSNVWmnkbmVd3J7yma3peNJo/RV8lLIrINonESoKXlJr0kaqs0OudM1FDlizYsrd6OReVjk9H0p0+l6P4v1DR1NHcqXzeKxs3lDd3d+93TrVMslLJkg9NjVNlKqy48uS5APOsuU01ouHSXdI6i6Uc9s03StitNPwtVey3+L7R0pFVFVUVY41XFVXukzAb3RJb5DnQp+J3Qf5v2/8AYqbDb1GP6FvxP6D/ADft/wCxU2G3qPoHxetPQACIAAAA7TvupC0WqjxKYdGlUqqlV5GxGW69ordCdqHQbECxBSUgAAUBDviUN4rGZtsasWFyrI4l2mbll3rOwBHECw28hUhluYSKbiDAbWQF6tp6ACgAAADIsQLA5AAAAkAACSCkvvoS7KK++h2gXRiyeilIFN85P7xPsnopSBSfOLgE7UFK1ZaZ405uYe6OtQzagsbw1smVyo23c384vdYcrpVipZGbwnP2qptP3iO9Uce9Wn85NBy5R94x+s/V6/8Am9czl2TamRi9baMrKxfjyw+a1BR+jxbHfL9GxqKC70t0p46ijm38Miq2RMRs1PKqnqzWnGbJqiOw6j2aipY2oaeqkWlvVDjjuZOLGT3ebiPoSzXSG6UcckUisuPMpyXW3R81yjqa62Yx1jL5xcclmXwsQ+g/XrUdQujKynlgqKVW8n8p9Isa/k28WOS/eH8bLUu9L2khe0gxNkpKg7TX+mG/rQenXeZd4HTzLYkjASyjp6VcVLum2t3mMbpCX4k6QNS2fau6WoZa6nX3uY322Iz9408zaltt4iXzi+Zm9pQN/WqXq2ixIoAaqPRsc36SLGzUtLcqf1ihm3ysvh7ynTNqZGfvCLKslO65K3CS60+duP2CLLp5u83itsLfrHWNpy+3ReQdNexW/LWtl+6dQ2kJX68EA3aBdI8jlLXdHvxjemuVFdquzyTemipMcZC6i7SyoO6CRnTGhbTp+bypI5amubmqamTJmNJtlyGYIuEcSJgd0bkaRuVSDstbM21mLqFMPhHAGlXFZlb4ciVSWaOJsuFidAnWehMpdrJdPSxxcqqSEXrG17R5eraXyl3009Ky/SrFRurd4szIagr9/VMq8q8IvRNKtu0aPdrjBJsksAATRiwACRCh2BOsS3aPUS5tiVKvrBS4tvDQL2lbavNU6qWSuCKQvaPL1bRmIeXq2jgsSKEgaZIG5e6OCZE5QdIODRU/xXeL/b19HS1jNH9o72cQ1VSzUGvLzmq41EayKZvRr8aJgfNtpZQLwqU9M+LF1S8casSlqOgABJQeYnoB2QY6FfxP6D/N+3/sVNovVtMX0Mfif0H+b9v/AGKm0Xq2nrPlHoAAAAACAAADgAIAAAADsgEeaXAkFTcqjdZqUCpuku9Vce6xV7JcxzazOzCcByEgADgCBYB0ECT3aeDAAAACAAAOQAsG7QBoD3aeAAUl99CXWZS35/MgTsodm9HKQ6b5yf3iZZPRSkOm+cn94XQytrl83ye6Z+yRfLlLa+SstLirFHYZc65SVTps8aylacqG0hfpLG642+sXyi35N3vyi/os33joC9W0yOrrS17sc8cDbqshXeUsv0cndb937RYaK1Cuo7DDUMuNUvm5o/o2PM9fPL1fG9NCZ7UWiKW91VLXQMtHdKVso6vd7z7y5LkpoNo4TmWpaWeqbhjdsmxLyJjJwO0UisvdNFTVCywqxplg9FkjdYsiRMSEbrL5ZgAAKCl6tosQvVtFgHqIZ26J8qY0CuUdyb5UwvV/P9OW3qJaPplsc2XrVHNDj7vEdGXtOW9KkTUutNF3BuGFbh5PI3ssrHUF6tpn/jZ0beoUqZAvaSIKc0JdKgp8i4oKdUVeEh0sXXwlpAmC7QQ0lRcu0dGouXaOgX+lgAAP6cXtHtvUMr2j435L0gei7Rvb1DkXaU/5RFRKsEMsjcqqYGql3szt4mNRqStWKn3PeYyrcpmumiTIA3aAiwAAAFi4u0Qer2i9MfH7d61iMEm3euKCdNVQ8u0mL1bSLRcrEperaMmlL2jy9W0ZXtHl6to4LAAAPMQxPQAEMhyHpUiWDWllkXmqIZI5PaxxOwnLOmyJYKex13ehro42b2WbEhctfjTJt6SRfCxcUPodhT7fTSFxQ+h2EJlrSgADpAAAARehT8T+g/zft/7FTabeoxfQp+J/Qf5v2/8AYqbTb1HqvlyQAAAAAHAAAOyCAA9x+o4HgAebQBNVVLSx7Wb7Jk7hXtLIyqxZXq5Rriq8ZnZJcWy8RUFcXiDi8Qzv/ZDf+yBJPAMtVY90bkuUK/COc9tcTmQ2ulP4hPxnD4gOsl4wx+oq9l3j/DiwlrpJ3GGRWoFL8ZVA15fVOAXQNKqLtyKPY1dL8InyeubvC9o62aqjXvDfxlGV+2gqm5gis1Q7AExrpH+EZa7w+IcWwzN8OSjy6ebvRgRD+N4fEUt+u0O528Rqv4OcPo1KO/acXc+jUDzKjt1y8y267xm9lxrPjF8W7x0a1WuGloeKNeFSHQW2nlrnbcxrl7IBhbzW1zU68RT2aK9QVG83eSnVL5S0+WyPZDH90uLJa6eWlXzMf3QU05yl+rt3u542i9rITpy/LZNcLUctDeGjjZfDJ4jqVdpenqocWjX7ph9VdHLVlDKsCsrLIs0beFlbJWMPrOmzw9fs6IjkO8UXxlRtTrM8GXejYp9Cah+PrOu/XdV1P5uoj8LGojizMsy9XSp0pVVU9Dtp62GRain820rLwye6aiglaJdqkOOl6yZCmHwmiULXVM3DkPK5Bgbh2kiJusqydSgEr2ihO/UhYAAAEC6RK0exu8TyNcIt7T7fZBbjjPTXFxaT9q7R/qsdHOcdN3LpNu6t4hy/VOjmds5+DsXXtJlP2kNCZT9pZHtZTqYnQNgxDp04dpIiGZapMR+EVmR16tp6BU2PtAZXq2jwK/04vaSF7SOvaSF7QKUiCuQSvaM10609OzMBGVv0rS1zZd0r25RypqN7MzEfY2fwkLppklu0AATRgAAMCwAAB2PtJls9cUg7SZavWtoBrqTlclL1bSLT8u0lL1bQRSIu0kL1bSPF2kheraOHoAAAoDzIMgD05t05Rb3R6yf8PVQzfpKdI2mH6Wqfe6DuS+yrEutPj9XN0bNtreIurd6FTO0VUstLDIvFkpord6FSGWzSYvVtPTxeraenSgAA5kIXQp+J/Qf5v2/9iptNvUc56Grzuuh/QfD/APr9D+xU002o2U9d83Mr4DLtqZhltTMDrXCZGwMe2pqjsYjyXmqblkANpsqlXmEvXxr3jD7aiulb0g5HT1kvNIAa5rvCnMw22oaVDOpa6iXmZhxbDIAW1RqGHHbgV9TqPzLio9OTfh4hNRpxty3CBWXluzPIzcRFmqmbxGh/g57J5Fa405ipGb2TzPyswIlU/iNZFa6de6K8lhT4eEAyOylqpeZh6O1zNzGqSKHwjytGndHDKxWNsuUlRWPh28JoN/7K/dBqiPwgqpV08v4eUegsK+yWm9Ub34vaykipaIUHFtcaDm2oBqo5oFLRR47eEPJIvCR2rJO6R5KqZu8GgneTx+HaJ2pHFxKpB31R4hOzyiWRVVgCYsq5Ctk6py8RW7KKoaTFmHPIJvpACRtqijv1b5ktvIJPpCjv1Ay0/Cw4Q6StbyGQo6W4yNVL3TQWy2s9DLxd0btVojeqECrv0siU+8yJ2mLzIlDsLq72uHyVslKm0W2OWZY0UAulv0mI9DeVdsZBXxGpHmscirkjZeyTudLz3Kn1dp6ajZtQWJWa5L6SBV4ape9l7RoNMXmj1Ha4a6jkzjkVWZW4WjbwsVqPVQfCvGpj6uvbQN6juES42euqMrhEvKsn0hDL0J9HXl7R6LmUZjZZY45EbJWXIcj7RVKpYR9o8vaR4+UkL2jI9PRDg3G/WODTKRYAB0FDVVxU8ijm0bk442URVxvp5pWi03barvU9yhb9I3kHFCjeJTK9PdhqL30b3WnpVzmjjaoVfFiTujrUy6v0baa5Wy+TrG3vKZ+tM01EHaSou0goSo+XYWlKlpD6MeXtIMT4/CSIm6xkKlKQeTl2kVXHo34lHKlRDy9W0ZifIei7RBope0kL2jK9pIXtGmSaC9pW6glWKj2q3MxaGV1JKzVm7blVQqTyoQADL1pkAACmAAAwAAAHmTkfMWFsT5QpBi7SdbvWdgFpqIOTaTI+0h0XK5MBM9HzbCUhDXtHFfxDkSxDdoI3WLAEZhmAAAspm+kmn3+jbkv82aJe0q9YJv8ATNxj/mxF/NydNJR6l0Paa611G6ukNGq73u8JD05qZpZGt96j+LLtDwyUzcRadGl0a26ZoWTi4eX7RptXaKtOubflJCsVQy+Zq4/SRnZ89C/XNZVOxs/hPTIT0+stGyfLI1v9tX8rB6b7olNfzPy6fuOXdXdjYE+rYmc1RrqHTky09uZrncm9HBScRD2WvWutJmVKdbBb272WUi+6bjQXRta9EU+SxtWVTc1TO2Un3grzN8rF9Clrml6GdAt//H6H+zqa59OZd0p+hKo/2K9H/wCb9D/Z1Nd5aa3kqdtPdfCDaep1Xbwlxtr4/aIM1Z7LAEOKzU6NykiO1w/h4RvbVeyMtWSd1h8kWUdFD+HhHo6WNG24qU/lk3iBqqRvEGTtJFuU5sQlqoV6mUzO9m9oTt3neyGDQNcofEVtZeY94ylTIrMNvEwJJUl0Vu6xFkuSq3KJWlk/DwjiUXjAhlrl4eEErM+YlNRxr3RSQRp3QOh7Gk7oedJ25UViDv6Q1Wb8PCHETsfqG90DqOmTsPbKfhUFTBjUWC2x1Ubs3dENM6ZlqdnE+TsvMbC52uGCnyUoWQB2VX5PmNrRcRFuN3hpahlyK2bVCp1SDjLQbadfw8I4sWClbbr5DVKuTLkWSOAp6eYHoDpgz2pfQmhM9qX0InaCPa/UJRNo9b2irX83y+6M2R8q7aBFxevVHKfTXr5cXr1Ryn0566Aa7ASycI6eNy7QVQ9sSkO4Wanr6eSN41ZZFxZfEWmAYE6lTzvLlehtR/6P9UPoi7My0dRJJNb66VuHH6M61E3WZ/U2j7bq2hkpa2PGTHzM680beIrej7UddFO+m78rLcKOFdzO38op/pPe8X2SDdy5puI5+smRS5leORy4AbsrJHHo36yDHLmSIm6yyKaB4vVtPQIQAAR6aaQ7hRR1ULRuuSsuLHB+g2qh0vq7U+jnkZflDVVKrcuLd0+gtpxfpUtcmmtRUOsqVWyhbyeuVfykLcv3SS/nTpfeJcRW0dVHX0sNRA2UMy5KxYw94J6r06jdY8jkdHHEcqzJUcpKibrIMXMpMiHKnRd0eQixdpIi7TlSjpIRCQiEeJOskIhWSyVt5DD3SVmqJsm7xrLtW+RUbN3m4VMPNLvZGYl6qybAMxZl60zJAl+XaKE7QMr7NfKW/Ua1VG29hbvFkhzuup10HrSOuXFbHdpMZosfQzez7x0TAAAAAVPRdpIpmwmUgoSou0E6bKgfhJy9W0p6L0WwsoO0Ez4oSA5D8fGSF6tpBifHYSkcAdAAAPNvUVd8i3tlrV/myykTlIdyXO31UfijE6pNZcR0I+Wm41+jkZTZaeu/kucL8uRj9DfMMy/R1kyl6bPGfqhdapvYnWVcl5T0zVouzQMsbtwmkXj5R8paKxDEcResMBsjTj/Q5SyN0O6Bw7un6H9iprvIqhin6Dk/2P6F/N+3/sVNttQRPKjSzVDd4EsdR3jRRcu0UvaDihjsLO3GPJp5V7xcnmR3tBV/EyovKJWgjibbipbbSO6BoIO2nXHlUr6lVXIsp+BSplfJSgRW4hlkHmYbxABe09AAIAAAAAAHAAAAAsaCvko2Vkb7JXCxDflaVF0kqlfJjP3q5SUtK+BM28hndSVUcVO6s3EBtaZuLfXSsybiLxdMx48wzpyKPctIy5Fw1yhTmBKqZuWnagmx2rj7RpLRclqo1jb0ilfcpY6yPg5ittjtFXbMQLrTagMcW72MGTBp08yGf1B6HmLppeEz99bzO0HO0TbnwoZBmyeuMKoG+Qt7oWj1zaBV1efVdpn9OevbTQXn1XaZ/Tnr20A2oAA4/TzEMT0A6HioZvX2kW1Lb6eSlm8mulG28pZ/C3h900o7t/k39MpC5a/GmZ0RrCPUttbymFqG5U/m6ikl5o5PCxpEbrIfSZ0dzUtQusLGuN0pfXlXhWqp+8rEOwXynv1ppa6mbzci8StzRt3lMvfq9H/loI+0lRN1lXBLykyKoH0TsrKN+sfIEb9Y9HL1lJpCpPAAE+lNzFHqC1w3uhno51yjkXFjQbeQgzU/XkKaacr6MK2osNZW6QuPpqHFqWRuaSnZclVvdyOkRPzHP+mm1zUdnbU1uj/jS1yLMv8AOR8WSmm0lqih1bYaO5UE29jmjVm9lvCDZP2Xi820kIRV7SZGnKMhc5SIk6yVGnWJgi4dpKji6h2aqPUycJIiTrEwJ1kiJByCPtHl7QRAXtGEot4iWWhky7ph269p0KSLexuu3vGDrqdqWqkjbusRpeaRQADL1qkAAA4r79aIb9aZrfUehm5il6NrzJVWuSz1vzpa23M384vdkNUYHVlO2nNYWu/RcNPUSeS1XtZMzKxztZXmdOhYjeZR2bVC3m/XOhWPHyXdtllzK2X90vBJo9Sei7R5e0j7O+SF7RmVorZKssOzEto+Yo7J6PaXUfMMnSSB4vVtPRyvV7RyPtG17RxG6wCQjdYsYVx8A828u0iy8asviJW3l2kVxA4bozgobnH4bhMpelFpTzVRf6duaO5SZF6b/L8l6Wjl5Zrzuvghlbh7rGZ25D0TdZRndEgdWXJR0zmnLk3w7l2900W18ByOd9B34oNC/m/b/wBipttqGJ6Dn/2P6F/N+3/sVNptZTOcs82np5tAtPBGYN2gCf6Djcj4KOOVtXVYq52SotdUNltK3MmO2SkfH6imjGRAtu0QAAAA4AAAB5kJzDAViIUZBkGIYjmegAAHrcpidYc233TaNy7TF6w/dByibVVMtCqr3hyrp2lp3xIds9V2FssuNCwifVDRVUkDbcmyLC3NlXK3iK3amI9TS7ioVmA0y6paqWNqVc1JUlthlXHHEq7JdI5aNeEto6pZeUC1SlrrNIi+aMjqDKKFVbmyOnbGzUw+uqBkj2SIvD3gJpT271CT3RuyNnWOOW5vkMvujFg9ccDru9eqOUenPXtpeXz1Vij0569tANqAAOAAAABd6YoFqq7ePxRw8WPtFIbuwUHkVvX6STiYTrT5/VZnAOkyw13RreqvUVshaey1jbyqpF/k8n0i+z7PvHfyNcqCG7WuooaiNZYZlxbIydbvO3IdOajo9QUMNZRyZQyF5G2BwWuW5dBGuai3tHLPYayTeUcS+jZfCreJe8p2TTV+pdS2enulC2VHNysZ1+y0UTcO0kK5XwS8JKibrLf1CpTo+XYOIMwvwkheraWmUOvRp4l/COgT6eVZXUS1UbRyqrRtwsrHDejqWHo011ddKVsjRUN0k8utsvd5VXd+8fQDoc16YtANqixrNbm3F2oZPKqWfH0ciitfnTYQtxFxDFwqxz3ow1rT650+lZE26qoWaGqpm9JDIvNkp0iDjjUaUvVKhThHlfiCJOHaOIhZis4vVtHF7RtEHF7RnEhe0UJXtFZjgGR1JA0VZk3Kxrih1NStLHskXukOyeaZVu0AAx9a5oAAAeQVeprQt+stVRtzMuUbeFu6xaASXlynQFyy6RIGePKSotfkszZd6Nv8R1TL6jlOpLe2l+kmw1yLjS1VQ0fusy5funVTkmqtHY+YlREWPmJS9pRmpZWiVkqMe6aCJuszNs9bNFE/EMmnAJTl2ih0ixQkAB2AlL1bSHFzbSRE3WBjoxOPjE/dAOF2Th1NqmP/ANZl+iXZUWfj1fq//ml/VLraXnuSWQIQWIQ0s1Hldl5eFjQWS6SSs0MsmXhyM6vaKSXi4RzGehJv9jug+L/9ft/7FTZM5hehb8UGg/zft/7FTZbeohlPvcpC1A5slXhxK/azCYmbLiG66tlfMTmR4peEcaXEQEyPwlLWNwuW0/KUtRySADOXCeCT1XO6IbAALnIAAAgAAAAAAAAAAOAAAT7QM1qalXd5MaUhXai8so5F7wF/TF2xl3e77yltFRTSx444qZvNqOq4vdY2Vor1rKdfEovayVBazMnWpS1nDNtxNVcq+OlhfJuLwmXhp2rKjbjxZHDdaKzb5aXmJGyvmo5NrZD1BRYQ7VI92iwp3xBJprRdmrFxbEh6y46Ey+mrk1PWKrNzGi1FLvbeAmWXpkwo2G7A+dUxM2rhQ5L4SHYHzqmA641B6rtKPTXrZeak+b3KPTXrYBtwABwAAdpot/MsfiBSU7T1B5fXbMvRx8TG65eUi2ygjoKdVjXi7zEsRpkCBYhu0hR9Oa9OnR7/AA30XUNSrjdqHz1HP4WXunz/ANGGqJKBpqqClaJaVljvFr+jk4vPRr7PePrrZlBUPJzK3MviPnPpw0LXaV1IvSLpinx3eMdypIvy0ftGbstnnTp1HUR1UMc0UiyxycSspOi69pkdEXehvNlp7hbqje0tRGrbvHFo28LGkiqBJHZ0to36yQrlTBPxbVJ0cpqmkKlPAYifIfCknm3qIc0TNyk0Qyi9Vmnz/qi1r0Q66h1TTK3xHcpFp7lAvKsndk/WO+WSeOthVkk3sLLlHL4lK3Uljo9QWerttZDHLT1C4yKynPeiy6XDQN4bQ2oqjzfFNZ6luXd+Fm+0E/VS+6duVOEcRBtU4RxEG0yVJZ6nMeAWIfTlE5sNCxwdGKxN7C0Y9keknfNgKqLcVEkbd0ZLa/UrRVzs3KxWGS2uaIAAEUAAAHmnN+nGLcaZo7kvNb6yGoy8Kq3EdCp2zhjbxLkZ/pKszX7RN3oUVd9NCyrkN9GF3+NtB2Wob0nk6xt9nJf3Sf8A00/prF6to5E3WNq+Y5F2jM3UyldkmXE0kPFiZeHgkVjUU/LsGRTl7RwAHSLAAAFC0fiEAAS0brBxmJusHYDOG6c2Z6j1bJ4q790upCl01wag1T/z37pcbeY0+ZegAbtA1fllosAAHEfoY/E/oP8AN+h/YqbFe0xvQz+J7Qf5v0P7FTZL2kvyQbUG917JIw4QResXtnNqg4ORp1jnCJ+gj1BSz8rF1XcEO0o5n82MEMTl9QoQdkFgAFwAAAAAAAEAAAAAABAAAAJPNvLtPQArJaisbSs9REuXiUzsXlVLJlFkrHSHiyGfIo/olJWRgYqeqrZMpGY1litfkEOT+kYskpY0+HFV+6OIggSF6tpBvCfIXLDlUg3RPkcpUMnalxuEeRsLr6iY2i47opsLj6moBU1XBa2bwqVunPWWLCr+aZSr05624Bfai9R2lLppPlRcai9S2lXpr1kA2WP1Bj9QoBwS3AaDSlt3s3lDr5tSjgp2qpo415mY6BbqVaOlSNe6J1plJAQDdoigzG8g2jApdPJUzItZRQ1VO0MsayxsuLKy8y+0Tm7SLI2TE6lfzp89zWBuhfWU9vy/1ZuU3mW7tLJxfrfunQoOTaaTVVgodUWuqttfCs8M0bR4txKuXexOM6Culdpe9Vei7yztVQrvLbPL/Koe99394g2TWnSkbBidBLylWjkqJgktytI36yUvaVtM/UTImKs3UgAACG5EyMz0gaNbWVnWOnbdXSnbeUtSvNGxqhS9W0T9Kz9mZ6IukSbVVnnttzVl1Ja/N1kDcO8bxL4joJyDpQ05XUFwi1npyNVvlD6aJf5RH4ToHR9rqj19p2G5UvDUejqIGXijYeaFS0G08AXhkXlCpIFhgBQgAAAKnUkTS0uSrxKZdkxNlXrv6eRV8Jk5Vx+FWMdtEoh7j9Q5gGBBaSQABenlDulO09HIq8zKYfoE/wDwfc/Q1lRH91johzfob+S12r7avo6W5NivvZCNMumYnp6zicgS6kL2mitTM1OuRnV7TQWdsqdSqFLkWNpyjg6PSwAAAAAAPV7Q2gvaG0DOM2qLcaq1PH/6hW+8pZORZE3XSJqeP6SOnk/RYkbTT5pdo6AAakKAAAOInQv+KDQf5v2/9iptou0xPQv+J3Qf5v0P7FTbR82whbnfskLxKKwEpy7RWBN03tPReA3uxwj1T5QsUr8u1i8qUxhYpX9GwTIRhAsQVAAAHAAABzQECxAOgAAAAAAIAAAAAAF7WQ8xDanDtPTzacBvMQLbtE4/ULkp7ukO4eqOSt6QbhL8nkGc7TJ27522mwrfUtpj7d87bTYVvqW0Cqe4/NLFXpb1py0uPzSxU6X9akALzVHqSlbpf05Yao9UUr9KesbRDZbBe0cG17R6mTfyYjnX2lbblI1Q68K8pqyNbqdaWlSNfCPbeQFpAluUZZ+IQAe7RAoRt6gBuWXH4SHJPxbcSRMQXiFyXWSnfJsjl/TJo3+F9n21Fum8jv1vZZqGrXmVlOgVqTJC7JxFDtqGZny5iFw2efoxvRdr+n1tYWjaFqa6W9tzXUzfk5OLh/RNsvach6QLQ2htR0+sLXTq0MnmbpAvLJD4mXxKdSt1bHX0sNRA2Uci5Kxj1lr79lxTdpMiK2mfi2k5G6y80zVKZG/WOEVHJCOOmUAAA0WcQ1xY6joj1NHrOyKzWuokWO4UkS8Sr4l8Xte6dvGqqlp6+lkp6iNZYZFxZWFU1oaU1lb9VWunrKWoWWORS+Vz5nu1LVdAepFrImdtG10jM0fM1LNjkvD72R3bT2o6e7UNPWU8y1NHMvm515WLSXstQvVtFNy7SLHKrcrZDyN1l2UnaeC2RvwiABqXhV/dM3VU7JkymgqJeF/dKWqZmi2qouQqjzaK2pgIM1S1TRDdoABl6vIOX9GlR5F0m67o2XFWaOo/WOoHLbMm6/7QtypcfM11tjkb7LA0y6kGYACdnom6y8sVQuLR94odnfLayPjUDM9NRF3R4bj5BwdMAAACwAAKAAADk2oEWg6UauFFyaso8l+yzKPYEXWXD0vWtvFQyN+8SMNniL+ROydAANiFUAAAcROhb8Tug/zft/7FTbRdpi+hRP8AY7oP836H9iptF7TL2nJpKi5do8vaQYuvaTI36wl04sWYSU+IqOXAJJchgh1KeZcoZk4WNFP6NjP1PKwBD2iBQkfQIAWAuiEAAFDgQLEDgAACAAADkAANNxCA6BHFoIDoHi9p6OHm0Zfl2j20Z2gTpnMi1z/JWJWBFrk+SsBWVt3zttNxWepKYe3fO203FZ6koBT3L5pYo9LetOXVy+aXKXS3rTi/pSZXmpPVNhA0x61tJ+ovUyv0wnyjIRRsF7TQaWtvlEm+dfNqZ9e022momgta595sirkysNr8XCJ2u2AM/EIBR5tPBQkCAQKzE5ju6N7UIbKSmcZdwcQaidom2qpQ1yKk3CpcVPpdpXz0skrbWxJWt5qmpooaynlhnVZY5FxZWOd6EaTQ1+qdLSszWuZmqLazcOK5cUf2clOpNSsvMZfW2l2v1vjko2WC5Usm+p5/Cxh7L0Jpponx+ElLKYvRWoZNQWeOSXhqofMzL4ZF5jWRtygRZRN1kqPkK+J+UlRtyjlpKAAGZugAADyj3a0Ud+ts1DWwrPTzLiyscJj+NOgjUiUMrPWaPqpG3MrcXkfsr7J9BL2lbfrHR6gtslDXQrLDIve7oujCyXxaqnjqqeRZ6eRcllXvGgpLlDL3sWPnOmS7dAN2lo52kqdF1jLu58fVWOwWq4w3GljqKeRZYZFyVlY0zSXZbxGV1EzYou3iKG23fHhlyx8RMqLlC68OTF5S/JNVOqqxUzSkqWXLiYgyNmCfyGXQj7UJG3iG3TrJXK82jgDdoGHstfnWgcn1ZK1p6edOyQNj5VRtC36x1g5f0xKtFq7QN0xxaO4NDJL7LKQpvl1AAAMpWei7SwtXrG0rV7SZSMySqylGdr4eUkken5dpIHRAAAAsAACgAABxyTXXmulext9JRzR/okzEr+kjh6TdL/0c36pZY/UX83beCRQk2MlAAAHHvQgqt0K6B+Hm/g/Q/wBnU1kiYGV6D/xO6F/N+3/2dTYMhncyir2j0VQJkiZuUThgDqZE+XwixiBsPhHwBE/oGM/MaCf0DGdmcAbxGxYw3XtFoPAA82crjyR6A1tPC5ywAABAAAEB5tPTzaAMyS4CUlFOgmOIQpOYqN+sN2CpgIY8jixC9W0WOCRkf2jeAFM4EetX5KxOQj3BPkrARjaBP4yNtU+pqYug+cm942lT6qoBT3L5tcqdKJ8olLa6eouVulE+USA0yttSL8jIumIuEnakf5HtIumPR7QcaSKLL4TfUEW6o41buqYm3edk2qbZPVo/dHyBtc9GgDLugAgBi3T3L6hlu0WMbXHTKy+obkFZDbMcqXdI7xZNkMyJwk5kyI8yE+yeaV8yEFkJ0zkHbKSrzXn1Ye+RNpDUC3pvmusxhuGP5Nvycn6qmyiG7pRQ3a21FDULlT1C7uRfZMLoC+TUF2rdM3H1yhjWSGdm9ap25W+z+8pDvm0+dukQPxKSo25SvRuskR8AqtLKOXrHiCjjyN1gy1KQAABSwAAOiXi0Ud7t89DWwrPTyLiyscBSW9dBF+WOvaSs0PUNjDPzeQr4T6LIF6s1HfbTU2+thWelqFxZWUaaMrbdX09xhWankWWNlyyVidmcPoqqq6CNTQ2W4zSPpOqZlpatlyWlb6Nm7p2CCXr4i82hUpmyVsuINp4e5fUamWidrYhznh6vacqTzRl0PB/aQ6/fRUsm49IZu+a/neSzmXT/AOY0nQ1i+kpa6Fl+8X0OsrlSrjXWOpWRe9FxK32jD9Nmsobj0f18fxXXZR4zZNHy4sY788t3n66depJd7SxN4lVh4q9MVC1mnbXVLxb6ljbItCSl0ei7SRHwEWIkL2glTVWyVngjy8JYI5V2z1RSwi7SxCxYZiAIeAiAgFSAEpy7RQnQ5H0nfjM0v/Q1H6pac5V9J/4ztL/0NR+qWS9pfy/Sl/l4AsDYw0aAXj9R4Dh3oR/FBoX837f+xU2ZiuhD8Tuhfzft/wCxU2pndmnmIztT2R88kTNQcQ0brHllGZE4tonaID1U3mXKGbqLaX0LlLUdo4MtKM5fUOYDbILIGX1Bl9QY/UGP1FZBOIYisfqDH6ioeAe4/UKwAG8QxFY/UGP1A5l4AADoPMT0AI8xDE9AAAFgAIADzaAeka4Y+SyDjdpHuHqjiJMfbPnN/eNpW+qqYq1fOT+8bWv9V2AdS3H1FiDpb0rllcPUXK/S/ppAU0stSeqbRnSfoWHtSeqbRnSfoWHl1sLT60prqiXHFTH2xsKjI1U0vm9jd1hnKN+VfhHklzKmSfFh6mqusE1hkM70PKuHlGWqsgIeZyOzgzjMjcO0rk00caUZ21BH2yjO9/8AMc6cjjc0uCkPbUDMj5KJkFSS8RFbtFbeoSGQF5tpz3pk0zUT2un1BZlxvlrbKFVX00fejOhBImRC5afOss/obVtHrTTtLcqObJZI13itwtG3hY0iucNSok6GekeZcv8AVPUEzM0fKtPUe03tHcNrYsYetetJS9o8jkWKoyJCN1ilqUhG6yQRUceVxk+nwAAIUAAB9KjVGl7frHT9bZ7jCstPULjxd1jjOlrvcuia/NpXVDSS2+RsbfcpeXH6NjvpnNdaKodeadqLXWxqyyejb6Ngl3v2Sl4D05BpDVdw6PL1t0ZqyRpfOY227y8K1UbcqsdeXtNfnTNcmwzFYCTah+SwACQ08dDN9IVthr9E3mndVxkhZTTldqCia5WWsp4+aSNlMvrOpavGmX6JKpqro3seXdp1U1hznoDl3Wh2o25qWsqI/wD7GOkK+Z53W8pe0kL2jcfaOL2i/wBcpeWSVmjxYuI+0pbJ6Ny6Rus0JUdEgAFIAAAp6LtFDcb9YrY/OHRxyXpI/GnpNf5mo/VLLaVvSVw9J+kW9mb9Ustp3yrVO2UOR8w2CG9kpKWn3vKoztixYmUVRuJOLlYmVtAsse8iBxQ9B/4ndC/m/b/2Km1MV0Ifid0H+b9v/YqbUzgoAAAaZMhvahJEbeoAhy+hYo6nt/z/AN5op/QsZ2p7f8/94BFAAAAAA7NAAAFwWL2pwjIsAQAAAIAAEAAAHAAAAFgAACBIoaJaToEe4eruSCLX+qMMmydq+ctvvGwrfVUMfavnLb7xsK31VACtunqBB0l6WUnXT1Ag6S9YkA6dqL1cb0pyOGpvQqGluRwlSWqpHwzNQj722w+ypk4PRsXVgqGliljbujuk1CcQmNsCZXRcOSlXsbBi8kWEUuY3tcjxVHEPbGzXaNko35HmqGCQj7U9o6BsfJhvL6hTdole0A8Ejog5RCQADipAnaKE7TlG/LO620ZQ630/VWusX0i+bl+jbxGJ6FNZTVUdTpK9zY362yNHk35aPu4nVzk3TRoqqRqPVlhhX42tcm+kjXhaoj8Jj9Ya/OnWl4CVG3KZXR2raXV+naG7UbZR1Ea5L4ZO8poomMP5apnSyibrHkbrIMT8O0kI45OynI3WLIiN1khG6xkSwABwUAABv6z2tNC2fXNpkobpT71eaOVeaNvZOU6a1hdOi29R6X1jVSVVHI2NtujcrL4WY7uUGsNH2/Wllnt9xjzjb0cnejbxKcmsmzo8jZLtxPTjVm1DduiO8U9j1GzVVhkmWnp7u3KreFjsFLVQ1kK1FPIk9PJ6OSJssjT5+uv0x35lnm3qPTzM0ShkZnndFHi9W0l6/aWjx/TkPQ4nkF61rbf+HuTN95V/unVou05npqLyDpp1bT8y1VPT1GP3lOmR8x5VS9LtaSE5T0DzMRKl1Zm4dpbI5R2Z+HaXUTcJVNIjblHRqJMMR7L6h9AyArb1CQKEFbeoSgrb1CdDk/Spw9JGi28TSL+iXG3qKfpY/wDzXRMn/qmX/P3i429RXx/Tt09GR4ZNzGdR8TQWCsWdd23MZvaOU0rU8m1kbFgBvoM/EroFv/4/Q/sVNsvaYfoJ/EroD836H9ipuF7TOHp5tPTzaAeCBYjAAbrfQsZufmNJW+hYzc/MTpykcAAaXQAAPIAABcFgIAAAAABAAAAAJAAAAABa9ooSvaKAE7SPsy+DhJjspFbEiQEW4+qsTNvURbh6o46TH2r5y2+8bSt9VUxVq+cn942tc/yVQCnuvqBB0p6wxOuvqBB0onyhwCdqv0OwNJ8rhqv0OwTpJuFgXmWqh5WHrZP5LVK3dbhYZg74raO60lZxw8JS7eYsrdL5VS7tuZSHPFgxSaR/qKrYDkUvWNuntAqFi6SOcbZRSOK2pw7QCPtGxzaNovWdk4btGh0aCicAAAjRwgAACATNEssbq65KKAnU6U86y4TAy9CnSFNJuZW0jevORyKvDDN4ftZL947lAyyxrIjZKy5Kxm9faUj1lpurts/o5OL3WXlYxfQvrK4U9RVaPvvDcLa2MKt9D3W9pWU8+/PL0PO9OxRdpIRyCjdY9E3WTVqUxHJETdZDRx6N+sEO/VME7QTl2ii0pnF7T08XtPRgDxuXaegRMqr5p6h1Hb5qG4061NLIuLKxx25UV+6ErhUzUsMt60fUSZeTZecpWbw+yd2xFbUWWNldVZW5lYCsfYNTW3VFthrrXVJWU8i93u+yxZZnM9UdD9w0hepdQaCrI6ORsmmsk/oZv6NfEX2gukm36xjlp3VrfeIeGa3z8xp87yTsthmegJ7pWvsl+XMtRVHxT04WOsgXGS4Ufk8ntMrcP7x0hUOa9K0XkuqNG3T6OuWE6VBxLtMNzl6c9/8AMcgK7ZHgGdxa2yXul5TcSqZm3cMxpKf0ewJKlZ8I5H2jcb9Y4zDkAAA6QQG7QQVgJ0OS9M3ye8aPqu6tdiXW3qKnp8TdWvTsy80d0jLTbzDeH6cssAA9FDpAAAEN9BP4ldAfm/Q/sVNwvaYnoL/EroH836H9iptl7TOHoAAAAB5tAIdY/m2M/UN1mgrE82xn6hesAjgGAAAAAAIAAKzSegAAd/SgAAGJ+QAAAAAAHJAAByi17RQle0UIU3tcj7XJG0j7RHKOEG5S/J3JxBuifJ2HTZK1fOT+8bOuf5GpjLV85P7xsa71JQCnurfxftG9KLxPIOXb5v2idJejdQNMlaqbOFROlG4XFaqTzKjelE5wN36tdFLgPI+RDXq2jyN1jnmlhQVXk82XdLCsTKHay94pC9t0q1lO0bcyjTRVaJx+oemi3UjKNlZKSvAGyfusKG1QcHG4hod7hHbtAzzvHi9oL2igSNAe7TwU00QDdoA3aBzLOJyYMOIVgMBmcx6ZtI1VV5Hqqww5agtPFHF3Zo+8rHTl6tomZFljZW5WMvrOpW8qzTN9HWtaXXel6O5UsiszLu5I2XFo2XxKaxDht8p6joS1w18p5P8AVm8SY1XD6OTxfaO1UtRHVQxzRtlHIuSseZ+Xp6WEb8SkhG6ytSXiJEUvKBaWUTcI8j5EGKXrHopVKkynL2no0jdY6OmAABABYgWOCdphdedE9t1RJHcqLK2agpeKluFM2LK3hN5mNzS4qAcV0x0nXCw3hdP65hS31jSbunuCru4ZPe8LHUucr9XWGh1VZ6m23Gliqqeb6VcsfdOVo1+6FI9k0sk+odLqyrlFGvlNDH/dO/IlnS+6dk3WjY6puWjrIar7SyL/AHjdUMuVPG3iVTH6wqqPpD6M7qtrmjqWmp2ZVVvC3+EttHT7/Stnmxx3lLGxG602f85XoHi9W09IjSTTcymipJeEzcHCylxRMP8AknaWyDypmRYm4do8jjuFgeZHoJFgCCxOhyz/ALQaf6n0dR9DcIW/SJ0bZRq3iXIb/wC0EmfRjXSL+Rmjk+6wm2PvbbQyeKnjb9Eby/Sl/lLA8VOIU/A2J6Lz6NgAA6OhD8Tmg/zft/7FTbbTE9CH4ndB/m/b/wBipttpnBOQnMS3aOgAAAANVCeZYz8yGgqH8yxnZX4gBllGhbOMgQAAAcAAYDzJCAACoAAAHAAAAAACHAAAJ5er2ihKZd4UzKnMyr7waEk4/UNsgma5UcCsz1kCqvtEOTU1pWNm8uibHwsLo2U7Ai16ZUrkGLVtPVfD5HS1lZ/RU7Y/qjj1tyr4WjgstUzN4uEYvxsvbE/jJ/eNhVt8nUpaDR+ot800VtbL6NmxJl0nuFubZDc7TPRt9LlvI/vKLoZR7r6jtE6O5doXCVZaHJT3SnfD+kyd1V6FSLpblHtVeh2CdL8u0ZxpF6to4vaNr1bRxe0d2T2zvky0VW6qtuRBywBHxBRorlT5+cUq2UtqCda2jxbmUhzxYKUmiIQk9br2nhZJ6vaNoK29QsFNEiBS9W0SO4aAAJO5IAAB0gAAAaFiBS9W07Tk/pBv9go9S2WrtdbDHLS1C4srKch6KNUVGgdRPoTUEkm7kyktdWzZeUL4feO3mA6VujSn1zZ13Dbi6U7b6ln+jkPPvz/6ej5+jeLLmPI3Wc/6MOkGHV9LPb6zGDUVvbc1kDN6Rl/KL7JvF7TDVNP6SIm4tpKgfrIa9W0egfrGmh1YRMSEbrIMTdZIibrKoUkgB4zjZTGYZiWYj7ZToPPUEOetGZqjEraiqVOYQdPVNUV7VRHqq2P8PF/n8JX+WR+ICbZW5aFqLdXVddYqxoGquKooZPQzfZLjo61HGlvhstRG1JVUsfDEzcy+yWXlkZBuFBR3FfOx8S8rLzKA22Uc+TDyOYu3V9RZm2LPI1TS91m5lL6kvNPW/Du2FyNrqJ+LaWVJL3SjiqlxUnU1QvCw2S/IvEl4dpIWoKNa0eSvUMm0vEqPaFJLl8JTrVKORVXhYBpdJKKWUrY6oeiqBRpkenCn3/RjfV/mWYp9NVXlWnbTJ4qWM1Wvk8s0jdaduWSnY530VXT4x0rTxtxNTru191RpU7TZUjeeXIsKi2yS+cTlK3ZwMXFkrMpN27eya5ZLVu2LHuicNniNNPbY514VKGuo5IG2riO4g9CH4ndB/m/b/wBiptJO0xfQh+J3Qf5v2/8AYqbSTtMfe5Bg8V+INoKh06Qvaeni9p6OQ1U+hYzNR2mmqfQsZeoAI4AAACdooAAQe2Jn8I3EnEPZ4nZoG9qco2yjmQ2zFNOSQAAGlMmqqqho4WknkWKNe8xQ7ekKx5MqVUk8nhgp5G/dKvW3ndWWGhqV3tLJJksbcrSd3L9I2lNSx08Kxxxqqr3V5SHfRWZZv+G+99Vs9zqW7vyfd/rYjiahvlR8O6sc8H9OyqaaJMGJ0HGowyyOz+FM/oKekg95siVBpzU1VGvlF4pIPZgp+L7xqEiwYmRxdYJMrF0ezVS41GorlKvhibEkU3RPZ0+FpZrhVf09UzKaqKLDEmInDtASpaLQVgRtn8Xxt7zMXVNpSy0fFT22CKTxKo9EhKXq2i/oxUSRp8OMar7o8vVtG17RxeraHaKcXjHno4aqFo5Y1lVu6wmLtJC9W0n2lXJ9bdG3xWtRcLOreTtxSUmPKvsmV0w8Ls24k3uPN7J9BnNtWaFajrpLxZ42x5qiiX8p7S+0Umi9lh9TejG9Mcu0L5X09xpVkp2yX9UNNd4romWlFDSCxppH8nQEDw50u1VW4qFy5WLqqiy4l5WM6iYl5QVXlUO7bmUZJBrEwxIbltW0+RVunEXkxICzzb1DSV6ebeXaJzFbeXaN1zpluvaeHu08EEkAACnA23LtHBtuXaAM7Tw92ngxTq9W0NvLtEgJUuzpyXpO0bcrNc11zpjzVZQ+vUkX8qj8OJ0DQ2sKPW+m6O7UUiyrNGrNj3WLjZ31biVuFlbvHEb1FWdB+sPjSjV59K3ao3lVGv8AJ5PEeZ6+T0/L1+uXeEbrFZYEG1XKG7UMNZTyLLDIuSspMbiMq/UqKXL4SRE3WVsXXtJkEvKWS7SdveEMyOjisjTLN2isvqGXbrFjTocT+RBqZespaps2LqZCpmp2J6Sr0VNRzbSKyKxaPStltIslE2W0oT5ENF6x7H6hzyLaPJRMBfkRcMuHbxqNxW3yeTeRNj7JY+Rt4TxYhcj5TlJPIjY5FtBVYKUuzhEvVYqcJteeXr4lBbl7RmZLlGvWxFa8r2Mdyf5Ww+Mw+Nva/SMS1+xz4iDtvy5beJgyX5XSkvntDkV5aXlZjmP8JF8TfeFfwmjXmkZftHDfK6hVTtX22tpcuKaNlXiOS9HV0awrRtjlD5RNDJ7rSMTl1Wvdmb7xmbM29t9zp171QzKIv8ruFRUKkjqJpKxopNrGVsGo/jm2xyS+sRru5PaxLDZclibiNMl+R0S2VvlUY9PEs8eLGHtF+wqF3bGqpLos67ceYqNM30Ifid0F+b9v/YqbbvL/AJ/7zEdBv4ndD/1DQ/sVNv3l/wA/95DLpZ5iC9p6cAAAAGqn0LGbqO00lT6FjN1HaAQ27QBu0AABAAAeTl2jeYkQLkPXYZQHED6dlIM5fOkGy6fkaOqromk7scDbyT7pH15W1SR22hp6iSm+MKjyeSWLmxLCy6btun1ypadd53pW4mYTvov5zpz/AFldv4ZXa21VDS1NNNTszU7VMeOTeydS0ldo9R2GjuC8LTR+cXwyd5TB9Ll3koKG03CLhko66GTLw+cUj6crZtNaxuOnds38W3aNqihx5d5izSfqqR02T5uuNTqOU3Ccpp6DXemZn+IrtBeqPi+SXKPi/wCpl+6XlN0nXSgj2/Huk6umkXmloZFqI/3Sk0lUujYkiBOsxunOljS97mWn+MGoaz/hqyPdsbanxlVZEkR4/FkHyIdlKiThUlJER436yRG/WdJk8sWAYBmGY5RsTD4SQvVtI+Y4rdfKLRkhe0kL2lXUXSloo8qiojiXxMxBn11p+ljya8Uf/UJnlpxp0Mft6U9ORf7w3v8ARrkU966bLbQW+SSlpaueb8nG0eKtxYgvMldJHR2test4tmS1y8VRGrese17xxfT1ovmo6Vaym1M1sjyZWpoI1kZW72WR1iTpOv1fDL5BpVoKpeVq6bh/ROf9FSf6v+VPxTVFRNNI3iZpGE2bsraxacu1rkVp71LcY/DOv6pollzKe8VU0WprTQpJjC0c0k3u/wCWLCJMGNXnTJc5TRY2nKOF0T0XaSKKfyeZWIaS4fCK3gBpHxlXIq6mLDiC3Vu9bcs3F3SZPF5tsi80RWCReP1HheaKSAHmYaJokBB6vaTBAAAqoEN2ixDdowR9vMAbeYTtfhAoZxveiWYZaVQMlbGzK+8W2lvdDJR1kay08i4srDkk/WM7agz3OjTeXL9FXmu6KLtHpu7SPPY5mxt9W3Fi3djY7Ik+ZkdUaepdVWmahqo1ZW5fZYi6Mv01uZbHduGoh9DL3WUw355a59ZdARyRE3WV8TdZKjblJTJatMVx5eraR04FJC9W01f8s3aLPNqcO09PNomkv6hzREWanyJ0jcQl8fwnSq3bSr4RnbTk6TFRv8AkyNIeynVBLRKOTy4fCV73KNeY0zLP05JKqkWaoUg1V5hRinrdQxr8IZC8qKrAr6q6RovExk7hqvBWxYz9XqjPvBkvyNhcrtDuWMvWajWJeFjK3TWTLHIq8Jja/VuS7eYfJa9HQqzVuHeK+bVqpzSYnMa7VfF3irn1Rn3mEL8jrU2t4/pCO+tY/pDjtRqbrI76m9piRPkdsj1vCnFvBNs1lGk1Q28bzjZHF11GPUGpsJtvEB/lp9Eac1gq1jeebiNR/CtfpmPmu3arwm28WJoLdrJt96T7xU3yPo60aojdvScRsrNqtUbY2WR8x27WsLybVbh9o0FBrdYJtrJUD6Vn10+luhL8Tug/zft/9nU3EfaYfoQ/E7oX+oaFf/66m2i7TLT0unwABiAAAA8ZMlxM/cIt1IxfSy7oztZLmzMAQhAsQLIADLVUK8zDbXKHxFchKArZLvCveGZLzH3QyFk6DRSNdJGbhG2uUiCOTRnpKp5P4O/GES+ct8i1Ct7S/wCHIvHqN7bY6hOKGZclYobhUNX0stO/o5FxZRWip2qNE0sbtl5O25+6I3eSn6QqKa46Ju6wLlJHDkq+0FdYZNY6Jsd8tkm6uEMPlVPP7SrxL7rcpfXCn8qo5qdWx3y45GP6AKqafQ/k87ZtT1E0Pu4tiZ3of8NFpTpBtt5j209UzWq7K2M1JU8K5ey3e+6bDex48ciL4fCxT3zR9r1FHjWUqNJ3ZceJQtXRTpuKoWZ6Hf4/k5WyUv5+dU8+rKvF007UQrDX1lvb2WmVWUxsidHUEzra7tWUNd+TazTTM33V82p0qDQGn4st1aaaLL2ci6oKCltdLshp6eCLxMsarkV+NLtuH/wm1NQSPT2TUGo67+brrbHI33mU2Gi+kHW9HRzw3Ox1NZJvMlnkjWnVf0joUg2yDfGTSpg1RrGfNp7Tb6OFeaWeqZVHKKLVleqyQXa2NH9JTQ75W+8xZNFHLwyrvYe9H3WOf3Doxks022u0ZcGsFwXiaNuKmkb3RZk8/ZuNml9QOuzyzVVZj4YIY4yPJoCnXnuVzl96sbEytv6W9VWGRaXVGlam4x8sddaPOLJ7WJoqDpg0rcaVWluDUNR/w1TGyspw5um0Pa6CbLbCs7fz/FiTtljtsXJb6aLxYxjOzVdllba3xtR/9QZg1vYayq209BdIq6bwwcX+EnQTKyijlgWPFcfdOa6olaXUWm7KzYtvGrJl7vm8sf0VU6c9V7Jk5NPQvqrbfJZGnqt3u+IlVKTS8pqjdW28zNwrHRyMYvosiZNF2+T6TKT7zMaLUlb5Lo/UMi8PyGQg9H1KsWj7XH4YVFUR45Wr+kq4eGGj8nVfD3jVbIsDL6O+Vag1PVd1qhY1b3cjXN2mzzZPU2vaegBdjqiT3I8AHC6SqWjuFNM/K0m7YutRVXxdQ1dVzRwrvMe8ymZuEWVO3s8Smktkq3mwws3nVZd3J7RSfqYzBLHVU8dRE2UMi5K3iG9nfMrYqiTRupm0xUYta6yZpKOpy9H4lxNc3CWCOyiV7R8YdgSyTkJzG8vqDL6gB0BGYy9Qcyqcy+ob2yjLVHWM7aqMb8kqj0r4EeaqI8tfCnMxU1Vxh7rZnEqtYTV+HexIs1f4eMpZ7pHkVs1368Qc+RpGrMhPljZGXWvkbvEiKtbvCUPkaqCqyGbla4bpGua4zLxLKvMVtJVN+EtqaXLEy9dm1lbHkxWNmyxUuqbhxKuix/CWUTqik8r9vSZExIRusgrKDVqqcQ0sml4SG9UQZrl7RWy3SPvC5LpaSVvEJ21RQzXeHxFXUahXuyDzI01FVX4d4pa2+KnK2Jl7lqZsmXeGbuGoW5t8NlLbZVmoW/D5wzty1DgrtvDJ12o2Rct4ZG7ambznnisyXtZbir1W3NkZ25arVWaRpsPZMHXaobJ13hk7hqht9jvBspd9NN5dNYLvGVZGM/V6tXH0hg7lqNt83EUNZqNmbhYWqynpvLtq3zLecYy9VqPNeGQzctyknXibhIe8JfINNBJfmlXiyGXuisvMxS+UYCcxdBZTV65czDbV/tMVbysN7ZWE0RbfGS+Jg+MtniYp8vqDei6PMtJTXmT8K5E6lv0iybMZDG733hLVWHeYPkVdETU0niJ1NqhsVbeN945ale3iYcW5N4mDRprL9cOg/wDE7of+o6H+zqbiPtOX9Dl5Veh3QeDf7jo/2Kmsa8zP8I01p7NU0zSqvWw3JWxxd4zMlZUS94Z2eVN8PEMWWp+N6fxEaS/RpnirFDFRTO3KSI7bJjxA4eqrzkuKlTUVrNkXUdojbnUkR2an/CAY9pajuiW8qZWXxG4+JofCJ+KIfAAYH4tmcPiuRuZcjffF0PgEtQRpyqAYX4kb6Ec+IceWM2G2iUb8l+sYjLraGReVRO20Zcymq20QzLQN+HFjvTTTLzWZceUr4oobdT+Tx+ajabl9o1FwbyClaaXFVU5fem+NNfWdl4Y6feSL727/AMRjusvS8GudDC9AM7T0Ooc//EJJF91v/wDJrrs+9t88KSbiaRcVZjL9FVBDpXWlfZadc4/IYWXu+cVmyYh51r0bq/8Am3UmqLfS1UlPPJumU0VqvNtqo13VdB94xOpNL/GNc9RTrjl3SnprbNSybt1xx5T6Hx89Pn7p2BJ6fuVETfaHFc5XBLIi7cWYnU2oa6nXFZmxUr3ylL5HRtqDcicO0ycOtajcqu784Kn1NVVUeK4xEu+Y+RpxDIZVK+qf8sweWVDNxSMwvxqz6NQ+KqUt1tFDeafbDW08c8Ld1iH5RI3MzDkErfhIV55aZpUt0caZ7ttib7JaUNjttrjVaOhgpsfCpIiHDL8ZymcjtxEkjTSrE3ETyZQ68l3Wibz/ADkO7+8WmkqJqKx0dPJzRxlD0lS56Tnj+mmhj/SLi5XFrTpWprsscYeb7Iq+VlbrRHa9/guO+k3jEwg2ppPiuhadmeZoVyyJycu1jT5svrJOP1HgsZ2zxq3nJI1/9xRu3lk7OiwIklezSMtLTy1ntRLwk6ksd4rF2M0cVNl3ZRdG+MzJy7W7pI0RVKk1Xb2bvb6P2V7xbQaN3rL5VM/tLE2KkG5WOn01frLVUqstLJI1PUe1ljiUmzZQdeaZh1HbZadlxk5lbvKwzoLUc1+p62z3ZsrxbeFsuZlNRcqdlm2q3Mc/1xa7hS1VLqCzcNyoct9EvC1VH4TVKFNhIu6bFiPNwDlovlLqi2w3KjbKGReL3gn4B3FdLzbRje8RImcq5qrD4Qc6sPKOEizT+Ir5K3hKWru/jZsRUtr6evX8OLFXUVpn6m/Rqu3KTiKOq1Ng3pDmk79GmuFywXHxGZul8WJd2nMUN31CzK0m8MrV3yRm28QaQr1axrzJ4iOl5k8Ri5rzN4iKt5m8Qv8AUtuiQXSSX4cWLy3VsjY/Cc1t1+4lzNRar8viD+mmnQrdK34ci6pajiUw9BeeriLqku/XxEl9NxT1WOJKjqjGwXZstvESku/tCH01TVTd1iPNVGd+NW8Yy93bHbxAZdVNey8pU1Vf4irqrtxcxT1d34eYEvkWVdcSlnu8eXMVNwvOMbNkZuqvi95sR8pd9F1cL5HxSeEy90v2XFiU9wv0aZcTMZe4Xxn5clGT0urtfsIW4W+8ZW4XRZcuZciLVVklVzNwkGflDRe0blreLaUdZLlIzMTnyZiDNFxC9IrZ/OsVtRFxF9tomflUj7bbvW2kuhR4jeBotlmj7wpLGogZnH6hWLGoWzL+HhHPiNfCouQyO1PZDdeyar4oj8IfFEfhDIZXdL4RtomU00ljVpNvdUizWuNBcnZtkYiy5ZGkktsf4SDLbY3JmUwjMnVFO0TYkXbEB365dCdrhTod0Lw/7jof2Km0a2x+HEz/AELL/sd0L/UdD+xU1VwibydsOY0PX/TP1dVT0smOWRBqLzuo2aLulXdKKoiqHZsmUitLlC0eOJ2ZNMp0WrZlYnUWsG/K8SmT3DD1HRSSyY8pxx0i3XSGvXgbi8JaRGT0pQSRTMzGuwUAX3TwEG9r8XMMkMgxGdtRGrY5Cmr4e8wpgyjeIl7pT+Igz3yNV4ACxPPg9opdtxaflyGdvlD8uQGlR9KUrU9LZ5lbzMdYrTL4lMXqiivFm1N8bWSliudHXYssErMu57uS+9+6dMltEdxp5Ia6PfwyLiysVdstU1pp/i+ebeyU/KzLjlH3TNc6bvGsubxaUvV5qpqzUUixLk0dHQ03FTL/ADmXeb9Ug6M1DULrayw1i/LqeSa11UvixXJW+0v6x1aromx2nDdaIul+kqhuCR409RJHMuP0kcjL+8T8/rWm3X1fQ1RFupGjK+ai3vCxaTedxk7rLkMsh9B4X9dPB9f1lUzWiPHErZbQ0XLxGkdMiO6GpmZtKdlbiUlR9pOmp8/h4SPtTAOyDkXLtHOH/wAiK0o3tlEybSwFL1bSr2V+AzU3yRYWxUnfnpefRooEyJGBhV1DXJ+UIdRd66XL5Q65eFiHxH+Z0ZmjiXKWZIl8TGRr7zT3bUFPT07M0MbYs3iMnVT1U67VlqJZV9piVpKL+No/eIV5qT6aXHSomVLZ6XuzV0eX2Q6TJd1pm221lyhqq6Gnk9pRzpAl/wBbNHw481Uzfdx/vEq6NHeeknS9taPGlp2mmVcu8zKx511l6fl+dLSG5XKsXb5Hp24bleWWdVjUtrdZtW3RlzhpLZD7Xnv7p0xuIETEWbF+enOYeiSurHb401DUzwt+Sg82pqLRoKz2GNVgpVlx70/ExoNkuA21UNtD48mY6WOJlxVVVeFcSU3ERZLlDFzMRZdR0sS8x3RcrEqNXW1rlp2sjibGqVcoW8LEGq1bTq3BIUt01DJVbxYpG4lxGmhldUkrXm00N0Vso6iPmK2pi84N9HEqxWurtfKtHUSYr7LFhcol3x6HnTHcubyVUnRvf56yDJrLWcNQq8sMzcrY/eNtWTq0Mcyejk4ivvVtp7pb56OojWWOZcWVjI6QqJtPtW6cudR6uzeQytxZQ+H7JoRaKrqu6pn666Ro2LMPXSq3XCrYmBu10yqOFuUGWrW1y1DumdUYztVeZJeFihul3wqH4mKWpu/XxMKhVLStuzb5lKOtujfhK2runFt4mKWsr/aYjVZQqtLSruTeJihq7k3iItXWt4mM/WV7bxlyYXtEXE10buswytybLaZuav8AaYZWvb8PEwmi6bygu3XkxpLVd1y4WOW01068i8tVyZZFxYc0061R3f2jSWy/LwrtOW26vaXlY01BWqjKrDKzToUF0jdvSEpLlD9IYuC5Qp8OTDnxvD4hVdNh8ZQ/SEOqvMPiMnUXyHxKUdx1DCq7Wy/SA2m0rr9Ci7W3mRmbtq1UjkVWMXctYKjbd3+sZG56maVmZWBK26uWq8qdvOGXqtTM3w+cMbV6mkIO27LLxNkHaTmWskuUzszbwitK0rbcjPx3JW5ciQlUz94NivqtAbiUixv7RIi7RNEM7KXi25Dy0C+ElJiPY/UOENLav4QS0eyWCISE5QyFfHZlx9GJWzcW3hLhG6xS9W0MhUxWb2R74oX6PYWwPwiVIU7WtU5lI81vjx5S2qZVSPbkVslZHiIFXNQQlbUUEOO1Syqapd27FTUV8f4eI5R0Opp4Yl9oqZqdWYsJZd7JkRZuogOKmriUr3iUtKxsitdgX4/XzoT/ABPaF/qOh/YqbJzmfQvdG/0O6Fx/8Dof2Kmwa8zDTT15lKqrXHO3hIbaeh9kT8ZSS8zCt7I/eYsYnZY6VPh82opbbRxcyqJSlqJeVmFfFtQ3w5ZAXKVBUQ0q7d2Et0w5eEZjs0xISxs/OxzTiLtukgzJWyN3i2itEaimtcKd04RQ7N9L4gWlmfumijp1XlUkboAzsNoZvhbIkJaFX4clUtpEXuiB/wChGjtsaeEc8k9lR8XH2nAi7KXxFLq6gbyWOuiXzlLze0ppG7SLcImnpZY17xPsr+dMi8q1FOsitkrKfO/TtbZLXerXcFjyhkqN39rFsTrmlKhrTdrrp2q4aihbKOP/ANO3FH93iUpemaihqtG1GfNHIsit4WXvGbr1PP7OnWKohumn7TXQNvY6ilVh5omM/wBEVR5b0d2lscd2skP3Wb+8ap06z1fD8vG/1fWleyjLpkTtsRHZTdNMaDtiI7xFk8RHeIqFW8RFdOEtnQhzRAFXKhDmi9ktni9kiyReyAU+7I8iY7C2enIc0QZCteIstIU/8ZbW8PERWiLrR1KzVzsvdM9zmV/OvsNRJvekfTa/Q0tRUe83Cv7xTx1m96aY8l9DbVbL7xbPFvelKSoXhaloWVftSCf4OTfwxa9bxeKHd44nzfpT6HznMt0upqxOViR/Ciux5jPp1jncEmjdXG3U1d9IJ/hHVeIp9oookmTXSSXiyYhtVNLzMMsjClTAUuSmQUJ2ihtDKdpSthoNSQ71sY65fJ8fE3Mv7M1Fy9I5z26+ptIvDND5yNl7rKbpK2O7UMNdB6OojVvd9k3+VMPrKtm5jG640217pXkibGsj4o5V5lNg6c5V1OWXCbpYeuc0WoZL9b8Z13VdT8NRH4faMzcfWGNRrDTklLJ8bW1cayPmX6RTPwbu/U8tRB5po/SRtzRnWa5YO7ZbxmKWo5dptKuzSNM+RT11m3TconWWpZGq42INSnmzRVNFjlkpS3KDGPhJdQZ+sbDEzddKryPiaKuTJcTO1cWLMS6FXUy8RF2VGAqo5tpD8YhcrSmqOLaXVsqOJTL0z8RdW6XiKm/LoFqrd1ixfUl2j+BTB01fuox575ul4VHO3z3eHHbwsVddfli+HHhMLPqaRF2lHc9TTNC3EGjTTbXLVeEmKmVuepmZZWyYw9RqSbHmYp6rUEzNxMxL5DtlPqNseZipqNRt7RlZLpmQ9ty6+FhfkGWqS6LK3MSIq3LlMfFclZvCWEFf18QnyKTLWU8+BZQVHKZGK48PMTIrk2PML2kqlro61fEPR18f4TJwV6v8ORKjuS/hKzRctVHcV/CSo69fwmVjuUeJMW4x/hG0VpkrY/EOJWx+Iy/xlHkJ23LDl4RtEa7y9Qa6KnKxjWvPtEF75j3mDtHmW2mvjeIr5tQzfSGLmv3tFbNfveF7ZstxWahm3e3zhU1F+Zo+JjH1V3knXFWIbzyeIl2i5aya+N+FchlKppW25GZgnbLiYtKSfqF0aZXUb5KKkTJRuiXzZK3QpVXNFwkGopceJS8mpyG9OwB+rHQnaIf9Duhf6jof2KmyS0Q95TO9Cf4ndDf1HQ/sVNoD6JD+KKfuqKW2wo2RKApopKoqLwqKAA0n+SsAZBSSg0ozpgBeAYACAADvaIaZQwHNo28pwDMGYiyVSpzDO2vjQAnJzAyZFPLcVy4chtK2R+LIWlPOfswPTNUVVmvVhvFmpZZblTxt5RuuLeQ8OS/qmPv2q6HpDjp7PZmaWaSSGSqll4VhjZsWVv8APdNVpqeTVGtq6+TrlS2+H4vp5f5xfSf/AGY/dNB5EtPymbr1fOlP0PJ5GupbPy+R3DfY+HeY8P6JvTBaGikg6TNQ0rrw1lLDN/0+H943V0raWzW+asrZN1Sx8zYno+FfV53+idUGUjsi/hMu2pr9qzzemKNKa3/8bcF4m+yN03RxVTt/Ht8rLgzc0cTbmP7qm2XntBU3K20vDPWRQTd6KVuIj7K2nn9FIsvuiaDQWn7W22SltqrJ4pWyJz0UcS8EaqvsqVmtBXsoy8RMdBvAqVXvF7JFmiLTahDmTIAr3iKWurVpZOOORl8SrkaJlIbxRo23JchwpaaWlr6dailmWeFu8pptGUrJvqju8phb9pSZaia6WaZqG4Y91eFveU2XRFfGu2nZ47lC1DeqdvPQM3DJ7SmP3/LT4T9kGiTPpM1LN3Y4YY/vZf3R7bfFl1nHZ4ssVpd83skfTUvlmpNV1mOOVUsOPhxX/EVehpZr9rnVd8dfMx42+Fm8S8zfqnz1Tqn0PG8AAEL0gAAMkLAAA4AAGBmdM/hLDo+qsbbc7W/pKWRqiHL6NuYitxEOmqGtN8papOWTzMnusbPKmX1lqJUK2aItpk4iHNEejNPNuVHVU+fdOe3q0Saauj3CCHe0MnDWQL3l9k6lJT5sR5qJZVxZR2W3P20y1UqzUvnaeRco2ZSjudjkXNZYzTI1Roa6x4qzWeobzzf8P7pcXa2rKyzLIssMi5Kyis2XG6uxsnMuSmduVlxjbFTtVTaIWXFlM7ctPLk+KiF+NwW5WhkZmQytfQSbx8lO9XTS6vlwmTuml+bzYlSXLiNdRNxMqlXtTi2nVLppfm4TL3DTeGXCSySZZWHmJkE+6CotslOzcJDqHZBwnTXRoo+JipqtQTJw5EG4VrIpn6qtb4f8/wDmQqhMrypvkzLlvDP1l7mlk28TYkOprWx/z/5kF5SWj5THr28TEN6pmGWlI7yi/wBNMnt+zd4N63iI69W09F0pKbExKgqOsrY+0eibrG/pltHUN+ElR1RUwP1khG6xSLRKhiVBUdZS7KhV5g8tVOVirmWiWqFeX4mZ23Rhtq/LxAMtI93XxDL3eTHmMy9b7w29bw7eYBlfTXmTxEGa6SN8PEUr1XvDLy+0wDKykr5H7xH218niIO9bxBl9QgyleWSeIUtbJ8PMQ8vqFK7ZbQEyuKSdmxLyifhMzRysXlBLwjm7LYUXothORespaCqyxUtoJe6IhUnN0o3JS5d0kRcXwkyCLME36edCSf7HdC/1HQ/sVNoi9Zh+hCX/AGO6H/qOh/YqbRJVHfQ9rJ7AMBvbVQou3JiK10p0+HiHTTsBJXzXmEiteV7gBeYDeX1FL8bSDPl8jgGg8oVeYbmrYV7xn5qiolbhGWpaiXmALiS6R5cxFe7+BivS2zEiO1t3gT7QkukjDLVkz94sorWuPEK8gj8IF/qj2pUT/Diw5BQVjcy5F4tKsXKo3W3SjtMO+qqhYF8PeBWZQ6a1zO3Gqqpl+kq8/FNvpbTSxu10vE3ksOP5PxSfZVi+qtZyPHvrdb2rIfpWk3a/qsYOqnuVV0n0NZdqdVypW3e65csuJVbvd0nbX4y0lvtsNktNHb4eNaeNVaX6Ru8wSVVPBj5RULBk2K5d5iVPxfCQayjjrKd4ZVyViDSi2KzV0vSLDeNzjQ09P5PJLlzcRtK+10tx3flEKy7tslVuXI5beOk67aEkgtc9L5Z5xVhlXh31P7XtHSLBqGj1BbY6qlkyy9JH3o28Jp8qQ9Z+qdFknDwqvhUZk5iUNuh6M085DZRtk4cSVtGcBpRV+2IZZCydCO8ReaL2lW6dZHdOstGiI7xFQq3iIdREWzxEOeLD4QCt2pibSyWilSOOsWFfKJIccjE3W70Nho2rLjVLTU68zMTKOe5a7XeWtay0afp1WSS4TruZKxe8sa91fsmH3r6t3+b9Of1Wq49P6b1PWIzb6uukkNHjzM3L/dNh0fae/gvpOhoW9Iq7yRvEzcxhei7R7XS7R3qtj/i+3yTfF8Uq8TSMzZTMvu4nXMDxXtaADioGIiWjYDmIYjl0bAcxDERQ2A5iGIO9o2M1iK9LIzfk1yJWJBvU60trmZvynm1NXh+mf1aSkqFr6GlmibJWjUU8RV6Ql3Vpjp39JGXmJ6MvKukHbENvETHQZwKpqustcdxhannVWhbmUx9JK2hpttnrVaWyyN8nnblhkblVm7qnQMSPdLXT3SjanqI1eNgJhW1NmhaPbipR1lmburmo5TXG4aOrlt94kastMjY0tXjy+yaTBWVWVlZW4lZRS5c7rLNzcJS12md6vCqnVKmgjn7uLEP4ojAvZcXuOjG4uEyN00e2LcJ9DXKxx8Rmbpp5seU5kmXzTetLeT5ZRnNb5S7iRlY+oNSaZaVWxXE5HrLSm6hyeMlUp5cOuHKxlqqVmY6Bd7XuszD3Kn3WSma5dVMzkN5SRUJykVlIZMVmwkQeZCh6AkACTG/WSFcgr2jysv4QOlLLgPb9iv3qit6oBK8q/wDIN/7JD36hvACR5QJafh5SHtlE7XAJDVHWJ21BFZgzAHQEnq9oAYnotBSJkAN4/UKROIdAAdpuHEsqadsStXq2kiOXAA0FBX4NtVi8pK3PvGLgqOUtqKqw+EqnTaUlRk2JeWpN+2JjbZWZNi3dNpp6VWqIxGZ+iHQvWzL0O6F4v9x0P7FTVSTzS8OTFb0JWuH/AEO6F9qw0Lf/AEqbRaCGLlUvrT3qZ+OnqH+HiYNlBM7GmiiXwqObpfCpyqcZlbRM3wkiCw+NjQnmAO0q47RGg8tthTuk7ATgDiL5JGvKobpfCPgDlGN0obpR7IMgKbDAAGKTsTiU53dkW469q2lXz1LGu59lWbJm/wDrOkL1bTL6209NVQw3ag9eo/yH0ytzKT7WVvNFZTK6g1DNR1z0/kflPdp2+kbw+yXFgu8N7tMNZFwtJwtA3NGwzqHT1LqOhalqmlWFvomxYi3ears2rVrLlLa62F6G5LxRwNyyL4lbvGhMJ/oV0onnFpanyqPihnaoZmhbxEy0ahrLTXLa7229ZuGluHKtQv7rfo+ERReai05S6lt7UtYuUOXd5lbu/pYmPhivGi6ynrKesWKsVd2tTLxU1Uvd3y91joEb5rwkesoo6yFoZVVo25lYaaT79itNdLFr1BNto6yOS0Xbu0U/FvvajbvKbJJcvhOD6ipaHRckdPXQtddOzcTUM/E1L7ULd3mNRYtBVEVLDVaC1bVS0My5Qx10nlEKr4eLiU2TbNfm6diN7owO26dJ+n2+UW23XqNe7FNucf0Rv/STq38PlGg66f8A5aqjY0zTLUt4yDbIYGXpL1P3Ojy7q3tTQ/3iPt1v0h18bLBoVab/AJuujUrrKGW+dBllMC9m6V7i21WqLRZ4270W8mGdnQReL2q/wi1lcq6PvRUzbmMX5F/jXGote6d05vFr7pTRTL+QWTKRvsmNpukfUmssl0Tp2doW/l1yZoV+6p0bR3QnpXSTLJBQ+U1X09S2TG+i81Gqqqqq8qqFermXIdNdAMlVXU941jeJL1co+JYOWGNvZj7p0LWl3t+mtH3OaXzUccLLHGq+kbwlld75b7DRyVlxqoqOlj5mlY4zfr5/pZmjmVWptP0/oYmbimb6Rv5szXepaPGc0vtNUEen9P2+jqaqJWjjxybhy/zkTku9v/DlWQRe9Ipz2p0pb7XUbWWFpf6VjVaatFolpXae100vh4TB2W7nrP8A0utl2t/droG92RRyGtp6hsYplZgXS2m5V87p+jl95SnrOivTFZNvEtcdH7NNJIv7w8+bvyS0UXaKxMr/AKItPou3BayJv5qqZSpuHRjb4rlb6OluF3pq6o4pGWsbzcfe94VzTfYBgZ1ugiqT0WrL0v8A8hiPU9DV4pYWkbWV1xX2l/ukVZarAMDnezRtyi//AGu6v7zR/wB0cXS9yT/9ouf/ANf90VfLoGBmbhF8fayo7HOvyOP5VJ7WJQ7dHzN6xqC8z+H5Vjj90tujalWl1tqGl3jStDHDjI3My/5jNnh+mb3nMt9HS4VlRNj6QkI5Mkp8FIu1MT1Zp5VGwADqBvagnAewDAB1X3K2090o5aepjVo2MbBVV2i6xaGqyqrG3DSy/wDDr4W9k6BtiIdbQQ19O8M6q0bAJJj3M8O+gZZadvRyeJSPJT4lDSUU2jahliaSe0yNytxbn3fZNJFLHVR7JImVo2A6vnp8yDNS58LLkXzRKRWiOZR7LA36xqzNipzO/wCnMo5lljzjO9V1Grx8pj9RWv5O3CcTy+Q9YaXxmlVV4TlN80828fJT661VpRaqNmVeI4zqjS7RM/m+Iz9lN893Ciank2qyla8R0q/WHPPh4jC11A1OzLiQqQpXQb4/ESnVvCM4N4SWQQAoSGTlHmR4BMPcgyPAAPcj0SAAAAACAAAAFnsUWTFlSUWS+cAIMXXtJkdPy8JaU9rjfulpFQRouOI0yWmdSg9kTtpVUvJ6VVb8BDkp1XxAJVu1MBvMcfm2qMt2imSIX5SdST8XEVaPiSIJesqWmkoKjCZcTYaeqm8oXE57RT4SKai3VuGLI2LCIdl+tXQl+J3Qf5v2/wDYqbIxvQl+J3Qf5v2/9ipsge4AAALQAALOAAAAAACfaTogAA6MmgFbeoSVcCCxCCzlOzWXHNTRL0b6xWqnyXT9yyaSfHzdLN4fd/eLqTUNti/lkDe7NH/eN9dLdS3ajkpayniqqeRcWWRcjN03Rjpalk3iWGhyX+ZJZbJtQ1V3wxWjpZ7j4mgXhUq9lLqS6ZyLp9oIe7LPUY5fonXoMYo1jjjWKNeVVXFVDamSksD5XA6bQWsdG7+4WlqWW3tJvGtc9Rlu/ZjkkbhU0Gnta0eoJpaVY5aOuj9JSVK4sv8AeOmVsXWYnUuirXfsd/DjIv5WLhk+8HZNNG7laKW80s1PWR72GRVXEzOiLbWdHWq/J0yrNL3DJV/mWbvL7PskWRtUaGqGVpG1HbV7zesr9rvE66ars+o9M10dLdoqOu3fLOuLR/ZHk9fZ2E8xOM6evnSLFY7fIlZSXOGSFV3ssfEyry/rFgmt+kX8vo+hn8O4m3Zpm0K83VsQxOVxa912vNouBf8A5yif4e67l+HLTNHF/wDKyHmtF+N1he0TtOSvT9INyxkbUUFn/mKalVsftMxX12gqhoVmvN8rru3eWSRo1Cqy5l0C+dKOmdPs0dRdIpZu7FTeeZvu5YmTuHS3qC6VSw6d0+8EP/HXBljj9nm+0VOirHS26v2eT08UTeJY8TZTpxcRLejOc3LRk10m2Vmoqx7hcPyfF5uHxYr901mnKfGjx8IX7lh9nImWBMqPLxHC6Z/UkTb7EttMJ8jI+qIvPR+6SLAnyN/eFlPvo0UHJtHxqm9Go6UE/ote0i9HlP8AH10u96eTew5eRwrjjy8zL7LN+qVOuNQ/wf03WTRM3lkirDCq+JmU6FoKwrprRdptari1PHlJ7UknnGb7zMZ+t0rLZwlHqiqxt7GkdDA6wr1lqNsKN7xn6v5sztPD3aeEnoeZnvGeraqTTWqKG+RZbnJY6pV/KL/ljTYjM1JHVQtHKqsrGrzvNJe86l1LakctLHNE2Uci5KxXyJixj+jfUbWG4Jpmvkk8jmbGhaRe99Gb65Uu4bLunqzTwe+asGR3YmDCS8oli0xy4mEAHaIk7aeNl83zEOSlZG4iRG2BOpGjl5lOGmVDJErLi65RtzKQdtrjopNs1M26VuaLummqra2TtFylbURMvMoHV+X1BsTP4R5olDE5omUGZM1Ke5UG9p2NA8RFmiyOlqXNb5Y1WnyxOY6o0utVGzY8R9DVNEs8bxuvCYW7WHz0iqvCJMoVL5R1Jo9kZ2VTmd80pJvn4T661JoxmVmVTl980O2+fhEqU3zXWWNqVuKMpaqlZW5TtmodM4ZrjxKYG5aemRnZVM1SGDeIZ2pgXlXQcTY8LeErainaL4clECIJPdp4ZzgBR6kTACAPcQxAPAA9xAPBcSZfCKWLMsKCibJcVAE0NFxcpdUFFl8PCSrVa5JZNq48JrKKwxxfDliAUNJQKnwk5qJUXaaBLdGi8pX1cWBUjN1kSpIUtY/DtLS6S/KGM/UygEd3Gxva2QL2iHKXtHohle0cXq2ikSoJcW2lxTV+KqxRoSImBzL9nOhP8T2hf6hof2Km0MX0J/id0L/UdD/Z1NoM9cAAAAAAWIAAAAAAAEAAC6BoBZ5t6hkiQABgAAAd0AZgAV1BruCNih28RfXH0JRs4GmlPdOor4rHbapt5PQxSyeJlLK5JkyiabF8RF/kymRcC8OR6AFJlL5CMATIcxDEpI76PCqvkvyF+EtyqvKfIZRC60z+lvnJTSV/ptpndKJ/GSmkuHpjmcjtM/qDgpVbwllphMrbGVmovUS10t827DpVbqRPlCkizRfI/tEfUy/KFLCzL8j2nZkqwil4VUkK+SkVEFVlQtBQz1T8sa5B1aZ1SjqqKbUfSdZ7Sno7b/GVUvdZl5VO1RpipynoLszS0d31NURss14m8zlzR06+jX3eI6p3TJ1u/KHfKxaC3ySd7lU5XVTtVVDybWzZjWdIF33UcdCnpG4m9kxK9W0z1TT4yWeZHokRukoAA7JezpGuFBHcYd3LzcyyrzK3iVjXaE1bJdoWst5kWK6UsfN3ZF8SmaM1qyWutfkN4tbY3CjmXH2o/Ceh4+unnevlmdOyVFE0EmLL7rEfYmAzpbWVHrm37WikxuEK+epG5oyU6dZ6M08k0ebeXaK2idvUWKZ3rZDyyyd1sRvYmfwgiCBbUFU2O3NsiRVUqzx8PMVMDYfCToa1eFWAyHNaJEXJeIr9q4NtVjXLxKM1Fvhn5l4vEJoMntQjuhoKmxyRfCycSlXLSsvMoaCpeIq6ygaoVlXE0ElPkRXp2HSyxNwszSq6yL9oyN20orK3m8jrEtPm3KQZ7Wsq8opOy+bdSaFXYzMynLdSaSxyxjxY+vL1pTfq2KnPb9ofOOVWj+0TqUnx/eNLtkzY8Ri7nZpk/wD8n1RftENFllDw+JTnN40pGjNGy4sQqS1LgdRQboZSnOoVWl4/KGVlUgzaZVG4Y1YhXm45+tOPR06/hNxHpnr82SE0z/MqGTsH5Ao21OvhOhbdMqy+jUo7lY1VWVVxZRcl0yclP4RtYi0koJEEx0uDfhDJjNNSs23FVNFaqDe48I9YLNJLJtkxxU2lu095LJHUNwx94bIN2KxtivMaaC1xou1i4t1Eqx8KrjiKqIlX2R8l7TP1yLBGzcph75dN0r8WLGqvteqQy5cqnMbhVeVVDN3TjiHWVDN9oqZ3ZmJVZUcJX7JchASAASOeXtHF6to2vaOL1bQBS9o8vVtGV7R5eraIH7SdCP4ndC/1HQ/2VTZGN6EvxP6G/qOh/sqmyLy9GqAAAacAABQAAAAAAABAAAA0As829QyRIAAAAAAADdoA3aAVty9GUu0url6MpdoplXcXxPKD0W0YuTM83ESKBPNgExOU9PcfqDH6ioeAADgES6U7T0ciqTF7R5pY0hZnBztMjpiLC5bcl5S6uHrDjNqlheuqZIl4iRVr5ziEcZ7UXqu0sdMfN6lbf/Q7S00x6jsAK3UnrGwtrEnyPaVOqPTxltY/VdoOSmbUxMX0lVFZVU9rstB61dKjydfd736ORuDK9GFtk1V0j3fUFbl5DY1Wno/DvOLeSfumT19Ptls8Z+zs2nrRHZrTS0aKqrDDHCuPsqSqplpaeSRuVQgqMlUo9aXLyW1sv0hD9PQmdOb3atavuE1QzZ8XCQ17QbiFIQ/6aZk6eYnoCrAAAcAgXul8stNWvLJu23beFieeYZLixo8vrTP6/kJE1VT0d8tMm4rGjVpF8XiVveNZYtTUeoKfzEnyqP00TcLKZ3Qks1VYd3LJl5PNJD91sf1cRV40pHVVXllHI1HWLyyqev5vBqWwZRvahQ2bUc2Xkdzh3FRHwrL9N7RdeUKylkDbde08PW69p4BzqN1jjPguRGF5qATrZdG3m7lbh7pdL2mULO2XTDzcn2WFMvRieljn5lHI2zFiFVFVZllj4OYp6i0TK21cTXiGU5rIYOalaJsXUb3RuJ7bDOvEqlXUWPDPFTpGXlolfulDeLCssbcJtJKCRGG2tsjjaGXFbzpLyiNlxOe3rQW9yzj+1ifUE9jjRsmUobnpKOoVsVFJl8l3Do4j37+b/RKtuj2PL0bfdPqSr0KuXdKvboNcv8JItS+dYuj2Pm3f6I4ug4/o2PoZNC4L/hIdZooMjL5vvGkYYI/R4nM73aMZGPpjV1hVYZMV4lON6itG9Z2VeIlUpVLjdZTskj8I9ZLC1fNky8JsJNLNLzYmg0xpnij82Ey4b0xpzBdjOvD3VOiUmlPKqfijX7pcae0tnucl7psIrX5LGvKNP1DlNRRNQSNCy4lDeqrcK/ibhU32uLQ27aoT0kZxvUF3zm4u6OGX1VVSYuuRh6qoxXFS2vVbJUVD5MZuolbLbkY6BmeXJto2K29Qknp3IAAAx5e0cXq2ja9o4vVtAFL2jy9W0ZXtHl6tokh+03Ql+J3Qf5v0P9nNgY/oS/E/oH836H+ymuTl2mnWXoFAAHQAADoAAAAnH6gx+odPNvUANAe7Tw50Enm3qDb1CR+JAAAABS9W0SAAs829QkQAQLl6Mo5C5uvoinFMoq5/PbSZbH4SDWJnMxOtyeb2gFgqLiK2oI7p7mVkEgADnKXq2lXfPU2LBe0rb56kwEVekvTuX1x9KZ/SHrTF5cpV8oEDO6i9DtLTTXqOwq9Rerlppr1HYBMqvVHplLqx+q7fdKXVHplLyxeq/ZF/K/nKr19fGsOmauoi4qpl3cK8uTG86MNKLovRNvtbcVRjvqiX6SZuZjmtNRLrnpRoberb+32XGuqFx4cvCd17p59/am7zl4iYnNdZXdrjcGjVvNx8JtNUXT4rtsrflG4VOWs7SszM2TMI2ecmcARMBZ5gI1/ksAAE/wBAAAHSwAC3n+k7/JOjn3F2vtH3d5HMvuspqjH2Oo3WrqiHHmpcmNlsTD4T1/P8vBv9ZQ6i2x1FUs0q5Mq4qSI+Ac29Q3j9RoZjoHi9W09A5AADdoGJy+o8ENzCQC2tt0alkxdsozRQOsq5LymMLO1XJqdt2/oxQ0oHiurRqysekQBYgWKEeWijn5lK+e1yRfCy8SlwOJyho2WbaiZutQ+J/dNBtiyG/JPaE0TLP1FjWWPiVWIaacj+jNVuGDyX2tgaGWRm09Hu/RlHXaebixXI6FNTlTV0ubPwhoVL571lp5vKJMV5jj+ptL8TMq8R9Sakse9kkbE57eNKM7NiuQIZfP8AFpmTwmq01pJvhThOiR6NZF9H+iaK1aXWCNGZRy5Zmgsa0sa8uQXJFih4jZT0EcStipz/AFdXrBnGoFqXOdcXdos4UZcWU4DqydYqxuI6Jry8slRI28OO3y5b+b8PEJVJs7W1S76fiKXa+TE6s9LIRcTNQNgKwDBiZywAABYAAA4vaKXtEr2il7QD9p+hH8Tuhf6hof7PGbXAxPQn+J3Qv9R0P9nU25TtaegQAAUAAAAAAAAWebeoMz0Aa2nh7tPABoEABkgAAAAN2gDdoAzt6g29QbeoNvUKZBufoSoJ9yZt5j3Sv28IBR1XBUMTqP0e0i1DeeYnUfodowLPcvqPAKdrIAABwPV7St1E+NC7FkvaVOpH/i9hwqdJP8qYuq31pSj0h6wxeV3p9ogUepPRFlpj1HYVmoPVyz056ioGmlbqTjmUkT6hj0xpusuksixLTwsys3iI189PtM9fKBtX6s0/pFo/MrN5VcMu7Cq8P2WyYzet5Wl0roG0e1k0i10qvnC9SeXTN3uLunSGUchijpaeOGJcY41VVXwqQ7lVLRUbTM3KZZapYfpCuUctVuUblUxaSkq6TtVVkkjd5iGsQvW7zk8neHl7RK9o4IsQAHuP1ACgAAAAVGmTHPelTUdRWTUujrJJ/GF09NKvNDGPNEWmlr9De+lSjkgVlhkjanjZu8zN/hOuNxHJ75pePSWk9O09OqRSUddDu8WyOqR8h7X+bmpeF7//AEG08ADQyFCT2KVeVh5omZeEDorcI3tcedGVtuSjO1sQMYAfxX/vDFf+8AE5T08yDmUULK1XdqNmV8mjY0kEqzx7JEbJWMKWVqujUUm1W9GwBqx1EyI8Eqzxq0bcJIXq2kQViPIgnMeRxTm90KxFY/UGP1ETmdsQboVgKxAiHJErKQ56ddqlttTMZkpcgDH11tyqH4Slm08rybW3anQttBxcpFmtfexHcywa6cX8Pm1G6qx7qPlN01t4fRlbU0rcuIaJly+9U+47pw3pGrWiabA75qxMJJV8J859Jj+kHTqXzvra5SeUMrMc5rqrOZmNtrT0znO65my2kLZ+obPkzCD3aNr1bSHSHgwABTgADAAWAAAer2il7QXtHF6togftB0J/ic0L/UdD+xU2xiehT8Tuhf6hof2Km2KvRyAACzgAAAAAAATl9R4AAAAAAAAAENAADFAperaJAAWNSCkCXtOUFDcPWCDJ2k65em+yVsnKJlzqrmbKRyZS+iK3bzbS0g4I1KCSwABzgAAcPF7Sl1J6i5dL2lLqT1FxCq3SHpnL6t9NtKPSPpnLyt9LsAjP6k9X2Fppf5v2lTqT1XaXGl/URarK8yz+prlHS72Z+WFcmLj/ALP2npJaO46suMfy65VDbvLuwrynP+k6Jr7cKPTdKu8mrJlaSLwr/nI+lLNbY7Na6WhiXdLDHjief61qnoTH1WWyXIx+vLksEa0qN5xuY01RULTxtIzYqvEct1FXtX3CSTLJSK8yrcQxPQHbJLRMAAEEFFnmApe09EKawHF7RWP1Ajqsckj8KxgOqXWWraXRdhmuU8bSyLwwwRc0jeFSj6HNGzb6r1feF/ji7N5Rxd1ZOLEztkRelzXcdZPDlpm1yL5O2XrEniU7pBTrBCsaLiqripp85Zb9MsT0tVW4obKviuUf6ORvqZ8oY28SnMelzz81ph8LTTfdjOgWKfyi20cnihVj2fH6y8a6+yeAoSV0k82cI9FUNEvCR2YSkvEdVW1MsdU23IKizd6NitSXBuHhLa3V7O21XYArZqKSLmUjtwtiazBZeYh1mmaWvVfOSwSeKJgDLyPxDi9W0mTabrqWTFZI54e6zcwzJSyQekOyEcSnMKbtEpzHCri1XJqWTFuU0VJVRzrtxYxKOWFtr/JZuLlJGbBHHo+0hwSrLHtZeJSQrkuqTSSA0jc4ETHQABwBY3tFI+QAY/UDIKAQIrIVNbT+eNBgQ6mLiyxFI4/rKgZqiY+a+kigklabHun1lqiiaoqJsVOE9IFhwkaRV4WKudnT4x1haJnmlOY1dOySNkfR2vrNuJHZV4TiepLbup2kx4WJ2862PeIZ2JgTpk4sSOyEC6JBBWAYCm0WeYnoAYAB7j9QA4iDiIJVBxYgT7T9luhB8uh3Qf5v0P7FTdHIehOvqKfof0HxZfxDQ/sVOgUmoVb4Vk4WGeyvgIdNXxztirKxMGyUAAFCAAAAAAABAAAAAADENAAAUCl6tokAAG5O0UvaJmOfkKO4emb3SpnfzbFtW+mb3Spn9Gx0ivbmLCD0ale3MWEHo1AFgADqgAAdygUmpPUnLraUuofVWE64r9HelcvLj6wpR6O9K5dXL02wCKHUfoVJ1mr4bXZ5qqokWKGFd4zN4Sv1E2EcZnb9O2o5Lbo+nb5wkXyxvo4eLIzerd4Rqll0B6UmvOor3rSsjZfKmaGly8J3rb3mbmYi2igp7Tb4aOljWKGFcVVRVyn8lo2kMr0Nf1n9ZXTdQ+So3E3MYlu0mXStasrJJGIYKyTj9QY/UKDAVX+lYAiHp6vaBNHEThDAcXtPRAawOY9L1+mrLhT6Is8kvxlcI8qiWLmhhy5mNlrzWVLoiw1FwqG84qstPH9JJ3VKvoe0PVWm21F8u0m9u12bfcP5MfzlK7y1WkNLUekLLT22gj3VPGvKaBHI+A4vaeh5+bzfW2R1BB5frSrjyx3Nrmk972S80B53S9DJ/N4/pN/eItup/LNW3+oyxxhjpcf0shzo4iwsLR/RzMpv82PrVYCWQUjdYZlMlkyyDeP1EhkG8DipnINlQycrYhtQN2AWlsvmK4y8xfU0qyrkvEYnDEmUVbNB8OEgBstpDkpY5fSKRaS8rLwy8LFhFKsq5K2QBV1FjhlXh4WIM2npEjyTjNEgs5RWOmoJIFyZRo2O2JXXFlyUhz2aGXl4SZlTbro1E3FxRmooqqOeNZI+Izc1jmRtuPEpDilmoJuFmVlEO3W99kbnrY4l4jJ/HlV4hnZVSVDcbMwrmmk23fi4CRTVjStxGZibrJkNQy8o2TaaiOXNRZnlr5F7xOpKhpfgyFGlsAyj4jxExxe0j1S5LiSF7RLIAZe9UCtHtkx84v6Ry/U1jWfeKy5Kx26elWVcWMffLMrs2Kj6yWnx30haFm84uPD3WOC6o0o0W8jljPvbU2mVqo5VePI4LrzQGG8837rE9aY6nT43vFjWlZ+Ez7wYHctRaZ3EzK8ZzG9WNqeqbdcrCZQyyrKJx+osJ6OSJuJSLiTyWkfEMR7AMBXSUXrHkQEQeVAcoJEo4i9YperaOIgDL9YuhyLPod0D+b9D+xU1E9L4TL9DEv8Asd0D+b9v/s6my2Sq4z2VTE1VBUcOX2S6oNRyRcM4pFXwjb0SylitBSXGGqXhbiJiNkY/yWaDiXImUV5mi2bVflF7IaQCHBdIWXLIlJKsq7WXiGIUAAAIAAAAAAAaAAGSAperaJFL1bRQMCLNLwkshV3Cu1gCluDfKCrqfRbSwqeOTIra6XzZWXP6g94sIvRKQU5tpOi9Eo4/h0BICDtAAAd14jlHqJ/krl4iFHqJPkriBD0d6Vy6r/TbCl0d6Vy6r/TbBarLvnLL6yrY6Cj3z8sa5Gg6GNGyUttmvl0jxuFdkqxt+Rp+6v6xk6TTcfSfr74tnyltNtbKo4eFm8J36mp1p4VjTlVcTHVaen4zkynBxGP1NeZJ5mp0bFVNJfLpDbqVsvSNyqpzuadmkeRu8Koj4AOnmJJXTw9xPRYH0bxBUFY/USI4usB0lUwDbwRtI3KvMPYHLelDUNdeb3R6Is7bqasVmuFSv5GPvKCXaRdLRTdLmvGvU6vBpe2yMtPBIvrE30n2TsypgQdOWGn05Z6e30saxQwrjipYbTZ5SzXeikXrFgIkbCN2NksNIelqfKnuNU3pJKzi+zHiR9DeYpbjTtzR1khcWCJYrHG30kjSfpMomjtq0ckzL+Wk3hplNYnm3qBeraG3qOk4Zbr2nh63XtPDlNHAeYHoHCGtoL2htBe0AcywHqavkibhYjuNr2jBoqW7rLwycLFgkquvDxGTXq2kqCtki5WANOBXUt3jlXGThYmeVRtysSKdI01FDK2TLxEkACA1ohZeXEZ22Ze4xaigCga2zI3Lko4tBN+HhL5F6xxe0TrsqmC2yY8TE6CLBVJGIRcHwiqBe0kRDA6jiHSl7T0aDex+IAHK+sp1lJklbCq8TFftuVP9IBaZfUFjZ1bFeI5jqDTnlG8V1O3SVtLKuORn7pY455HbYosyh2XyHrTQG/kkXd4+0cV1JoCopWkbbHkp91X7SitJLlGcn1RoVZZJV3fCcQ7L4luVhmiZvhj4ShqbX+Dbw4sfTGodBKkkq7s5rftDzRMzIuS+EUuXG2p2iZlYSyl9eKJqebarKVvkufKRTR44hwe8nb/zDdCglUJEadYR07fhJUcXWDnafrB0OWib/Q7oH837f/Z4zUSUE0S5EXoO/EroH837f/ZYzXTLmVeyyKVUkUm3IlQVCs3DzFhVWiOWRm5SpqrRNA2UfEWmSrSKXJRuelVyrirZImxcmRXRdjYsHU+0PJ8BUVVJStwsSo5YXB4o5fhxOOplJcVlXbkTklVuUze2lkibJOUIqqaJgDRgV1Nd1f4VkJkVUsvKAOgAA52jQIAsEyEFgAoBCr/VGJpCuPqrDBn5uoq6zibEspWKur5x3Mm4EyYnJykeiTiYmL2g68AAHc/QAAAoKLUPqjl5tKHUz404lUaZRdJcMzEXXWo2tfk9HRqs90rm8npY8scmYe09W0trp6msrZtxRwqzSS+EsOjTTM15rNms7jG0ElQv8XwN+Th8X2v3SHrX1bvHzaros0V/AbTqUs7LPcJPOVE/iZjWTVC08eTcpHj81zGf1Jec2jhi7q5MYZa1Deri1xrHburylXtRsiVNLxDLcQ/aEyQA7gKSI4YbEzE4DwA7MmcB6JAFbJY4IZZJWxjjXJmAyh11q2HRenZ7g/FN6Oni8UjcK/pYlL0TaCqLJR1d0vDLPero28mb6P2TO6Up6jpc1y2oK7KWw2mRo7erflJOHi/VOzRpusVUt5zpmuikXrHMRtG6xzI1zOWOqGIzW8FDM3hVh8YrZf4puLeGFi8p9o5YGZrDTf0f/wD0YnYCdMUuVjtvtUcLfaxLJ6XhNBUI829QpuvaJ29QJcMt17Tw9br2nhymjgABR0hiRsBRX3K6eSy7vcvL7URFXU1KvpVli96NjuQvNvUN4/UVO3Vdp7a6JfeYcj1NaZeFLlTM3h3y/wB44FsvVtPSAl3o25aqD/rL/eFR3ajlkxWqg/6gBMXq2jiysnw4lfNfLfBJi9wplb+kUZ/hRaV57lSL/wC8rAGgprpNEv4eNSdHfIWXiVlYxsms7DT892pf+oQ5OkfTMX++KZvdYA6VHWQyrkrD0THJ5OlWwxclRv8A+j4hS9Lasu1aW13Oq8O6p2/unKK69Ew4vacrouke4VWX8U3Cm/p48TUWy/Vkq7ZJV+yxBSWtPMij23xm+FccSK9fI3eDI00UlVGneI813jXqM/tlZ+8w3kKNLia8yN8OJDevkl7xDX3g2uqcwDtHGnkbmYbXtG/Ko/EORs0rYpGzDZHael7boFqqdWci0FmkqMWfhUvooliXFeEUTTP3SzK2WS5GJvOmVZWkVc/ZOqPFkQZ6COfu4sZqK+dbxohWkeRY1b2TleqNCsk08kS8PeU+vrlplZc2VfumB1ppmOns9bI8OXm24hO0PifnnfNPR1V+q41jyWMpbppzcQ5RRnaNIac+NKy61GOWMgnUmj13bMkeLCzRK8nz61tkfu4EfbRSK2OJ0i4acaJm4cTP1lrkTugzVLOpSsnMSEiLBKLHnHPJl8IIVL9XOgv8Sugfzft/9lhNtt6j5h6FemrUmgejXQsOuNJz/E81no1hvtkZqhVjWGPFpoW4l5uI+iNMaysetLPHcrDdKa50cnegbl95e6O9tYYiWThHMvqDL6h06pU1lrjn7uLFPUWaaJuFclNaIRBhMsjAzQNtzViVHWq7F5WW6GdeXiKWe0SRcS8oGSllVl4Rl0KtpZKdsSVT16su1W5gIVJFlyhHUTU7EhXDYmZbJ0qku/dYsoKhZV4TPzUHejI6S1FK3eJdI1oFNRXzLhctoqiOVeFhKpOnoHm3qEnZlwIVt2ZuVeUsirujYNxeE6FHLwrkVc7ecLSofesZ26VGMzeyOZYbK2OlhZmK24a1oaOPJmIPk8lfymZ1Z0e1j0b1CyS4+ECf1ZVHSZTytsWLJmGdmupGbvHL7ZbZLXck3+bLl3jqEVmp6+lWRBzflqLBqaG6LtjZsJC+WVXOU0kUlmuStyqbigvkMvw5NiwmtOr53xMPeqzzlRJUVSU1PHzSyNiqqXFyu7NHu4uH2jG6W05WdKVyq5KqSWm0rSzLu4l/l0i5fq8JD0U8pPaOsq9Ll8WoqYWi0rbZFZYG4WrG9r2eE+gsOXFVRV4VVSLarRS2ahho6OFYoY1xxUkVlVHRw5MZqrTdKLeLlHQU/FzMYeoqN/I7eIlXCvasqGkdsvD7JDwENMmcQxHAAwFYCRYKgAAADlnSNfKjV+oqHQ1iqGVqjz1yqVX0cP0eXtGq6RNaw6N0+7J526VTbmjpF5ppG4eH7TL94T0RdHsOmrPVVleu/vlyk8oqp2bJsgT7WWus1jpbDb4aOhjWCnjXFVUlYD2P1Bj9Rs82P1o2iAyDiIDIXZzO2XHulTqKt8j03eWy/krFtInDtM3rRP8AVG8f8uw5HQNLRf6t2v8A5OH9UtNkWS7SDppMLPQr4aOH9UtkThKhU1lF+UT7pBxNFuinrqVoJNvhYqVBbhE5fUKcQOYtBWyn3o0Pq4A5T2hZeYkfwWpZV4+JQopyyily+HhF0FK2grL20cX3RKaFsP8A4bB900DPiCOLNaKz8mgrC3+7YPukWXo20/WR7Y5bfE6+0ahJRS9o2Qw/+h/TP/h8S+6obOiLTvdoYvtKbUDgYT/RTZYm242uBvaJCdGdt7trg+6bUdibrAzO02lmpY9kcEaxKvdUe+IKk0iOLAM18TVHhD4mqPCaLehmSc/LO/EtQKWzVDGgzDMHGfaw1HdkRRP8FqqX+VY+6qmizXwji8AhmbXQ8j89UxIi0PCmOdRJL9o0S9omSshi5mGmiq+k0pQ08m8ZWlb2iyjpY4lxSNVUh1WoaelXmyYp5dTM7cPKdUmWgeVYiLUXylpedsTk+oOlaasqHttip1udYzYrJ+TX7Q5bLbVLI0l0maes8K8q/ZEddAm1XDvMVjbEsLdcaev5G4vCYUnWqqalrFbukql2W220+S8Jzfpyqo7D0d3aolbiZcY/eOnQOssasveOH/8Aa9rWi0TT2uL1ioqFYw+v1bPOdOR9F2jZE0fT1DLjNUSM0jY8ykrUGjMo382dU05a1t2m6GjZfOQx4sM11LvY2Un50a/J813nRvN5sxNXpLCZ/Nn05dtKMzMyqZe46K/KLGX1p5/r5vmuv0pumfzZn6y0SU7cK5KfRV10fwtw8RgblYY0kZWjxBhqX//Z' # 如果您已转换好，请粘贴在这里
+# 背景图作为可长期缓存的静态文件提供（见文末 CachedStaticFiles），地址带内容哈希，图片更新后自动失效
+# 挂载前缀不能用 /static：Gradio 自身的 /static/{path} 路由（logo 等）会被遮住
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+STATIC_PREFIX = '/ladai-static'
+def static_url(name):
+    with open(os.path.join(STATIC_DIR, name), 'rb') as f:
+        return f"{STATIC_PREFIX}/{name}?v={hashlib.sha1(f.read()).hexdigest()[:10]}"
+background_jpg_url, background_webp_url = static_url('background.jpg'), static_url('background.webp')
 
 # ==============================================================================
 # [CSS修复] 增加对 .gr-form 的样式定义，解决控件不透明问题
 # ==============================================================================
 glassmorphism_css = f"""
 gradio-app {{
-    background-image: url('{base64_background_url}') !important;
+    background-image: url('{background_jpg_url}') !important;
+    background-image: image-set(url('{background_webp_url}') type('image/webp'), url('{background_jpg_url}') type('image/jpeg')) !important;
     background-size: cover !important;
     background-position: center !important;
     background-repeat: no-repeat !important;
@@ -24,7 +41,6 @@ gradio-app {{
 .gradio-container .gr-button, 
 .gradio-container .gr-box,
 .gradio-container .gr-input,
-.gradio-container .gr-plot,
 .gradio-container .gr-form {{ /* <--- 新增此行，核心修复 */
     background: rgba(255, 255, 255, 0.25) !important; 
     backdrop-filter: blur(20px) !important;
@@ -38,80 +54,96 @@ gradio-app {{
 .gradio-container .gr-input-wrap input, .gradio-container .gr-input-wrap textarea, .gradio-container .gr-slider-input input {{ background: transparent !important; color: #FFFFFF !important; border: none !important; box-shadow: none !important; }}
 .gradio-container .gr-button {{ color: #FFFFFF !important; font-weight: bold; }}
 .gradio-container .gr-label, .gradio-container .gr-info, .gradio-container .markdown h1, .gradio-container .markdown h2, .gradio-container .markdown p {{ color: #FFFFFF !important; text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.6); }}
-.gradio-container .gr-plot .plotly {{ background-color: transparent !important; }}
-.gradio-container .gr-plot .plotly .xtick text, .gradio-container .gr-plot .plotly .ytick text {{ fill: #FFFFFF !important; text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.7); }}
+.prob-chart {{ color: white; text-align: center; text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.7); }}
+.prob-track {{ position: relative; height: 220px; width: 40%; margin: 8px auto; border-bottom: 1px solid rgba(255, 255, 255, 0.5); background: repeating-linear-gradient(to top, rgba(255, 255, 255, 0.2) 0 1px, transparent 1px 20%); }}
+.prob-fill {{ position: absolute; bottom: 0; width: 100%; background: rgba(55, 126, 229, 0.7); }}
+.prob-value {{ font-size: 1.4em; font-weight: bold; }}
+/* 模拟排名表：样式集中在此，避免每次响应重复内联 */
+.sim-caption {{ color: white; text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.6); text-align: center; font-size: 1.2em; margin-bottom: 10px; }}
+.sim-table {{ width: 95%; margin: auto; border-collapse: collapse; font-size: 14px; color: white; text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.5); }}
+.sim-table th, .sim-table td {{ border: 1px solid rgba(255, 255, 255, 0.3); padding: 8px; }}
+.sim-table th {{ background-color: rgba(255, 255, 255, 0.25); }}
+.sim-table .user {{ background-color: rgba(212, 237, 218, 0.3); font-weight: bold; }}
+.sim-table .cutoff {{ background-color: rgba(255, 248, 196, 0.4); color: black; text-shadow: none; }}
 """
 
-# --- 逻辑代码部分（无改动） ---
-EXAM_CONFIG = {
-    '事业单位': { 'written_max': 300, 'written_mu': 160.0, 'written_sigma': 25.80, 'interview_mu': 74.0, 'interview_sigma': 4.86, 'score_formula': lambda w, i: w / 3.0 + i },
-    '公务员': { 'written_max': 200, 'written_mu': 134.0, 'written_sigma': 6.47, 'interview_mu': 74.0, 'interview_sigma': 4.78, 'score_formula': lambda w, i: w / 2.0 + i }
-}
-NUM_SIMULATIONS = 10000
-async def run_simulation(exam_type, total_participants, promotion_slots, written_cutoff, user_written, user_interview, *opponents_scores):
-    config = EXAM_CONFIG[exam_type]
+# --- 逻辑代码部分：模拟引擎见 simulation.py ---
+# 设置环境变量 LADAI_CACHE_PATH 可把结果缓存持久化到磁盘
+RESULT_CACHE = ResultCache(path=os.environ.get('LADAI_CACHE_PATH'))
+SCHEDULER = LatestWinsScheduler()
+# 模拟在有界工作池中执行，不阻塞其他会话的界面事件
+POOL = SimulationPool.from_env()
+METRICS = Metrics()
+MAX_API_BATCH = 1000
+COHORT_TABLE_ROWS = 30
+def service_stats():
+    # 运行状态：工作池排队深度/等待时长、结果缓存命中率、被取代的请求数、各阶段耗时与计数
+    return {'pool': POOL.stats(), 'cache': RESULT_CACHE.stats(), 'superseded': SCHEDULER.superseded, **METRICS.snapshot()}
+async def simulate_batch(scenarios):
+    # 整批占用工作池的一个位置，避免批量请求挤占交互用户
+    if not isinstance(scenarios, list) or len(scenarios) > MAX_API_BATCH:
+        raise gr.Error(f"请提交场景列表，单次最多 {MAX_API_BATCH} 个。")
+    try:
+        return await POOL.run(run_scenarios, scenarios)
+    except PoolSaturated:
+        raise gr.Error("当前使用人数较多，请稍后再试。")
+def render_probability_bar(probability):
+    # 用纯 HTML/CSS 画单根柱子，替代 Plotly 图表，响应体只有几百字节
+    return f'<div class="prob-chart"><div>上岸概率</div><div class="prob-track"><div class="prob-fill" style="height:{probability:.2%}"></div></div><div class="prob-value">{probability:.2%}</div></div>'
+def no_change():
+    return gr.update(), gr.update(), gr.update(), gr.update()
+async def run_simulation(request: gr.Request, exam_type, total_participants, promotion_slots, written_cutoff, user_written, user_interview, *opponents_scores):
+    # 同一会话的连续触发只计算最后一次；被取代的请求不改动任何输出。
+    # 精确模式、进程池与排队中的请求无法在计算中途停止，算完后再确认一次，过期结果不覆盖较新的输出
+    token = SCHEDULER.begin(request.session_hash if request else object())
+    try:
+        if not await SCHEDULER.settle(token):
+            return no_change()
+        outputs = await compute_outputs(exam_type, total_participants, promotion_slots, written_cutoff, user_written, user_interview, *opponents_scores, should_stop=lambda: not SCHEDULER.is_current(token))
+        if not SCHEDULER.is_current(token):
+            SCHEDULER.discard(token)
+            return no_change()
+        return outputs
+    except SimulationCancelled:
+        SCHEDULER.discard(token)
+        return no_change()
+    finally:
+        SCHEDULER.finish(token)
+
+async def compute_outputs(exam_type, total_participants, promotion_slots, written_cutoff, user_written, user_interview, *opponents_scores, should_stop=None):
+    started_at = time.perf_counter()
     total_participants = int(total_participants) if total_participants else 3
     promotion_slots = int(promotion_slots) if promotion_slots else 1
-    if not (2 <= total_participants <= 9 and 1 <= promotion_slots < total_participants):
-        raise gr.Error("输入无效！请检查总人数(2-9)和晋级人数(需小于总人数)。")
-    opponent_known_scores = []
-    for i in range(0, (total_participants - 1) * 2, 2):
-        written_score = opponents_scores[i] if opponents_scores[i] and opponents_scores[i] > 0 else None
-        interview_score = opponents_scores[i+1] if opponents_scores[i+1] and opponents_scores[i+1] > 0 else None
-        opponent_known_scores.append({'written': written_score, 'interview': interview_score})
-    highlight_opp1 = False
-    if total_participants > 1 and user_written != written_cutoff:
-        opponent_known_scores[0]['written'] = written_cutoff
-        highlight_opp1 = True
-    promotion_count = 0
-    user_total_score = config['score_formula'](user_written, user_interview)
-    num_unknown_written = sum(1 for o in opponent_known_scores if o['written'] is None)
-    num_unknown_interview = sum(1 for o in opponent_known_scores if o['interview'] is None)
-    sim_written_pool, sim_interview_pool = [], []
-    if num_unknown_written > 0:
-        pool_size = num_unknown_written * NUM_SIMULATIONS
-        written_samples = []
-        while len(written_samples) < pool_size:
-            s = np.random.normal(config['written_mu'], config['written_sigma'], int(pool_size * 1.5))
-            written_samples.extend(s[(s > written_cutoff) & (s < config['written_max'])])
-        sim_written_pool = written_samples[:pool_size]
-    if num_unknown_interview > 0:
-        pool_size = num_unknown_interview * NUM_SIMULATIONS
-        interview_samples = []
-        while len(interview_samples) < pool_size:
-            s = np.random.normal(config['interview_mu'], config['interview_sigma'], int(pool_size * 1.5))
-            interview_samples.extend(s[(s >= 60) & (s <= 100)])
-        sim_interview_pool = interview_samples[:pool_size]
-    written_pool_idx, interview_pool_idx = 0, 0
-    last_run_details = {}
-    for i in range(NUM_SIMULATIONS):
-        if i % 1000 == 0: await asyncio.sleep(0)
-        all_scores = []
-        is_last_run = (i == NUM_SIMULATIONS - 1)
-        if is_last_run:
-            current_run_details = {'user': {'written': user_written, 'interview': user_interview, 'total': user_total_score}}
-        for j in range(total_participants - 1):
-            sim_written = opponent_known_scores[j]['written']
-            if sim_written is None:
-                sim_written = sim_written_pool[written_pool_idx]
-                written_pool_idx += 1
-            sim_interview = opponent_known_scores[j]['interview']
-            if sim_interview is None:
-                sim_interview = sim_interview_pool[interview_pool_idx]
-                interview_pool_idx += 1
-            opponent_total_score = config['score_formula'](sim_written, sim_interview)
-            all_scores.append(opponent_total_score)
-            if is_last_run:
-                current_run_details[f'opponent_{j+1}'] = {'written': sim_written, 'interview': sim_interview, 'total': opponent_total_score}
-        all_scores.append(user_total_score)
-        all_scores.sort(reverse=True)
-        if len([s for s in all_scores if s > user_total_score]) < promotion_slots:
-            promotion_count += 1
-    if 'current_run_details' in locals() and last_run_details == {}:
-        last_run_details = current_run_details
-    probability = promotion_count / NUM_SIMULATIONS
-    fig = go.Figure(data=[go.Bar(y=[probability], x=['上岸概率'], text=[f'{probability:.2%}'], textposition='auto', marker_color='rgba(55, 126, 229, 0.7)')])
-    fig.update_layout(paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', yaxis_range=[0,1], yaxis_tickformat=".0%", title_text="上岸概率", title_x=0.5, font_color="white", title_font_color="white", yaxis=dict(gridcolor='rgba(255, 255, 255, 0.2)'), modebar_remove=['toimage', 'zoom', 'pan', 'select', 'lasso2d', 'autoscale'])
+    try:
+        check_scenario(exam_type, total_participants, promotion_slots)
+    except ValueError as e:
+        raise gr.Error(str(e))
+    user_written, user_interview = snap_to_step(user_written), snap_to_step(user_interview)
+    opponent_known_scores, highlight_opp1 = build_opponents(total_participants, opponents_scores, written_cutoff, user_written)
+    cache_key, order = scenario_key(exam_type, promotion_slots, written_cutoff, user_written, user_interview, opponent_known_scores, SIMULATION_MODE)
+    result = RESULT_CACHE.get(cache_key)
+    cache_hit = result is not None
+    if not cache_hit:
+        try:
+            result = await POOL.run(estimate, exam_type, [opponent_known_scores[i] for i in order], written_cutoff, user_written, user_interview, promotion_slots,
+                                    should_stop=should_stop)
+        except ValueError as e:
+            raise gr.Error(str(e))
+        except PoolSaturated:
+            raise gr.Error("当前使用人数较多，请稍后再试。")
+        RESULT_CACHE.put(cache_key, result)
+    rendering_started_at = time.perf_counter()
+    outputs = render_outputs(result, restore_order(result['last_run_details'], order), promotion_slots, highlight_opp1)
+    finished_at = time.perf_counter()
+    # 缓存命中时没有抽样/计分阶段，只记录渲染与总耗时
+    timings = {} if cache_hit else dict(result['timings'])
+    timings.update(rendering=finished_at - rendering_started_at, total=finished_at - started_at)
+    METRICS.observe(timings, simulations=0 if cache_hit else result['num_simulations'], cache_hits=int(cache_hit))
+    return outputs
+
+def render_outputs(result, last_run_details, promotion_slots, highlight_opp1):
+    probability = result['probability']
+    prob_html = render_probability_bar(probability)
     if probability >= 0.98:
         face = '😂😂😂 \n 穿好你的行政夹克，直接去体检上班吧'
     elif probability > 0.5:
@@ -120,22 +152,71 @@ async def run_simulation(exam_type, total_participants, promotion_slots, written
         face = '🙂'
     else:
         face = '😭'
-    promo_text = f"在 {NUM_SIMULATIONS} 次模拟中，你成功上岸了 {promotion_count} 次。"
-    table_html = ""
+    if result['mode'] == 'exact':
+        promo_text = f"精确计算（数值积分，无抽样误差）：上岸概率 {probability:.4%}。下表为随机抽取的一轮模拟。"
+    else:
+        interval_low, interval_high = result['interval']
+        promo_text = f"在 {result['num_simulations']} 次模拟中，你成功上岸了 {result['promotion_count']} 次（标准误 ±{result['std_error']:.2%}，95% 区间 {interval_low:.2%} ~ {interval_high:.2%}）。"
+    table_parts = []
     if last_run_details:
         sorted_results = sorted(last_run_details.items(), key=lambda item: item[1]['total'], reverse=True)
         user_rank = next((i for i, (name, _) in enumerate(sorted_results, 1) if name == 'user'), -1)
         promotion_status = "成功上岸！" if 1 <= user_rank <= promotion_slots else "未能上岸。"
-        table_html = f"""<div style="color:white; text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.6); text-align:center; font-size:1.2em; margin-bottom:10px;">你在该轮模拟中排名第 {user_rank}，<b>{promotion_status}</b></div><table style="width:95%; margin:auto; border-collapse:collapse; font-size:14px; color:white; text-shadow: 1px 1px 2px rgba(0,0,0,0.5);"><tr style="background-color:rgba(255, 255, 255, 0.25);"><th style="border:1px solid rgba(255,255,255,0.3); padding:8px;">排名</th><th style="border:1px solid rgba(255,255,255,0.3); padding:8px;">角色</th><th style="border:1px solid rgba(255,255,255,0.3); padding:8px;">笔试</th><th style="border:1px solid rgba(255,255,255,0.3); padding:8px;">面试</th><th style="border:1px solid rgba(255,255,255,0.3); padding:8px;">总分</th></tr>"""
+        table_parts.append(f"""<div class="sim-caption">你在该轮模拟中排名第 {user_rank}，<b>{promotion_status}</b></div><table class="sim-table"><tr><th>排名</th><th>角色</th><th>笔试</th><th>面试</th><th>总分</th></tr>""")
         for i, (name, scores) in enumerate(sorted_results, 1):
-            row_style = "background-color:rgba(212, 237, 218, 0.3); font-weight:bold;" if name == 'user' else ""
+            row_class = " class='user'" if name == 'user' else ""
             role_name = "<b>你</b>" if name == 'user' else name.replace("opponent_", "对手")
-            written_score_cell = f"<td style='border:1px solid rgba(255,255,255,0.3); padding:8px;'>{scores['written']:.2f}</td>"
+            written_score_cell = f"<td>{scores['written']:.2f}</td>"
             if highlight_opp1 and name == "opponent_1":
-                written_score_cell = f"<td style='border:1px solid rgba(255,255,255,0.3); padding:8px; background-color:rgba(255, 248, 196, 0.4); color:black; text-shadow:none;'>{scores['written']:.2f} (进面分)</td>"
-            table_html += f"""<tr style="{row_style}"><td style="border:1px solid rgba(255,255,255,0.3); padding:8px;">{i}</td><td style="border:1px solid rgba(255,255,255,0.3); padding:8px;">{role_name}</td>{written_score_cell}<td style="border:1px solid rgba(255,255,255,0.3); padding:8px;">{scores['interview']:.2f}</td><td style="border:1px solid rgba(255,255,255,0.3); padding:8px;"><b>{scores['total']:.2f}</b></td></tr>"""
-        table_html += "</table>"
-    return fig, gr.update(value=face), gr.update(value=promo_text), gr.update(value=table_html)
+                written_score_cell = f"<td class='cutoff'>{scores['written']:.2f} (进面分)</td>"
+            table_parts.append(f"""<tr{row_class}><td>{i}</td><td>{role_name}</td>{written_score_cell}<td>{scores['interview']:.2f}</td><td><b>{scores['total']:.2f}</b></td></tr>""")
+        table_parts.append("</table>")
+    table_html = "".join(table_parts)
+    return gr.update(value=prob_html), gr.update(value=face), gr.update(value=promo_text), gr.update(value=table_html)
+
+async def run_cohort(request: gr.Request, exam_type, total_candidates, interview_seats, promotion_slots, user_written, user_interview):
+    # 同一会话再次点击会取代仍在排队或计算中的上一次，被取代的请求不改动输出
+    started_at = time.perf_counter()
+    total_candidates = int(total_candidates) if total_candidates else 0
+    interview_seats = int(interview_seats) if interview_seats else None
+    promotion_slots = int(promotion_slots) if promotion_slots else 1
+    token = SCHEDULER.begin(('cohort', request.session_hash) if request else object())
+    try:
+        result = await POOL.run(simulate_cohort, exam_type, total_candidates, promotion_slots, user_written, user_interview, interview_seats=interview_seats,
+                                should_stop=lambda: not SCHEDULER.is_current(token))
+        if not SCHEDULER.is_current(token):
+            raise SimulationCancelled()
+    except SimulationCancelled:
+        SCHEDULER.discard(token)
+        return gr.update(), gr.update()
+    except ValueError as e:
+        raise gr.Error(str(e))
+    except PoolSaturated:
+        raise gr.Error("当前使用人数较多，请稍后再试。")
+    finally:
+        SCHEDULER.finish(token)
+    rendering_started_at = time.perf_counter()
+    outputs = render_cohort(result, promotion_slots)
+    finished_at = time.perf_counter()
+    METRICS.observe({**result['timings'], 'rendering': finished_at - rendering_started_at, 'total': finished_at - started_at}, simulations=result['num_simulations'])
+    return outputs
+
+def render_cohort(result, promotion_slots):
+    # 笔试排名给出 10% / 50% / 90% 分位，最终排名表过长时只列前 COHORT_TABLE_ROWS 名
+    written_cdf = np.cumsum(result['written_rank_pmf'])
+    written_ranks = [int(np.searchsorted(written_cdf, q)) + 1 for q in (0.1, 0.5, 0.9)]
+    promo_text = (f"进面概率 {result['interview_probability']:.2%}（笔试排名 10%/50%/90% 分位：第 {written_ranks[0]} / {written_ranks[1]} / {written_ranks[2]} 名），"
+                  f"上岸概率 {result['promotion_probability']:.2%}（标准误 ±{result['std_error']:.2%}），进面后上岸 {result['promotion_given_interview']:.2%}。"
+                  f"共 {result['total_candidates']} 人报考、{result['interview_seats']} 人进面，{result['num_simulations']} 次模拟。")
+    table_parts = ["""<table class="sim-table"><tr><th>最终排名</th><th>概率</th><th>结果</th></tr>"""]
+    final_rank_pmf = result['final_rank_pmf']
+    for rank, probability in enumerate(final_rank_pmf[:COHORT_TABLE_ROWS], 1):
+        row_class = " class='user'" if rank <= promotion_slots else ""
+        table_parts.append(f"""<tr{row_class}><td>{rank}</td><td>{probability:.2%}</td><td>{"上岸" if rank <= promotion_slots else "未上岸"}</td></tr>""")
+    if len(final_rank_pmf) > COHORT_TABLE_ROWS:
+        table_parts.append(f"""<tr><td>{COHORT_TABLE_ROWS + 1} ~ {len(final_rank_pmf)}</td><td>{sum(final_rank_pmf[COHORT_TABLE_ROWS:]):.2%}</td><td>未上岸</td></tr>""")
+    table_parts.append(f"""<tr><td>未进面</td><td>{1 - result['interview_probability']:.2%}</td><td>未上岸</td></tr></table>""")
+    return gr.update(value=promo_text), gr.update(value="".join(table_parts))
 
 # --- UI界面构建部分 ---
 with gr.Blocks(title="考试上岸率模拟", css=glassmorphism_css) as demo:
@@ -203,16 +284,62 @@ with gr.Blocks(title="考试上岸率模拟", css=glassmorphism_css) as demo:
     
     with gr.Row():
         face_output_tb = gr.Textbox(label="你是这个", interactive=False, text_align="center", scale=1)
-        plot_output_pl = gr.Plot(label="上岸概率图", scale=3)
+        with gr.Column(scale=3):
+            prob_output_html = gr.HTML(label="上岸概率图")
     promo_text_output_tb = gr.Textbox(label="模拟统计", interactive=False)
     html_output_html = gr.HTML()
-    outputs_list = [plot_output_pl, face_output_tb, promo_text_output_tb, html_output_html]
+    outputs_list = [prob_output_html, face_output_tb, promo_text_output_tb, html_output_html]
     all_triggers = inputs_list + opponent_inputs_list
+    # run_simulation 自带按会话防抖与取消，不需要 Gradio 再按监听器串行排队
     for component in all_triggers:
-        component.change(fn=run_simulation, inputs=all_inputs_list, outputs=outputs_list, show_progress="full")
+        component.change(fn=run_simulation, inputs=all_inputs_list, outputs=outputs_list, show_progress="full", trigger_mode="always_last", concurrency_limit=None)
     
     demo.load(fn=update_opponent1_lock, inputs=[user_written_slider, written_cutoff_num], outputs=[opponent1_written_input])
     demo.load(fn=run_simulation, inputs=all_inputs_list, outputs=outputs_list, show_progress="full")
 
+    # ==============================================================================
+    # 大规模模式：笔试按成绩取前若干名进面，再按总分录取，总人数不受 9 人限制
+    # ==============================================================================
+    with gr.Accordion("大规模模式：笔试 → 面试两阶段（报考人数可达数千）", open=False):
+        with gr.Row():
+            cohort_exam_dd = gr.Dropdown(list(EXAM_CONFIG.keys()), value="事业单位", label="选择考试类型")
+            cohort_total_num = gr.Number(value=500, label="笔试总人数", minimum=2, maximum=MAX_CANDIDATES, step=1)
+            cohort_seats_num = gr.Number(value=None, label=f"进面人数（留空按 1:{INTERVIEW_RATIO}，最多 {MAX_INTERVIEW_SEATS}）", minimum=0, maximum=MAX_INTERVIEW_SEATS, step=1)
+            cohort_slots_num = gr.Number(value=1, label="允许上岸人数", minimum=1, maximum=MAX_INTERVIEW_SEATS - 1, step=1)
+        with gr.Row():
+            cohort_written_slider = gr.Slider(label="你的笔试成绩", minimum=0, maximum=300, value=220, step=0.5)
+            cohort_interview_slider = gr.Slider(label="你的面试成绩", minimum=0, maximum=100, value=75, step=0.5)
+        cohort_btn = gr.Button("开始模拟")
+        cohort_text_tb = gr.Textbox(label="大规模模拟统计", interactive=False)
+        cohort_html = gr.HTML()
+    cohort_exam_dd.change(fn=update_slider_max_val, inputs=cohort_exam_dd, outputs=cohort_written_slider)
+    cohort_btn.click(fn=run_cohort, inputs=[cohort_exam_dd, cohort_total_num, cohort_seats_num, cohort_slots_num, cohort_written_slider, cohort_interview_slider],
+                     outputs=[cohort_text_tb, cohort_html], api_name="simulate_cohort", trigger_mode="always_last", concurrency_limit=None)
+
+    # 仅供 API 调用（/api/stats）的运行状态接口，界面上不可见
+    stats_btn = gr.Button(visible=False)
+    stats_json = gr.JSON(visible=False)
+    stats_btn.click(fn=service_stats, inputs=None, outputs=stats_json, api_name="stats", queue=False)
+    # 批量接口（/api/simulate_batch）：一次请求提交多个场景，字段同 batch.py
+    batch_btn = gr.Button(visible=False)
+    batch_in_json = gr.JSON(visible=False)
+    batch_out_json = gr.JSON(visible=False)
+    batch_btn.click(fn=simulate_batch, inputs=batch_in_json, outputs=batch_out_json, api_name="simulate_batch")
+
+class CachedStaticFiles(StaticFiles):
+    # StaticFiles 已处理 ETag / If-None-Match；地址带内容哈希，可放心长期缓存
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+        return response
+
+def create_app():
+    app = FastAPI()
+    app.mount(STATIC_PREFIX, CachedStaticFiles(directory=STATIC_DIR), name="ladai-static")
+    app.get("/metrics")(service_stats)
+    return gr.mount_gradio_app(app, demo, path="/")
+
 if __name__ == "__main__":
-    demo.launch()
+    import uvicorn
+    uvicorn.run(create_app(), host=os.environ.get("GRADIO_SERVER_NAME", "127.0.0.1"), port=int(os.environ.get("GRADIO_SERVER_PORT", "7860")))
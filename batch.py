@@ -0,0 +1,164 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from simulation import SIMULATION_MODE, build_opponents, check_scenario, estimate
+
+# ==============================================================================
+# 无界面的批量接口：从 CSV / JSONL 读取场景，多进程并行计算，结果逐行以 JSONL 流式输出。
+# 同时读入、在途的场景数有上限，内存占用与输入规模无关。结束时在标准错误输出吞吐量（个/秒）。
+#
+#   python batch.py scenarios.csv -o results.jsonl --workers 8
+#
+# 场景字段：exam_type, total_participants, promotion_slots, written_cutoff, user_written,
+# user_interview；可选 id、mode、seed，以及对手成绩（JSONL 用 "opponents": [[笔试, 面试], ...]，
+# CSV 用 opponent1_written, opponent1_interview, ... 列，留空表示随机生成）。
+# ==============================================================================
+MAX_OPPONENTS = 8
+
+
+def _number(value):
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    return float(value)
+
+
+def _opponent_scores(scenario):
+    # 整理成与界面输入相同的扁平列表 [对手1笔试, 对手1面试, 对手2笔试, ...]
+    scores = [None] * (MAX_OPPONENTS * 2)
+    if scenario.get('opponents'):
+        for j, opponent in enumerate(scenario['opponents'][:MAX_OPPONENTS]):
+            if isinstance(opponent, dict):
+                opponent = (opponent.get('written'), opponent.get('interview'))
+            scores[2 * j], scores[2 * j + 1] = _number(opponent[0]), _number(opponent[1])
+    else:
+        for j in range(MAX_OPPONENTS):
+            scores[2 * j] = _number(scenario.get(f'opponent{j+1}_written'))
+            scores[2 * j + 1] = _number(scenario.get(f'opponent{j+1}_interview'))
+    return scores
+
+
+def run_scenario(scenario, mode=SIMULATION_MODE):
+    """计算单个场景（dict）的上岸概率，对手成绩的处理与界面完全一致。
+
+    场景自带的 mode / seed 优先于参数。输入无效时抛出 ValueError。
+    """
+    exam_type = scenario['exam_type']
+    total_participants = int(_number(scenario['total_participants']))
+    promotion_slots = int(_number(scenario['promotion_slots']))
+    check_scenario(exam_type, total_participants, promotion_slots)
+    written_cutoff = _number(scenario['written_cutoff'])
+    user_written, user_interview = _number(scenario['user_written']), _number(scenario['user_interview'])
+    opponents, _ = build_opponents(total_participants, _opponent_scores(scenario), written_cutoff, user_written)
+    seed = _number(scenario.get('seed'))
+    result = estimate(exam_type, opponents, written_cutoff, user_written, user_interview, promotion_slots,
+                      mode=scenario.get('mode') or mode, seed=int(seed) if seed is not None else None, with_details=False)
+    return {
+        'id': scenario.get('id'),
+        'probability': result['probability'],
+        'std_error': result['std_error'],
+        'interval': list(result['interval']),
+        'mode': result['mode'],
+        'num_simulations': result['num_simulations'],
+    }
+
+
+def _run_indexed(index, scenario, mode):
+    # 工作进程入口：出错的场景返回 error 字段而不是中断整个批次；
+    # 读取阶段就无法解析的行由 iter_scenarios 以 ValueError 实例代替场景传入，同样记为出错
+    try:
+        if isinstance(scenario, ValueError):
+            raise scenario
+        return {'index': index, **run_scenario(scenario, mode)}
+    except (KeyError, TypeError, ValueError) as e:
+        return {'index': index, 'id': scenario.get('id') if isinstance(scenario, dict) else None, 'error': f'{type(e).__name__}: {e}'}
+
+
+def run_scenarios(scenarios, mode=SIMULATION_MODE, start=0):
+    """在当前进程中顺序计算一批场景，返回与输入同序的结果列表，index 从 start 起编号。"""
+    return [_run_indexed(index, scenario, mode) for index, scenario in enumerate(scenarios, start)]
+
+
+def run_batch(scenarios, workers=None, mode=SIMULATION_MODE, chunk_size=64, max_in_flight=None):
+    """把场景迭代器按 chunk_size 分组分发到进程池，按完成顺序逐个产出结果（带输入序号 index）。
+
+    分组摊薄进程间通信开销；最多 max_in_flight（默认 workers × 4）组同时在途，输入只按需读取。
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+    scenarios = iter(scenarios)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        start = 0
+        while True:
+            chunk = list(itertools.islice(scenarios, chunk_size))
+            if not chunk:
+                break
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+            pending.add(executor.submit(run_scenarios, chunk, mode, start))
+            start += len(chunk)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+def iter_scenarios(f, fmt):
+    """从文件对象流式读取场景，fmt 为 'csv' 或 'jsonl'。
+
+    JSONL 中无法解析的行不会中断读取，而是产出一个带行号的 ValueError，由 run_batch 记为该行的 error 结果。
+    """
+    if fmt == 'csv':
+        yield from csv.DictReader(f)
+        return
+    for line_number, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            yield ValueError(f"第 {line_number} 行不是有效的 JSON：{e}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="批量计算考试上岸概率，结果以 JSONL 逐行输出。")
+    parser.add_argument('input', help="场景文件（.csv 或 .jsonl），- 表示标准输入")
+    parser.add_argument('-o', '--output', default='-', help="结果文件，默认标准输出")
+    parser.add_argument('--format', choices=['csv', 'jsonl'], help="输入格式，默认按扩展名判断")
+    parser.add_argument('--workers', type=int, default=None, help="工作进程数，默认 CPU 核数")
+    parser.add_argument('--mode', choices=['exact', 'adaptive', 'fixed'], default=SIMULATION_MODE)
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ('csv' if args.input.lower().endswith('.csv') else 'jsonl')
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8', newline='')
+    sink = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    started_at = time.perf_counter()
+    count = failed = 0
+    try:
+        for result in run_batch(iter_scenarios(source, fmt), workers=args.workers, mode=args.mode):
+            sink.write(json.dumps(result, ensure_ascii=False) + '\n')
+            sink.flush()
+            count += 1
+            failed += 'error' in result
+            if count % 1000 == 0:
+                print(f"已完成 {count} 个场景，{count / (time.perf_counter() - started_at):.1f} 个/秒", file=sys.stderr)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    elapsed = time.perf_counter() - started_at
+    print(f"共 {count} 个场景（失败 {failed} 个），用时 {elapsed:.2f} 秒，{count / elapsed if elapsed else 0:.1f} 个/秒", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
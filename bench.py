@@ -0,0 +1,213 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from cohort import simulate_cohort
+from sampling import TruncatedNormal
+from simulation import EXAM_CONFIG, estimate, simulate
+
+# ==============================================================================
+# 模拟引擎基准测试：遍历考试类型、总人数 2-9、未知成绩的对手数、常规/极端进面分和计算模式，
+# 以及大规模模式（cohort）的不同报考人数，
+# 记录延迟分布、各阶段耗时与峰值内存，保存为基线文件；--compare 与已有基线对比以发现性能回退。
+#
+#   python bench.py -o bench_baseline.json          # 生成基线
+#   python bench.py --compare bench_baseline.json   # 对比基线，有回退时退出码为 1
+#   python bench.py --check-exact                   # 检查精确模式与蒙特卡洛是否一致，不一致时退出码为 1
+# ==============================================================================
+# 每种考试的 (常规, 极端) 进面分：极端值在笔试均值以上 4.6 / 8.7 个标准差，
+# 曾使拒绝采样的接受率骤降，也是精确模式归一化常数最容易失真的区域
+CUTOFFS = {'事业单位': (150, 280), '公务员': (130, 190)}
+MODES = ('exact', 'adaptive', 'fixed', 'cohort')
+# 大规模模式的报考人数；你的笔试成绩取均值以上 2.5 个标准差，进面概率不至于为 0
+COHORT_SIZES = (100, 1000, 5000, 50000)
+# 低于此绝对差值（秒）的延迟变化视为噪声
+NOISE_FLOOR = 0.001
+# 每个场景计时前先不计时地运行几次，预热缓存、分配器与惰性初始化
+WARMUP_RUNS = 2
+# 宿主机的速度会整段地波动（频率调节、邻居负载），同一场景前后两次测量可相差 30% 以上。
+# 每次计时紧挨着跑一个固定的参考负载，用两者之比（相对耗时）判断回退，宿主机整体变慢时比值基本不变
+_REFERENCE_DIST = TruncatedNormal(0.0, 1.0, -1.0, 2.0)
+_REFERENCE_BUF = np.empty((8, 2500))
+# 精确模式一致性检查的进面分：包含远高于笔试均值、归一化常数极小的情形
+ACCURACY_CUTOFFS = {'事业单位': (150, 230, 280), '公务员': (130, 150, 185, 190, 195)}
+ACCURACY_SIMULATIONS = 200000
+ACCURACY_MAX_Z = 5.0
+
+
+def iter_cases(modes):
+    for mode in modes:
+        if mode == 'cohort':
+            for exam_type, config in EXAM_CONFIG.items():
+                for total_candidates in COHORT_SIZES:
+                    yield f'cohort/{exam_type}/N{total_candidates}', (simulate_cohort, dict(
+                        exam_type=exam_type, total_candidates=total_candidates, promotion_slots=max(1, total_candidates // 1000),
+                        user_written=config['written_mu'] + 2.5 * config['written_sigma'], user_interview=75.0))
+            continue
+        for exam_type, config in EXAM_CONFIG.items():
+            for written_cutoff in CUTOFFS[exam_type]:
+                user_written = min(written_cutoff + 10, config['written_max'] - 1)
+                for total_participants in range(2, 10):
+                    for unknown in range(total_participants):
+                        known = total_participants - 1 - unknown
+                        opponents = [{'written': user_written + 5 * (j % 3 - 1), 'interview': config['interview_mu']} for j in range(known)]
+                        opponents += [{'written': None, 'interview': None} for _ in range(unknown)]
+                        name = f'{mode}/{exam_type}/n{total_participants}/u{unknown}/c{written_cutoff}'
+                        yield name, (estimate, dict(exam_type=exam_type, opponents=opponents, written_cutoff=written_cutoff, user_written=user_written,
+                                         user_interview=75.0, promotion_slots=1, mode=mode))
+
+
+def _percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+def _reference_seconds():
+    # 参考负载：与模拟引擎同类的抽样 + 排序，连续跑两次取较快的一次
+    rng = np.random.default_rng(0)
+    best = float('inf')
+    for _ in range(2):
+        started_at = time.perf_counter()
+        _REFERENCE_DIST.sample(rng, _REFERENCE_BUF)
+        np.sort(_REFERENCE_BUF, axis=0)
+        best = min(best, time.perf_counter() - started_at)
+    return best
+
+
+def measure(fn, case, repeats, warmup=WARMUP_RUNS):
+    """先预热 warmup 次，再计时 repeats 次，最后单独跑一次用 tracemalloc 统计峰值内存。
+
+    除绝对延迟外还记录相对耗时（场景耗时 / 紧邻的参考负载耗时）的四分位数，供 compare 判断回退；
+    重复次数不足 100 时 p99 没有意义，不予记录。
+    """
+    for seed in range(warmup):
+        fn(**case, seed=repeats + 1 + seed)
+    latencies, relative, stage_totals, simulations = [], [], {}, 0
+    for seed in range(repeats):
+        reference = _reference_seconds()
+        started_at = time.perf_counter()
+        result = fn(**case, seed=seed)
+        latencies.append(time.perf_counter() - started_at)
+        relative.append(latencies[-1] / reference)
+        simulations = result['num_simulations']
+        for stage, seconds in result['timings'].items():
+            stage_totals[stage] = stage_totals.get(stage, 0.0) + seconds
+    tracemalloc.start()
+    fn(**case, seed=repeats)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    latencies.sort()
+    relative.sort()
+    return {
+        'min': latencies[0],
+        'p25': _percentile(latencies, 0.25),
+        'p50': _percentile(latencies, 0.5),
+        'p75': _percentile(latencies, 0.75),
+        'p90': _percentile(latencies, 0.9),
+        'p99': _percentile(latencies, 0.99) if repeats >= 100 else None,
+        'max': latencies[-1],
+        'mean': sum(latencies) / len(latencies),
+        'relative_p25': _percentile(relative, 0.25),
+        'relative_p50': _percentile(relative, 0.5),
+        'relative_p75': _percentile(relative, 0.75),
+        'stages': {stage: total / repeats for stage, total in stage_totals.items()},
+        'simulations': simulations,
+        'peak_memory': peak,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """返回 {场景名: [回退说明]}。
+
+    延迟同时满足以下条件才算回退：相对耗时中位数超过基线 tolerance 倍，且四分位区间整体高于基线
+    （p25 > 基线 p75），且绝对延迟中位数的增加超过噪声下限。峰值内存是确定的，直接按倍数比较。
+    """
+    regressions = {}
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None or 'relative_p50' not in previous:
+            continue
+        slower = current['relative_p50'] > previous['relative_p50'] * tolerance and current['relative_p25'] > previous['relative_p75']
+        if slower and current['p50'] - previous['p50'] > NOISE_FLOOR:
+            regressions.setdefault(name, []).append(f"相对耗时 {previous['relative_p50']:.3f} -> {current['relative_p50']:.3f}，"
+                                                     f"p50 {previous['p50'] * 1e3:.2f} ms -> {current['p50'] * 1e3:.2f} ms")
+        if current['peak_memory'] > previous['peak_memory'] * tolerance:
+            regressions.setdefault(name, []).append(f"峰值内存 {previous['peak_memory']} B -> {current['peak_memory']} B")
+    return regressions
+
+
+def check_exact(simulations=ACCURACY_SIMULATIONS, max_z=ACCURACY_MAX_Z):
+    """用固定次数蒙特卡洛校验精确模式，返回相差超过 max_z 个标准误的场景列表。
+
+    对手覆盖成绩全未知、只知笔试、只知面试三种情形，对应精确模式的三条计算路径。
+    """
+    failures = []
+    for exam_type, config in EXAM_CONFIG.items():
+        for written_cutoff in ACCURACY_CUTOFFS[exam_type]:
+            user_written = min(written_cutoff + 5, config['written_max'] - 1)
+            for unknown in (1, 3, 6):
+                opponents = [{'written': None, 'interview': None} for _ in range(unknown)]
+                opponents += [{'written': user_written, 'interview': None}, {'written': None, 'interview': 74.0}]
+                for promotion_slots in (1, 2):
+                    args = (exam_type, opponents, written_cutoff, user_written, 75.0, promotion_slots)
+                    exact = estimate(*args, mode='exact', with_details=False)['probability']
+                    mc = simulate(*args, num_simulations=simulations, rng=np.random.default_rng(written_cutoff))
+                    std_error = max(mc['std_error'], 1 / simulations)
+                    z = abs(exact - mc['probability']) / std_error
+                    name = f'{exam_type}/c{written_cutoff}/u{unknown}/s{promotion_slots}'
+                    print(f"{name:<28} 精确 {exact:.5f}  蒙特卡洛 {mc['probability']:.5f} ± {mc['std_error']:.5f}  z {z:5.2f}", file=sys.stderr)
+                    if z > max_z:
+                        failures.append(f"{name}: 精确 {exact:.5f}，蒙特卡洛 {mc['probability']:.5f}（z = {z:.1f}）")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="模拟引擎基准测试。")
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--repeats', type=int, default=20, help="每个场景的计时次数")
+    parser.add_argument('--warmup', type=int, default=WARMUP_RUNS, help="每个场景计时前的预热次数")
+    parser.add_argument('-o', '--output', help="保存结果（可作为之后的基线）")
+    parser.add_argument('--compare', help="与该基线文件对比")
+    parser.add_argument('--tolerance', type=float, default=1.3, help="允许的变慢/变大倍数")
+    parser.add_argument('--check-exact', action='store_true', help="只检查精确模式与蒙特卡洛的一致性")
+    args = parser.parse_args(argv)
+
+    if args.check_exact:
+        failures = check_exact()
+        for line in failures:
+            print(f"不一致：{line}", file=sys.stderr)
+        print(f"精确模式一致性检查：{len(failures)} 项不一致", file=sys.stderr)
+        return 1 if failures else 0
+
+    results = {}
+    for name, (fn, case) in iter_cases(args.modes):
+        results[name] = stats = measure(fn, case, args.repeats, args.warmup)
+        print(f"{name:<36} 最小 {stats['min'] * 1e3:8.2f} ms  p50 {stats['p50'] * 1e3:8.2f} ms  最大 {stats['max'] * 1e3:8.2f} ms  相对 {stats['relative_p50']:7.3f}  峰值内存 {stats['peak_memory'] / 1024:8.1f} KiB", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'environment': {'python': platform.python_version(), 'numpy': np.__version__, 'machine': platform.machine(), 'repeats': args.repeats, 'warmup': args.warmup},
+                       'results': results}, f, ensure_ascii=False, indent=1)
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            # 宿主机负载波动常使连续一段场景整体变慢；疑似回退的场景加倍次数重测，两次都回退才报告
+            cases = dict(iter_cases(args.modes))
+            retested = {name: measure(*cases[name], args.repeats * 2, args.warmup) for name in regressions}
+            regressions = compare(retested, baseline, args.tolerance)
+        for name, lines in regressions.items():
+            for line in lines:
+                print(f"回退：{name}: {line}", file=sys.stderr)
+        print(f"对比 {args.compare}：{len(regressions)} 项回退", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
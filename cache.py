@@ -0,0 +1,152 @@
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import simulation
+
+# ==============================================================================
+# 跨会话共享的结果缓存：按规范化后的场景记忆概率与表格数据（不含图表），LRU + TTL 淘汰，
+# 可选持久化到磁盘，重启后仍然有效
+# ==============================================================================
+SCORE_STEP = 0.5  # 与界面滑块的 step 保持一致
+# 计算引擎的结果口径改变（修正算法等）时递增，使磁盘上的旧缓存失效
+ENGINE_VERSION = 1
+
+
+def _config_fingerprint():
+    # 考试参数、评分公式系数、模拟参数与引擎版本的哈希，任一改变都会换一套缓存键
+    exams = {exam_type: {**{k: v for k, v in config.items() if k != 'score_formula'}, 'score_formula': simulation.formula_weights(config['score_formula'])}
+             for exam_type, config in simulation.EXAM_CONFIG.items()}
+    settings = [ENGINE_VERSION, exams, simulation.INTERVIEW_MIN, simulation.INTERVIEW_MAX, simulation.NUM_SIMULATIONS, simulation.TARGET_STD_ERROR,
+                simulation.MIN_ADAPTIVE_SIMULATIONS, simulation.MAX_ADAPTIVE_SIMULATIONS, simulation.EXACT_QUADRATURE_NODES, simulation.EXACT_QUADRATURE_PANELS]
+    return hashlib.sha1(json.dumps(settings, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+
+
+CONFIG_FINGERPRINT = _config_fingerprint()
+
+
+def snap_to_step(value, step=SCORE_STEP):
+    return round(float(value) / step) * step
+
+
+def scenario_key(exam_type, promotion_slots, written_cutoff, user_written, user_interview, opponents, mode):
+    """返回 (缓存键, 对手的规范顺序)。
+
+    键中包含 CONFIG_FINGERPRINT，配置或引擎改变后不会读到旧结果。
+    对手顺序不影响结果，因此按成绩排序后作为多重集参与键；order[k] 是规范顺序中第 k 个对手
+    在原列表中的下标，计算时按此顺序传入对手，读取缓存时用 restore_order 还原。
+    """
+    def sort_key(index):
+        o = opponents[index]
+        return (o['written'] is None, o['written'] or 0, o['interview'] is None, o['interview'] or 0)
+
+    order = sorted(range(len(opponents)), key=sort_key)
+    multiset = [[opponents[i]['written'], opponents[i]['interview']] for i in order]
+    key = json.dumps([CONFIG_FINGERPRINT, exam_type, len(opponents) + 1, promotion_slots, written_cutoff, snap_to_step(user_written), snap_to_step(user_interview), multiset, mode], ensure_ascii=False)
+    return key, order
+
+
+def restore_order(last_run_details, order):
+    # 把按规范顺序保存的 opponent_k 还原为调用方的对手编号
+    restored = {}
+    for name, scores in last_run_details.items():
+        if name.startswith('opponent_'):
+            name = f'opponent_{order[int(name[len("opponent_"):]) - 1] + 1}'
+        restored[name] = scores
+    return restored
+
+
+class ResultCache:
+    """线程安全的 LRU 缓存，条目超过 ttl_seconds 视为过期。
+
+    path 不为空时启动即从磁盘加载，每 persist_every 次写入以及进程退出时原子地写回。
+    put() 可能在事件循环中调用，定期写回放在后台线程，同一时刻最多一个写回在进行。
+    """
+
+    def __init__(self, max_entries=4096, ttl_seconds=24 * 3600, path=None, persist_every=50):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.path = path
+        self.persist_every = persist_every
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (写入时间, 结果)
+        self._lock = threading.Lock()
+        self._dirty = 0
+        self._saving = False
+        self._save_lock = threading.Lock()
+        if path:
+            self._load()
+            atexit.register(self.save)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, result):
+        with self._lock:
+            self._entries[key] = (time.time(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty += 1
+            should_save = self.path and self._dirty >= self.persist_every and not self._saving
+            if should_save:
+                self._saving = True
+        if should_save:
+            threading.Thread(target=self._save_in_background, name='result-cache-save', daemon=True).start()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hits / lookups if lookups else 0.0}
+
+    def save(self):
+        if not self.path:
+            return
+        with self._save_lock:
+            with self._lock:
+                snapshot = [[key, stored_at, result] for key, (stored_at, result) in self._entries.items()]
+                self._dirty = 0
+            # 逐条编码：单条 dumps 很快，条目之间会让出 GIL，写回期间其他线程不被长时间阻塞
+            tmp_path = f'{self.path}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write('[')
+                for n, entry in enumerate(snapshot):
+                    f.write(',\n' if n else '\n')
+                    f.write(json.dumps(entry, ensure_ascii=False))
+                f.write('\n]')
+            os.replace(tmp_path, self.path)
+
+    def _save_in_background(self):
+        try:
+            self.save()
+        except OSError:
+            pass  # 写盘失败不影响内存中的缓存，下一次写回或退出时再试
+        finally:
+            with self._lock:
+                self._saving = False
+
+    def _load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return
+        now = time.time()
+        for key, stored_at, result in snapshot[-self.max_entries:]:
+            if now - stored_at <= self.ttl_seconds:
+                self._entries[key] = (stored_at, result)
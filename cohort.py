@@ -0,0 +1,129 @@
+import math
+import time
+
+import numpy as np
+
+from sampling import TruncatedNormal
+from simulation import CHUNK_SIZE, EXAM_CONFIG, INTERVIEW_MAX, INTERVIEW_MIN, NUM_SIMULATIONS, SimulationCancelled, formula_weights
+
+# ==============================================================================
+# 大规模模式：成百上千人参加笔试，按笔试成绩取前 interview_seats 名进面，再按总分取前
+# promotion_slots 名上岸。只有笔试排在你前面的人数、以及和你同场面试的人的成绩会影响结果，
+# 因此每轮模拟只需 O(面试席位) 的计算，与总人数无关：
+#   1. 笔试成绩高于你的人数服从二项分布，可精确算出笔试排名分布与进面概率；
+#   2. 在"进面"条件下抽取该人数，高于你的人按截断正态抽样，低于你的人只取最高的若干名，
+#      用均匀分布顺序统计量的乘积表示 U_(n) = V1^(1/n)、U_(n-1) = U_(n)·V2^(1/(n-1))……
+#      再经逆 CDF 映射为笔试成绩，无需生成和排序全部考生；
+#   3. 进面者抽面试成绩，统计总分高于你的人数得到最终排名。
+# ==============================================================================
+INTERVIEW_RATIO = 3  # 默认按 1:3 比例进面
+MAX_CANDIDATES = 1000000
+# 单次耗时约与 模拟次数 × 进面人数 成正比（约 0.2 微秒/元素）：进面人数设上限，
+# 模拟次数再按元素预算缩减，单次调用约 1 秒内完成，不会长时间占住共享工作池
+MAX_INTERVIEW_SEATS = 2000
+MAX_SIMULATED_ELEMENTS = 5000000
+# 每块处理的 (模拟次数 × 同场面试人数) 元素上限，限制内存
+CHUNK_ELEMENTS = 250000
+
+
+def check_cohort(exam_type, total_candidates, promotion_slots, interview_seats):
+    if exam_type not in EXAM_CONFIG:
+        raise ValueError(f"未知的考试类型：{exam_type}")
+    if not (2 <= total_candidates <= MAX_CANDIDATES and 1 <= promotion_slots < interview_seats <= total_candidates):
+        raise ValueError(f"输入无效！需满足 上岸人数 < 进面人数 ≤ 总报考人数 ≤ {MAX_CANDIDATES}。")
+    if interview_seats > MAX_INTERVIEW_SEATS:
+        raise ValueError(f"进面人数最多 {MAX_INTERVIEW_SEATS} 人。")
+
+
+def _binomial_pmf(n, p):
+    # 二项分布概率表，对数域递推，避免大 n 时溢出
+    pmf = np.zeros(n + 1)
+    if p <= 0:
+        pmf[0] = 1.0
+        return pmf
+    if p >= 1:
+        pmf[n] = 1.0
+        return pmf
+    k = np.arange(n)
+    log_ratio = np.log(n - k) - np.log(k + 1) + math.log(p / (1 - p))
+    log_pmf = n * math.log1p(-p) + np.concatenate(([0.0], np.cumsum(log_ratio)))
+    pmf = np.exp(log_pmf - log_pmf.max())
+    return pmf / pmf.sum()
+
+
+def simulate_cohort(exam_type, total_candidates, promotion_slots, user_written, user_interview, interview_seats=None, num_simulations=NUM_SIMULATIONS, seed=None, should_stop=None):
+    """两阶段（笔试 → 面试）大规模模拟。
+
+    笔试成绩为 [0, 满分] 上的截断正态，interview_seats 默认为 promotion_slots × INTERVIEW_RATIO（不超过 MAX_INTERVIEW_SEATS）。
+    num_simulations × (interview_seats - 1) 超过 MAX_SIMULATED_ELEMENTS 时按预算减少模拟次数，实际次数见返回值。
+    每块开始前检查 should_stop()，返回真则抛出 SimulationCancelled。
+    返回 dict：interview_probability（精确）、promotion_probability 及其 std_error、
+    promotion_given_interview、written_rank_pmf（第 j 项为笔试排名 j+1 的概率，精确）、
+    final_rank_pmf（第 r 项为进面且最终排名 r+1 的概率）以及各阶段耗时 timings。
+    """
+    config = EXAM_CONFIG[exam_type]
+    interview_seats = interview_seats or min(total_candidates, promotion_slots * INTERVIEW_RATIO, MAX_INTERVIEW_SEATS)
+    check_cohort(exam_type, total_candidates, promotion_slots, interview_seats)
+    started_at = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    a, b, c = formula_weights(config['score_formula'])
+    user_total_score = config['score_formula'](user_written, user_interview)
+    num_opponents, others = total_candidates - 1, interview_seats - 1
+    num_simulations = min(num_simulations, max(1, MAX_SIMULATED_ELEMENTS // max(others, 1)))
+    mu, sigma, written_max = config['written_mu'], config['written_sigma'], config['written_max']
+
+    # 第一阶段：笔试排名分布是精确的
+    above_probability = TruncatedNormal(mu, sigma, 0, written_max).sf(user_written)
+    written_rank_pmf = _binomial_pmf(num_opponents, above_probability)
+    interview_probability = float(min(1.0, written_rank_pmf[:interview_seats].sum()))
+    above = TruncatedNormal(mu, sigma, user_written, written_max) if above_probability > 0 else None
+    below = TruncatedNormal(mu, sigma, 0, min(user_written, written_max)) if above_probability < 1 else None
+    interview_dist = TruncatedNormal(config['interview_mu'], config['interview_sigma'], INTERVIEW_MIN, INTERVIEW_MAX)
+    timings = {'scoring': time.perf_counter() - started_at, 'sampling': 0.0}
+
+    # 第二阶段：只在"进面"条件下模拟，每轮都有效；无条件概率再乘以进面概率
+    rank_counts = np.zeros(interview_seats, dtype=np.int64)
+    if interview_probability > 0 and num_simulations > 0:
+        k_weights = written_rank_pmf[:interview_seats] / written_rank_pmf[:interview_seats].sum()
+        # 同时不超过 CHUNK_SIZE 行，保证 should_stop 在运行中途也会被检查
+        rows_per_chunk = max(1, min(CHUNK_SIZE, CHUNK_ELEMENTS // max(others, 1)))
+        cols = np.arange(others)
+        for start in range(0, num_simulations, rows_per_chunk):
+            if should_stop is not None and should_stop():
+                raise SimulationCancelled()
+            rows = min(rows_per_chunk, num_simulations - start)
+            sampled_at = time.perf_counter()
+            k = rng.choice(interview_seats, size=rows, p=k_weights)[:, None]  # 笔试高于你的人数
+            written = np.empty((rows, others))
+            if above is not None:
+                above.sample(rng, written)
+            if below is not None:
+                # 低于你的 n 人中最高的若干名：顺序统计量的对数累加，按每轮的 k 平移到对应列
+                log_u = np.cumsum(np.log1p(-rng.random((rows, others))) / np.maximum(num_opponents - k - cols, 1), axis=1)
+                top = below.ppf(np.exp(log_u))
+                below_written = np.take_along_axis(top, np.clip(cols - k, 0, max(others - 1, 0)), axis=1)
+                np.copyto(written, below_written, where=cols >= k)
+            interview = interview_dist.sample(rng, np.empty((rows, others)))
+            scored_at = time.perf_counter()
+            totals = written * a
+            totals += b * interview
+            totals += c
+            rank = np.count_nonzero(totals > user_total_score, axis=1)
+            rank_counts += np.bincount(rank, minlength=interview_seats)
+            timings['sampling'] += scored_at - sampled_at
+            timings['scoring'] += time.perf_counter() - scored_at
+
+    given_interview = rank_counts / num_simulations if num_simulations else np.zeros(interview_seats)
+    promotion_given_interview = float(given_interview[:promotion_slots].sum())
+    return {
+        'total_candidates': total_candidates,
+        'interview_seats': interview_seats,
+        'num_simulations': num_simulations,
+        'interview_probability': interview_probability,
+        'promotion_probability': interview_probability * promotion_given_interview,
+        'promotion_given_interview': promotion_given_interview,
+        'std_error': interview_probability * math.sqrt(promotion_given_interview * (1 - promotion_given_interview) / num_simulations) if num_simulations else 0.0,
+        'written_rank_pmf': written_rank_pmf.tolist(),
+        'final_rank_pmf': (given_interview * interview_probability).tolist(),
+        'timings': timings,
+    }
@@ -0,0 +1,62 @@
+import collections
+import json
+import logging
+import os
+import threading
+
+# ==============================================================================
+# 运行时指标：各阶段耗时（sampling / scoring / rendering 等）、模拟次数与请求计数。
+# 设置环境变量 LADAI_METRICS_LOG=1 时，每个请求额外输出一行 JSON 结构化日志（logger: ladai.metrics）
+# ==============================================================================
+logger = logging.getLogger('ladai.metrics')
+
+
+def _enable_log():
+    # 仓库与 uvicorn 都不会配置这个 logger：设为 INFO，且没有任何可用的处理器时输出到标准错误，
+    # 已通过 logging.basicConfig 等配置了处理器时沿用现有配置，避免重复输出
+    logger.setLevel(logging.INFO)
+    if not logger.hasHandlers():
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+
+
+class Metrics:
+    """线程安全的指标汇总，每个阶段保留最近 samples 个耗时用于计算分位数。"""
+
+    def __init__(self, samples=1000, log=None):
+        self.log = log if log is not None else bool(os.environ.get('LADAI_METRICS_LOG'))
+        if self.log:
+            _enable_log()
+        self._samples = samples
+        self._lock = threading.Lock()
+        self._stages = collections.defaultdict(lambda: {'count': 0, 'total': 0.0, 'max': 0.0, 'recent': collections.deque(maxlen=self._samples)})
+        self._counters = collections.Counter()
+
+    def observe(self, timings, **counters):
+        """记录一次请求：timings 为 {阶段: 秒}，counters 为需要累加的计数（如 simulations=10000）。"""
+        with self._lock:
+            for stage, seconds in timings.items():
+                entry = self._stages[stage]
+                entry['count'] += 1
+                entry['total'] += seconds
+                entry['max'] = max(entry['max'], seconds)
+                entry['recent'].append(seconds)
+            self._counters['requests'] += 1
+            self._counters.update(counters)
+        if self.log:
+            logger.info(json.dumps({'event': 'simulation', 'timings': timings, **counters}, ensure_ascii=False))
+
+    def snapshot(self):
+        with self._lock:
+            stages = {}
+            for stage, entry in self._stages.items():
+                recent = sorted(entry['recent'])
+                stages[stage] = {
+                    'count': entry['count'],
+                    'mean': entry['total'] / entry['count'],
+                    'p50': recent[len(recent) // 2],
+                    'p99': recent[min(len(recent) - 1, int(len(recent) * 0.99))],
+                    'max': entry['max'],
+                }
+            return {'stages': stages, 'counters': dict(self._counters)}
@@ -0,0 +1,113 @@
+import math
+
+import numpy as np
+
+# ==============================================================================
+# 截断正态抽样：逆 CDF 一次成型，无拒绝采样，结果直接写入调用方预分配的数组
+# ==============================================================================
+_erfc = np.frompyfunc(math.erfc, 1, 1)
+
+# Acklam 有理逼近的系数：中段误差约 1e-9，两侧尾段约 1e-5（换算到分数不足 0.001 分）
+_PPF_A = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02, 1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+_PPF_B = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02, 6.680131188771972e+01, -1.328068155288572e+01)
+_PPF_C = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00, -2.549671010739305e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+_PPF_D = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00, 3.754408661907416e+00)
+_PPF_LOW = 0.02425
+
+
+def norm_cdf(x):
+    """标准正态分布函数，支持标量与数组。"""
+    return 0.5 * np.asarray(_erfc(-np.asarray(x, dtype=float) / math.sqrt(2)), dtype=float)
+
+
+def norm_pdf(x):
+    return np.exp(-0.5 * np.square(x)) / math.sqrt(2 * math.pi)
+
+
+def _polyval(coeffs, x):
+    result = np.full_like(x, coeffs[0])
+    for c in coeffs[1:]:
+        result *= x
+        result += c
+    return result
+
+
+def norm_ppf(p, out=None):
+    """标准正态分位数函数（向量化），p 取值应在 (0, 1) 内。"""
+    p = np.asarray(p, dtype=float)
+    if out is None:
+        out = np.empty_like(p)
+    lower = p < _PPF_LOW
+    upper = p > 1 - _PPF_LOW
+    central = ~(lower | upper)
+    q = p[central] - 0.5
+    r = q * q
+    out[central] = _polyval(_PPF_A, r) * q / (_polyval(_PPF_B, r) * r + 1)
+    for mask, sign, tail in ((lower, 1.0, p[lower]), (upper, -1.0, 1 - p[upper])):
+        if tail.size:
+            q = np.sqrt(-2 * np.log(tail))
+            out[mask] = sign * _polyval(_PPF_C, q) / (_polyval(_PPF_D, q) * q + 1)
+    return out
+
+
+class TruncatedNormal:
+    """[low, high] 上截断的正态分布 N(mu, sigma²)。
+
+    抽样用逆 CDF：在 [Φ(a), Φ(b)] 上取均匀数再求分位数，每个样本恰好一次计算。
+    下界在均值右侧时按对称性换到左尾计算，避免 Φ 接近 1 时精度丢失。
+    """
+
+    def __init__(self, mu, sigma, low, high):
+        if not sigma > 0:
+            raise ValueError("标准差必须为正数。")
+        if not low < high:
+            raise ValueError(f"截断区间无效：[{low}, {high}]。")
+        self.mu, self.sigma, self.low, self.high = float(mu), float(sigma), float(low), float(high)
+        a, b = (self.low - self.mu) / self.sigma, (self.high - self.mu) / self.sigma
+        self._b = b
+        self._flip = a > 0
+        if self._flip:
+            a, b = -b, -a
+        self._cdf_low = float(norm_cdf(a))
+        self._cdf_span = float(norm_cdf(b)) - self._cdf_low
+        # N(mu, sigma²) 落在 [low, high] 内的概率，即截断分布的归一化常数
+        self.mass = max(self._cdf_span, 0.0)
+
+    def sf(self, x):
+        """P(X > x)，x 为标量或数组。
+
+        分子取 [x, high] 内的正态质量，x 在均值右侧时同样用 Φ(-z) - Φ(-b) 计算，远尾也不丢精度。
+        """
+        x = np.clip(np.asarray(x, dtype=float), self.low, self.high)
+        if self._cdf_span <= 0:
+            # 退化情形：全部概率质量贴在靠近均值的边界上
+            result = (x <= self.low) if self._flip else (x < self.high)
+        else:
+            z = (x - self.mu) / self.sigma
+            upper = np.where(z > 0, norm_cdf(-z) - norm_cdf(-self._b), norm_cdf(self._b) - norm_cdf(z))
+            result = np.clip(upper / self._cdf_span, 0.0, 1.0)
+        return float(result) if result.ndim == 0 else result.astype(float)
+
+    def ppf(self, u, out=None):
+        """把 [0, 1] 上的 u 映射为截断正态的分位数，可原地写入 out。"""
+        u = np.asarray(u, dtype=float)
+        if out is None:
+            out = np.empty_like(u)
+        if self._cdf_span <= 0:
+            # 截断区间位于极远尾部，概率质量在双精度下为 0，退化为贴近均值的边界
+            out[...] = self.low if self._flip else self.high
+            return out
+        np.multiply(u, self._cdf_span, out=out)
+        out += self._cdf_low
+        np.clip(out, np.nextafter(0, 1), np.nextafter(1, 0), out=out)
+        norm_ppf(out, out=out)
+        if self._flip:
+            np.negative(out, out=out)
+        out *= self.sigma
+        out += self.mu
+        return np.clip(out, self.low, self.high, out=out)
+
+    def sample(self, rng, out):
+        """用 np.random.Generator 抽样，填满 float64 数组 out 并返回。"""
+        rng.random(out=out)
+        return self.ppf(out, out=out)
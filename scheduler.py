@@ -0,0 +1,54 @@
+import asyncio
+import itertools
+import threading
+
+# ==============================================================================
+# 按会话"只保留最新"的调度：短时间内的连续触发（拖动滑块、对手1锁定引起的级联更新）
+# 只计算最后一次，被取代的请求在防抖等待结束或模拟的块边界处放弃
+# ==============================================================================
+DEBOUNCE_SECONDS = 0.15
+
+
+class LatestWinsScheduler:
+    """每个会话只有最近一次 begin() 得到的令牌是有效的。
+
+    令牌来自全局递增计数器，会话条目在最新请求结束时删除，旧令牌不会与新令牌混淆。
+    is_current 可在工作线程中调用。
+    """
+
+    def __init__(self, debounce_seconds=DEBOUNCE_SECONDS):
+        self.debounce_seconds = debounce_seconds
+        self.superseded = 0
+        self._counter = itertools.count(1)
+        self._latest = {}  # 会话 -> 最新令牌编号
+        self._lock = threading.Lock()
+
+    def begin(self, session):
+        with self._lock:
+            token = (session, next(self._counter))
+            self._latest[session] = token[1]
+            return token
+
+    def is_current(self, token):
+        session, number = token
+        with self._lock:
+            return self._latest.get(session) == number
+
+    async def settle(self, token):
+        """防抖等待，期间若被同一会话的新请求取代则返回 False。"""
+        await asyncio.sleep(self.debounce_seconds)
+        if self.is_current(token):
+            return True
+        self.discard(token)
+        return False
+
+    def discard(self, token):
+        # 被取代的请求计数，供观察浪费了多少次计算
+        with self._lock:
+            self.superseded += 1
+
+    def finish(self, token):
+        session, number = token
+        with self._lock:
+            if self._latest.get(session) == number:
+                del self._latest[session]
@@ -0,0 +1,285 @@
+import functools
+import math
+import time
+
+import numpy as np
+
+from sampling import TruncatedNormal, norm_pdf
+
+# ==============================================================================
+# 模拟引擎：与界面无关，按块一次性构建 (对手数 × 模拟次数) 的分数矩阵
+# ==============================================================================
+EXAM_CONFIG = {
+    '事业单位': { 'written_max': 300, 'written_mu': 160.0, 'written_sigma': 25.80, 'interview_mu': 74.0, 'interview_sigma': 4.86, 'score_formula': lambda w, i: w / 3.0 + i },
+    '公务员': { 'written_max': 200, 'written_mu': 134.0, 'written_sigma': 6.47, 'interview_mu': 74.0, 'interview_sigma': 4.78, 'score_formula': lambda w, i: w / 2.0 + i }
+}
+INTERVIEW_MIN, INTERVIEW_MAX = 60, 100
+NUM_SIMULATIONS = 10000
+# 每块最多处理的模拟行数：NUM_SIMULATIONS 调大到 1e6 时内存也保持有界；
+# 也是 should_stop 的检查粒度，须明显小于 NUM_SIMULATIONS，被取代的固定次数模拟才能中途停止
+CHUNK_SIZE = 2000
+# 'exact'：数值积分 + 泊松二项分布；'adaptive'：标准误达标即停的蒙特卡洛；'fixed'：固定 NUM_SIMULATIONS 次
+SIMULATION_MODE = 'exact'
+TARGET_STD_ERROR = 0.002
+MIN_ADAPTIVE_SIMULATIONS = 2000
+MAX_ADAPTIVE_SIMULATIONS = 1000000
+EXACT_QUADRATURE_NODES = 32
+EXACT_QUADRATURE_PANELS = 8
+
+
+class SimulationCancelled(Exception):
+    """模拟在块边界被 should_stop 取消。"""
+
+
+def check_scenario(exam_type, total_participants, promotion_slots):
+    if exam_type not in EXAM_CONFIG:
+        raise ValueError(f"未知的考试类型：{exam_type}")
+    if not (2 <= total_participants <= 9 and 1 <= promotion_slots < total_participants):
+        raise ValueError("输入无效！请检查总人数(2-9)和晋级人数(需小于总人数)。")
+
+
+def build_opponents(total_participants, opponents_scores, written_cutoff, user_written):
+    """把界面上的对手输入整理成 [{'written', 'interview'}]，未知成绩记为 None。
+
+    若你的笔试成绩不等于进面分，则进面分必然属于某个对手，固定为对手1的笔试成绩。
+    返回 (对手列表, 对手1是否被锁定为进面分)。
+    """
+    opponents = []
+    for i in range(0, (total_participants - 1) * 2, 2):
+        written_score = opponents_scores[i] if opponents_scores[i] and opponents_scores[i] > 0 else None
+        interview_score = opponents_scores[i+1] if opponents_scores[i+1] and opponents_scores[i+1] > 0 else None
+        opponents.append({'written': written_score, 'interview': interview_score})
+    highlight_opp1 = False
+    if total_participants > 1 and user_written != written_cutoff:
+        opponents[0]['written'] = written_cutoff
+        highlight_opp1 = True
+    return opponents, highlight_opp1
+
+
+def _score_distributions(config, written_cutoff):
+    return (TruncatedNormal(config['written_mu'], config['written_sigma'], written_cutoff, config['written_max']),
+            TruncatedNormal(config['interview_mu'], config['interview_sigma'], INTERVIEW_MIN, INTERVIEW_MAX))
+
+
+def _fill_rows(block, known, distribution, rng, scratch):
+    # 已知成绩广播到整行；未知成绩的各行合并为一次逆 CDF 调用，块较小时也不会被逐行调用的固定开销拖慢。
+    # 未知行不连续（或 block 不是连续内存）时先抽样到一维缓冲区 scratch 的前端再拷回，不在每块新分配数组
+    unknown = [j for j, v in enumerate(known) if v is None]
+    for j, v in enumerate(known):
+        if v is not None:
+            block[j] = v
+    if len(unknown) == len(known) and block.flags.c_contiguous:
+        distribution.sample(rng, block)
+    elif unknown:
+        block[unknown] = distribution.sample(rng, scratch[:len(unknown) * block.shape[1]].reshape(len(unknown), block.shape[1]))
+
+
+def _iter_chunks(config, opponents, written_cutoff, user_total_score, promotion_slots, chunk_sizes, rng, should_stop, timings):
+    # 按块生成 (对手数 × 行数) 的分数矩阵，每块产出 (行数, 上岸次数, 笔试矩阵, 面试矩阵, 总分矩阵)。
+    # 缓冲区按需增长、最多 CHUNK_SIZE 列，各块复用，产出的矩阵在下一块开始前有效。
+    # 每块开始前调用 should_stop()，返回真则抛出 SimulationCancelled；抽样与计分耗时累加到 timings
+    a, b, c = formula_weights(config['score_formula'])
+    num_opponents = len(opponents)
+    written_known = [o['written'] for o in opponents]
+    interview_known = [o['interview'] for o in opponents]
+    written_dist, interview_dist = _score_distributions(config, written_cutoff)
+    capacity = 0
+    for rows in chunk_sizes:
+        if should_stop is not None and should_stop():
+            raise SimulationCancelled()
+        if rows > capacity:
+            capacity = rows
+            written_buf, interview_buf, totals_buf = (np.empty((num_opponents, capacity)) for _ in range(3))
+            scratch = np.empty(num_opponents * capacity)
+        written, interview, totals = written_buf[:, :rows], interview_buf[:, :rows], totals_buf[:, :rows]
+        started_at = time.perf_counter()
+        _fill_rows(written, written_known, written_dist, rng, scratch)
+        _fill_rows(interview, interview_known, interview_dist, rng, scratch)
+        sampled_at = time.perf_counter()
+        np.multiply(written, a, out=totals)
+        totals += b * interview
+        totals += c
+        beaten_by = np.count_nonzero(totals > user_total_score, axis=0)
+        promoted = int(np.count_nonzero(beaten_by < promotion_slots))
+        timings['sampling'] = timings.get('sampling', 0.0) + sampled_at - started_at
+        timings['scoring'] = timings.get('scoring', 0.0) + time.perf_counter() - sampled_at
+        yield rows, promoted, written, interview, totals
+
+
+def _last_run_details(user_written, user_interview, user_total_score, written, interview, totals):
+    details = {'user': {'written': user_written, 'interview': user_interview, 'total': user_total_score}}
+    for j in range(written.shape[0]):
+        details[f'opponent_{j+1}'] = {'written': float(written[j, -1]), 'interview': float(interview[j, -1]), 'total': float(totals[j, -1])}
+    return details
+
+
+def _wilson_interval(successes, n, z=1.959964):
+    if n == 0:
+        return 0.0, 1.0
+    p = successes / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def _monte_carlo_result(promotion_count, num_simulations, last_run_details, mode, timings):
+    probability = promotion_count / num_simulations if num_simulations else 0.0
+    return {
+        'mode': mode,
+        'promotion_count': promotion_count,
+        'num_simulations': num_simulations,
+        'probability': probability,
+        'std_error': math.sqrt(probability * (1 - probability) / num_simulations) if num_simulations else 0.0,
+        'interval': _wilson_interval(promotion_count, num_simulations),
+        'last_run_details': last_run_details,
+        'timings': timings,
+    }
+
+
+def simulate(exam_type, opponents, written_cutoff, user_written, user_interview, promotion_slots, num_simulations=NUM_SIMULATIONS, rng=None, should_stop=None):
+    """向量化蒙特卡洛：统计成绩严格高于你的对手少于 promotion_slots 人的比例。
+
+    返回 dict：promotion_count、num_simulations、probability、std_error、interval（95% Wilson 区间）、
+    取自分数矩阵最后一列（最后一轮）的 last_run_details（供界面展示"该轮模拟"的排名表），
+    以及各阶段耗时 timings（秒）。
+    """
+    config = EXAM_CONFIG[exam_type]
+    rng = rng if rng is not None else np.random.default_rng()
+    user_total_score = config['score_formula'](user_written, user_interview)
+    chunk_sizes = [min(CHUNK_SIZE, num_simulations - start) for start in range(0, num_simulations, CHUNK_SIZE)]
+    promotion_count = 0
+    last_run_details, timings = {}, {}
+    for _, promoted, written, interview, totals in _iter_chunks(config, opponents, written_cutoff, user_total_score, promotion_slots, chunk_sizes, rng, should_stop, timings):
+        promotion_count += promoted
+        last_run_details = _last_run_details(user_written, user_interview, user_total_score, written, interview, totals)
+    return _monte_carlo_result(promotion_count, num_simulations, last_run_details, 'fixed', timings)
+
+
+def simulate_adaptive(exam_type, opponents, written_cutoff, user_written, user_interview, promotion_slots, target_std_error=TARGET_STD_ERROR, min_simulations=MIN_ADAPTIVE_SIMULATIONS, max_simulations=MAX_ADAPTIVE_SIMULATIONS, rng=None, should_stop=None):
+    """自适应蒙特卡洛：累计次数达到 min_simulations 时检查标准误，之后每翻一倍再检查，降到 target_std_error 以下即停止。
+
+    抽样按 CHUNK_SIZE 行分块（should_stop 的检查粒度），与标准误的检查点相互独立。
+    停止判断使用 (x+2)/(n+4) 修正后的比例，避免概率为 0% 或 100% 时标准误恰好为 0 而过早停止。
+    """
+    config = EXAM_CONFIG[exam_type]
+    rng = rng if rng is not None else np.random.default_rng()
+    user_total_score = config['score_formula'](user_written, user_interview)
+    chunk_sizes = (min(CHUNK_SIZE, max_simulations - start) for start in range(0, max_simulations, CHUNK_SIZE))
+    promotion_count = num_simulations = 0
+    next_check = min_simulations
+    last_run_details, timings = {}, {}
+    for rows, promoted, written, interview, totals in _iter_chunks(config, opponents, written_cutoff, user_total_score, promotion_slots, chunk_sizes, rng, should_stop, timings):
+        promotion_count += promoted
+        num_simulations += rows
+        last_run_details = _last_run_details(user_written, user_interview, user_total_score, written, interview, totals)
+        if num_simulations < next_check:
+            continue
+        next_check = 2 * num_simulations
+        adjusted = (promotion_count + 2) / (num_simulations + 4)
+        if math.sqrt(adjusted * (1 - adjusted) / num_simulations) <= target_std_error:
+            break
+    return _monte_carlo_result(promotion_count, num_simulations, last_run_details, 'adaptive', timings)
+
+
+# ==============================================================================
+# 精确模式：总分是笔试、面试的线性组合，每个对手超过你的概率可用一维数值积分得到，
+# 对手之间相互独立，"超过你的人数"服从泊松二项分布
+# ==============================================================================
+@functools.lru_cache(maxsize=None)
+def _gauss_legendre(n):
+    return np.polynomial.legendre.leggauss(n)
+
+
+def formula_weights(formula):
+    # score_formula 要求是线性的：total = a * written + b * interview + c
+    c = formula(0.0, 0.0)
+    return formula(1.0, 0.0) - c, formula(0.0, 1.0) - c, c
+
+
+def _beat_probability(config, opponent, written_cutoff, user_total_score):
+    # 单个对手总分严格高于你的概率
+    a, b, c = formula_weights(config['score_formula'])
+    w, i = opponent['written'], opponent['interview']
+    written_dist, interview_dist = _score_distributions(config, written_cutoff)
+    if w is not None and i is not None:
+        return 1.0 if config['score_formula'](w, i) > user_total_score else 0.0
+    if w is not None:
+        return interview_dist.sf((user_total_score - c - a * w) / b)
+    if i is not None:
+        return written_dist.sf((user_total_score - c - b * i) / a)
+    # 笔试、面试都未知：对笔试截断正态密度做分段高斯-勒让德积分
+    # 进面分远高于均值时归一化常数极小，mass 按对称性计算，避免 Φ(b) - Φ(a) 的相消误差
+    mu, sigma = written_dist.mu, written_dist.sigma
+    low, high = max(written_dist.low, mu - 12 * sigma), min(written_dist.high, mu + 12 * sigma)
+    if low >= high:
+        return written_dist.sf((user_total_score - c - b * interview_dist.mu) / a)
+    nodes, weights = _gauss_legendre(EXACT_QUADRATURE_NODES)
+    edges = np.linspace(low, high, EXACT_QUADRATURE_PANELS + 1)
+    half = np.diff(edges)[:, None] / 2
+    xs = (edges[:-1, None] + half + half * nodes).ravel()
+    ws = (half * weights).ravel()
+    density = norm_pdf((xs - mu) / sigma) / sigma
+    return float(np.dot(ws, density * interview_dist.sf((user_total_score - c - a * xs) / b)) / written_dist.mass)
+
+
+def compute_exact(exam_type, opponents, written_cutoff, user_written, user_interview, promotion_slots):
+    """精确计算上岸概率（无抽样），返回与 simulate 相同结构的 dict，其中 std_error 为 0。"""
+    started_at = time.perf_counter()
+    config = EXAM_CONFIG[exam_type]
+    user_total_score = config['score_formula'](user_written, user_interview)
+    # 泊松二项分布：beaten[k] 为恰有 k 个对手超过你的概率
+    beaten = np.zeros(len(opponents) + 1)
+    beaten[0] = 1.0
+    # 成绩未知的对手同分布，相同输入只算一次
+    cache = {}
+    for k, opponent in enumerate(opponents, 1):
+        key = (opponent['written'], opponent['interview'])
+        if key not in cache:
+            cache[key] = _beat_probability(config, opponent, written_cutoff, user_total_score)
+        p = cache[key]
+        if not math.isfinite(p):
+            raise ValueError("精确计算出现数值异常，请改用蒙特卡洛模式。")
+        beaten[1:k + 1] = beaten[1:k + 1] * (1 - p) + beaten[:k] * p
+        beaten[0] *= 1 - p
+    probability = float(beaten[:promotion_slots].sum())
+    if not math.isfinite(probability):
+        raise ValueError("精确计算出现数值异常，请改用蒙特卡洛模式。")
+    # 只截掉舍入误差带来的微小越界
+    probability = min(1.0, max(0.0, probability))
+    return {
+        'mode': 'exact',
+        'promotion_count': None,
+        'num_simulations': 0,
+        'probability': probability,
+        'std_error': 0.0,
+        'interval': (probability, probability),
+        'last_run_details': {},
+        'timings': {'scoring': time.perf_counter() - started_at},
+    }
+
+
+def estimate(exam_type, opponents, written_cutoff, user_written, user_interview, promotion_slots, mode=SIMULATION_MODE, seed=None, should_stop=None, with_details=True):
+    """按 mode（'exact' / 'adaptive' / 'fixed'）计算上岸概率。
+
+    每次调用使用独立的 np.random.Generator，传入 seed 可复现同一场景的抽样结果。
+    蒙特卡洛模式在每块之间检查 should_stop()，被取代的请求会以 SimulationCancelled 提前结束。
+    精确模式没有抽样，with_details 为真时额外模拟一轮用于填充 last_run_details。
+    """
+    config = EXAM_CONFIG[exam_type]
+    if any(o['written'] is None for o in opponents) and not written_cutoff < config['written_max']:
+        raise ValueError("笔试进面分数需低于笔试满分。")
+    args = (exam_type, opponents, written_cutoff, user_written, user_interview, promotion_slots)
+    rng = np.random.default_rng(seed)
+    if mode == 'exact':
+        result = compute_exact(*args)
+        if with_details:
+            sample = simulate(*args, num_simulations=1, rng=rng)
+            result['last_run_details'] = sample['last_run_details']
+            result['timings']['sampling'] = sample['timings']['sampling']
+        return result
+    if mode == 'adaptive':
+        return simulate_adaptive(*args, rng=rng, should_stop=should_stop)
+    if mode == 'fixed':
+        return simulate(*args, rng=rng, should_stop=should_stop)
+    raise ValueError(f"未知的模拟模式：{mode}")
@@ -0,0 +1,76 @@
+import numpy as np
+
+import bench
+from cache import ResultCache, restore_order, scenario_key
+from cohort import simulate_cohort
+from sampling import TruncatedNormal
+from simulation import EXAM_CONFIG, INTERVIEW_MAX, INTERVIEW_MIN, estimate
+
+# ==============================================================================
+# 引擎回归检查：python -m pytest test_engines.py
+#   1. 精确模式与蒙特卡洛在常规和极端进面分下一致（同 bench.py --check-exact）；
+#   2. 大规模模式与"生成全部考生再排序"的暴力模拟一致；
+#   3. 结果缓存与对手顺序无关，restore_order 还原后每个对手仍对应自己的成绩。
+# ==============================================================================
+
+
+def test_exact_matches_monte_carlo():
+    assert bench.check_exact() == []
+
+
+def _brute_force_cohort(exam_type, total_candidates, promotion_slots, interview_seats, user_written, user_interview, num_simulations, seed):
+    # 每轮生成全部对手的笔试成绩，按笔试取前 interview_seats 名进面，再按总分排名
+    config = EXAM_CONFIG[exam_type]
+    rng = np.random.default_rng(seed)
+    written = TruncatedNormal(config['written_mu'], config['written_sigma'], 0, config['written_max']).sample(rng, np.empty((num_simulations, total_candidates - 1)))
+    above = np.count_nonzero(written > user_written, axis=1)
+    top = np.sort(written, axis=1)[:, -(interview_seats - 1):]
+    interview = TruncatedNormal(config['interview_mu'], config['interview_sigma'], INTERVIEW_MIN, INTERVIEW_MAX).sample(rng, np.empty(top.shape))
+    rank = np.count_nonzero(config['score_formula'](top, interview) > config['score_formula'](user_written, user_interview), axis=1)
+    interviewed = above < interview_seats
+    written_rank_pmf = np.bincount(above, minlength=total_candidates) / num_simulations
+    final_rank_pmf = np.bincount(rank[interviewed], minlength=interview_seats) / num_simulations
+    return written_rank_pmf, final_rank_pmf
+
+
+def test_cohort_matches_brute_force():
+    # 各排名概率的差异按两边的抽样标准误换算成 z 值，超过 4 视为不一致
+    num_simulations = 100000
+    args = dict(exam_type='公务员', total_candidates=40, promotion_slots=2, interview_seats=6, user_written=141.0, user_interview=76.0)
+    result = simulate_cohort(**args, num_simulations=num_simulations, seed=1)
+    written_rank_pmf, final_rank_pmf = _brute_force_cohort(**args, num_simulations=num_simulations, seed=2)
+    assert 0.1 < result['interview_probability'] < 0.9
+
+    exact_written = np.array(result['written_rank_pmf'][:6])
+    written_se = np.sqrt(exact_written * (1 - exact_written) / num_simulations)
+    assert np.all(np.abs(exact_written - written_rank_pmf[:6]) < 4 * written_se + 1e-4)
+
+    final = np.array(result['final_rank_pmf'])
+    final_se = np.sqrt((final * (1 - final) + final_rank_pmf * (1 - final_rank_pmf)) / num_simulations)
+    assert np.all(np.abs(final - final_rank_pmf) < 4 * final_se + 1e-4)
+
+
+def test_cache_key_ignores_opponent_order():
+    opponents = [{'written': 170.0, 'interview': None}, {'written': None, 'interview': None}, {'written': 165.0, 'interview': 80.0}, {'written': None, 'interview': 72.0}]
+    permuted = [opponents[i] for i in (2, 0, 3, 1)]
+    key, order = scenario_key('事业单位', 1, 150, 160, 75, opponents, 'fixed')
+    permuted_key, permuted_order = scenario_key('事业单位', 1, 150, 160, 75, permuted, 'fixed')
+    assert key == permuted_key
+
+    # 结果按规范顺序计算、缓存，再分别还原成两种调用方的编号
+    result = estimate('事业单位', [opponents[i] for i in order], 150, 160, 75, 1, mode='fixed', seed=0)
+    for caller_opponents, caller_order in ((opponents, order), (permuted, permuted_order)):
+        details = restore_order(result['last_run_details'], caller_order)
+        assert set(details) == {'user'} | {f'opponent_{j+1}' for j in range(len(caller_opponents))}
+        for j, opponent in enumerate(caller_opponents):
+            for field in ('written', 'interview'):
+                if opponent[field] is not None:
+                    assert details[f'opponent_{j+1}'][field] == opponent[field]
+
+
+def test_result_cache_persists(tmp_path):
+    path = str(tmp_path / 'cache.json')
+    cache = ResultCache(path=path)
+    cache.put('k', {'probability': 0.25, 'interval': [0.2, 0.3]})
+    cache.save()
+    assert ResultCache(path=path).get('k') == {'probability': 0.25, 'interval': [0.2, 0.3]}
@@ -0,0 +1,139 @@
+import asyncio
+import collections
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from simulation import SimulationCancelled
+
+# ==============================================================================
+# 模拟计算放到有界的线程/进程池中执行，事件循环只负责调度与渲染。
+# NumPy 的批量运算会释放 GIL，线程池即可用上多核；进程池适合纯 Python 开销较大的场景。
+# 环境变量：LADAI_EXECUTOR（thread / process）、LADAI_WORKERS、LADAI_MAX_PENDING、LADAI_ADMISSION_TIMEOUT
+# ==============================================================================
+# 池满时新任务最多等待的秒数：交互请求通常几毫秒就能排上，短暂高峰不应直接报"繁忙"；
+# 调大可减少拒绝但高峰时响应更慢，设为 0 则恢复为立即拒绝
+ADMISSION_TIMEOUT = 2.0
+
+
+class PoolSaturated(Exception):
+    """排队中的任务已达上限，拒绝新任务（背压）。"""
+
+
+def _timed_call(fn, args, kwargs):
+    # 在工作线程/进程中执行，返回开始时间供计算排队等待时长（monotonic 在同一主机的进程间可比）
+    started_at = time.monotonic()
+    return started_at, fn(*args, **kwargs)
+
+
+class SimulationPool:
+    """有界工作池：最多 workers 个任务并行，另有至多 max_pending - workers 个任务排队。
+
+    超过上限时 run() 按先来先到排队等待空位，至多 admission_timeout 秒，仍然满则抛出 PoolSaturated，
+    而不是无限堆积请求。空位由 asyncio.Semaphore 管理，同一个池只能在一个事件循环中使用。
+    """
+
+    def __init__(self, kind='thread', workers=None, max_pending=None, admission_timeout=ADMISSION_TIMEOUT, wait_samples=1000):
+        if kind not in ('thread', 'process'):
+            raise ValueError(f"未知的执行器类型：{kind}")
+        self.kind = kind
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 4
+        self.admission_timeout = admission_timeout
+        self.supports_cancellation = kind == 'thread'  # 进程池无法共享 should_stop 回调，只在排队时检查
+        executor_cls = ThreadPoolExecutor if kind == 'thread' else ProcessPoolExecutor
+        self._executor = executor_cls(max_workers=self.workers)
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._admitting = 0  # 池满时正在等待空位的任务数
+        self._completed = 0
+        self._rejected = 0
+        self._waits = collections.deque(maxlen=wait_samples)
+
+    @classmethod
+    def from_env(cls):
+        workers = os.environ.get('LADAI_WORKERS')
+        max_pending = os.environ.get('LADAI_MAX_PENDING')
+        admission_timeout = os.environ.get('LADAI_ADMISSION_TIMEOUT')
+        return cls(kind=os.environ.get('LADAI_EXECUTOR', 'thread'),
+                   workers=int(workers) if workers else None,
+                   max_pending=int(max_pending) if max_pending else None,
+                   admission_timeout=float(admission_timeout) if admission_timeout else ADMISSION_TIMEOUT)
+
+    async def _admit(self):
+        # Semaphore 按等待顺序唤醒；没有人排队且有空位时直接取得，不经过 wait_for
+        if not self._slots.locked():
+            await self._slots.acquire()
+            return
+        with self._lock:
+            self._admitting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.admission_timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._rejected += 1
+            raise PoolSaturated() from None
+        finally:
+            with self._lock:
+                self._admitting -= 1
+
+    async def run(self, fn, *args, should_stop=None, **kwargs):
+        """在池中执行 fn(*args, **kwargs) 并等待结果。
+
+        池已满时先来先到地等待至多 admission_timeout 秒，期间不占用事件循环；超时仍满则抛出 PoolSaturated。
+        等待空位的时间计入排队等待时长。
+        should_stop 在排队前后各检查一次：请求已被取代时不占用空位，直接抛出 SimulationCancelled；
+        线程池还会把它传给 fn，让计算在块边界处停止（进程池无法共享回调，不传）。
+        """
+        submitted_at = time.monotonic()
+        if should_stop is not None and should_stop():
+            raise SimulationCancelled()
+        await self._admit()
+        if should_stop is not None and should_stop():
+            self._slots.release()
+            raise SimulationCancelled()
+        if should_stop is not None and self.supports_cancellation:
+            kwargs['should_stop'] = should_stop
+        with self._lock:
+            self._pending += 1
+        try:
+            future = self._executor.submit(_timed_call, fn, args, kwargs)
+            started_at, result = await asyncio.wrap_future(future)
+        finally:
+            with self._lock:
+                self._pending -= 1
+            self._slots.release()
+        with self._lock:
+            self._completed += 1
+            self._waits.append(max(0.0, started_at - submitted_at))
+        return result
+
+    def stats(self):
+        """当前排队深度、等待空位的任务数、运行数与最近 wait_samples 个任务的排队等待时长（秒）。"""
+        with self._lock:
+            waits = sorted(self._waits)
+            running = min(self._pending, self.workers)
+            stats = {
+                'kind': self.kind,
+                'workers': self.workers,
+                'max_pending': self.max_pending,
+                'admission_timeout': self.admission_timeout,
+                'running': running,
+                'queue_depth': self._pending - running,
+                'waiting_for_slot': self._admitting,
+                'completed': self._completed,
+                'rejected': self._rejected,
+            }
+        if waits:
+            stats.update({
+                'wait_mean': sum(waits) / len(waits),
+                'wait_p50': waits[len(waits) // 2],
+                'wait_p99': waits[min(len(waits) - 1, int(len(waits) * 0.99))],
+                'wait_max': waits[-1],
+            })
+        return stats
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)